@@ -2,8 +2,9 @@
 from csv import Error
 import os
 import logging
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import multiprocessing
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Any, Optional
 from jgh_serialization import JghSerialization
 from dataclasses import dataclass
 from pydantic import BaseModel
@@ -105,7 +106,88 @@ def find_directory_that_contains_file(filename: Optional[str] = None, directory:
 
     return None
 
-def jgh_configure_logging(appSettingsFilename: Optional[str] = None)-> None:
+class HandleRecordInItsOwnLogger(logging.Handler):
+    """
+    Hands each record to the logger of this process that bears the record's name, so that
+    a record logged in a worker process is filtered and handled as if it had been logged
+    in this one.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if not logger.disabled:
+            logger.handle(record)
+
+
+# the queue and listener of jgh_start_logging_queue_listener(), if started
+logging_queue: Any = None
+logging_queue_listener: Optional[QueueListener] = None
+
+
+def jgh_start_logging_queue_listener() -> Any:
+    """
+    Starts a QueueListener on a thread of this process, feeding the records that worker
+    processes put on its queue to the loggers of this process. Returns the queue, which
+    must be handed to each worker process as it is created, for example in the initargs
+    of a ProcessPoolExecutor, and installed there with jgh_configure_worker_logging().
+    Idempotent: if a listener is already running, returns its queue.
+
+    While the listener runs, start worker processes by spawn, not fork: forking a process
+    in which other threads are running can deadlock the child. The queue is made in the
+    spawn context so that it can be handed to them, and it serves forked workers as well.
+    """
+    global logging_queue, logging_queue_listener
+
+    if logging_queue_listener is None:
+        logging_queue = multiprocessing.get_context("spawn").Queue(-1)
+        logging_queue_listener = QueueListener(logging_queue, HandleRecordInItsOwnLogger())
+        logging_queue_listener.start()
+
+    return logging_queue
+
+
+def jgh_stop_logging_queue_listener() -> None:
+    """
+    Stops the listener of jgh_start_logging_queue_listener(), after it has handled every
+    record already on the queue. Does nothing if there is no listener.
+    """
+    global logging_queue, logging_queue_listener
+
+    if logging_queue_listener is not None:
+        logging_queue_listener.stop()
+        logging_queue.close()
+        logging_queue_listener = None
+        logging_queue = None
+
+
+def jgh_get_logging_queue() -> Any:
+    """The queue of the running listener of jgh_start_logging_queue_listener(), or None."""
+    return logging_queue
+
+
+def jgh_configure_worker_logging(loggingQueue: Any) -> None:
+    """
+    Configures the root logger of a worker process to put every record on the given queue,
+    and nothing else, for the listener in the parent process to handle. Intended to be
+    called by the initializer of each worker. If the queue is None, the worker is left
+    as it is.
+    """
+    if loggingQueue is None:
+        return
+
+    logger = logging.getLogger()
+
+    for handler in logger.handlers:
+        handler.close()
+
+    logger.handlers.clear()
+
+    handler = QueueHandler(loggingQueue)
+    handler.set_name("queueHandler")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+
+def jgh_configure_logging(appSettingsFilename: Optional[str] = None, enableQueueListener: bool = False)-> None:
     """
     Configures the root logger in the logging system from an appsettings file. Intended 
     to be called as a one-time set-up function used at the start of an application
@@ -174,12 +256,20 @@ def jgh_configure_logging(appSettingsFilename: Optional[str] = None)-> None:
             will remain unconfigured and as such will fail to log 
             messages with a (low) severity of DEBUG and INFO. Only WARNING
             and higher severity messages will be logged.
+        enableQueueListener (bool): If True, also starts a listener for
+            records logged in worker processes, with
+            jgh_start_logging_queue_listener(). Workers log safely to it,
+            without interleaving, once they have called
+            jgh_configure_worker_logging() with jgh_get_logging_queue().
+            If False, any listener already running is stopped.
 
     Raises:
         Error: If there is an irrecoverable error during the configuration process.
     """
     logger = logging.getLogger() #get root logger
 
+    jgh_stop_logging_queue_listener()
+
     for handler in logger.handlers:
         handler.close()
 
@@ -187,6 +277,9 @@ def jgh_configure_logging(appSettingsFilename: Optional[str] = None)-> None:
 
     logging.basicConfig(level=logging.DEBUG) # this is the fallback config, we might or might not override it later
 
+    if enableQueueListener:
+        jgh_start_logging_queue_listener() # the listener forwards to the loggers, so it serves whatever handlers they end up with
+
     try:
         if appSettingsFilename is None:
             return
@@ -93,5 +93,50 @@ class TestConfigureLogger(unittest.TestCase):
         logger.critical(test_message_critical)
 
 
+def log_in_worker_process(loggingQueue) -> None:
+    from jgh_logging import jgh_configure_worker_logging
+    jgh_configure_worker_logging(loggingQueue)
+    logging.getLogger("jgh_worker").info("hello from a worker", extra={"payload": 42})
+
+
+class RecordCollector(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestLoggingQueueListener(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        jgh_configure_logging(None)
+
+    def test_records_logged_in_a_worker_reach_the_logger_of_the_same_name_in_the_parent(self) -> None:
+        import multiprocessing
+        from jgh_logging import jgh_get_logging_queue, jgh_stop_logging_queue_listener
+        jgh_configure_logging(None, enableQueueListener=True)
+        collector = RecordCollector()
+        logging.getLogger("jgh_worker").addHandler(collector)
+        try:
+            worker = multiprocessing.get_context("spawn").Process(target=log_in_worker_process, args=(jgh_get_logging_queue(),))
+            worker.start()
+            worker.join(30)
+            jgh_stop_logging_queue_listener()
+        finally:
+            logging.getLogger("jgh_worker").removeHandler(collector)
+        self.assertEqual([record.getMessage() for record in collector.records], ["hello from a worker"])
+        self.assertEqual(collector.records[0].payload, 42)
+        self.assertEqual(collector.records[0].process, worker.pid)
+
+    def test_reconfiguring_without_the_listener_stops_it(self) -> None:
+        from jgh_logging import jgh_get_logging_queue
+        jgh_configure_logging(None, enableQueueListener=True)
+        self.assertIsNotNone(jgh_get_logging_queue())
+        jgh_configure_logging(None)
+        self.assertIsNone(jgh_get_logging_queue())
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,49 @@
+from typing import List
+import pytest
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem
+from jgh_formulae02 import generate_pruned_paceline_rotation_sequences_in_chunks
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+# Made-up riders with plausible power curves, shared by the tests of the paceline solver.
+strong_rider = ZsunItem(zwift_id="1", name="strong", weight_kg=75.0, height_cm=180.0, zsun_one_hour_curve_coefficient=560.0, zsun_one_hour_curve_exponent=0.11, zsun_TTT_pull_curve_coefficient=540.0, zsun_TTT_pull_curve_exponent=0.105)
+medium_rider = ZsunItem(zwift_id="2", name="medium", weight_kg=70.0, height_cm=174.0, zsun_one_hour_curve_coefficient=545.0, zsun_one_hour_curve_exponent=0.1165, zsun_TTT_pull_curve_coefficient=525.0, zsun_TTT_pull_curve_exponent=0.111)
+weak_rider   = ZsunItem(zwift_id="3", name="weak", weight_kg=82.0, height_cm=170.0, zsun_one_hour_curve_coefficient=480.0, zsun_one_hour_curve_exponent=0.12, zsun_TTT_pull_curve_coefficient=470.0, zsun_TTT_pull_curve_exponent=0.115)
+heavy_rider  = ZsunItem(zwift_id="4", name="heavy", weight_kg=95.0, height_cm=188.0, zsun_one_hour_curve_coefficient=610.0, zsun_one_hour_curve_exponent=0.118, zsun_TTT_pull_curve_coefficient=590.0, zsun_TTT_pull_curve_exponent=0.112)
+light_rider  = ZsunItem(zwift_id="5", name="light", weight_kg=60.0, height_cm=165.0, zsun_one_hour_curve_coefficient=470.0, zsun_one_hour_curve_exponent=0.115, zsun_TTT_pull_curve_coefficient=455.0, zsun_TTT_pull_curve_exponent=0.11)
+
+
+@pytest.fixture
+def riders() -> List[ZsunItem]:
+    return [strong_rider, medium_rider, weak_rider]
+
+
+@pytest.fixture
+def four_riders() -> List[ZsunItem]:
+    return [strong_rider, medium_rider, weak_rider, heavy_rider]
+
+
+@pytest.fixture
+def five_riders() -> List[ZsunItem]:
+    return [strong_rider, medium_rider, weak_rider, heavy_rider, light_rider]
+
+
+@pytest.fixture
+def ingredients(riders: List[ZsunItem]) -> PacelineIngredientsItem:
+    return PacelineIngredientsItem(riders_list=riders, sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * len(riders), max_exertion_intensity_factor=0.95)
+
+
+@pytest.fixture
+def ingredients_of_four_riders(four_riders: List[ZsunItem]) -> PacelineIngredientsItem:
+    return PacelineIngredientsItem(riders_list=four_riders, sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * len(four_riders), max_exertion_intensity_factor=0.95)
+
+
+@pytest.fixture
+def ingredients_of_five_riders(five_riders: List[ZsunItem]) -> PacelineIngredientsItem:
+    return PacelineIngredientsItem(riders_list=five_riders, sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * len(five_riders), max_exertion_intensity_factor=0.95)
+
+
+@pytest.fixture(scope="session")
+def sequences() -> List[List[float]]:
+    # the pruned rotation sequences of riders(), made once, as no test changes them
+    return generate_pruned_paceline_rotation_sequences_in_chunks([strong_rider, medium_rider, weak_rider], STANDARD_PULL_PERIODS_SEC_AS_LIST).tolist()
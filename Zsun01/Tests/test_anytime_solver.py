@@ -0,0 +1,32 @@
+import numpy as np
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import order_paceline_rotation_sequences_by_promise, generate_package_of_paceline_solutions
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, calculate_speed_bracket_of_rotation_sequences
+from constants import ANYTIME_SOLVER_FIRST_BATCH_SIZE
+
+def test_sequences_are_ordered_by_their_pull_cap_bound_fastest_first(riders, ingredients, sequences):
+    order = order_paceline_rotation_sequences_by_promise(ingredients, sequences)
+    _, upper_kph = calculate_speed_bracket_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation(riders), np.array(sequences), 0.95)
+    assert sorted(order.tolist()) == list(range(len(sequences)))
+    assert np.all(np.diff(upper_kph[order]) <= 0)
+
+def test_no_time_leaves_all_but_the_first_batch_unevaluated(ingredients, sequences):
+    assert len(sequences) > ANYTIME_SOLVER_FIRST_BATCH_SIZE
+    package = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, time_budget_sec=0.0)
+    assert package.ran_out_of_time
+    assert package.total_pull_sequences_examined == ANYTIME_SOLVER_FIRST_BATCH_SIZE
+    assert package.total_pull_sequences_unevaluated == len(sequences) - ANYTIME_SOLVER_FIRST_BATCH_SIZE
+    table = package.solutions_table
+    assert np.count_nonzero(~np.isnan(table.rows["calculated_average_speed_of_paceline_kph"])) == ANYTIME_SOLVER_FIRST_BATCH_SIZE
+    assert np.array_equal(table.rows["rotation_sequence_index"], np.arange(len(sequences)))
+    assert package.hang_in_solution is not None
+
+def test_ample_time_gives_the_same_plans_as_no_budget(ingredients):
+    unbounded = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL)
+    bounded = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, time_budget_sec=3600.0)
+    assert not bounded.ran_out_of_time and bounded.total_pull_sequences_unevaluated == 0
+    assert bounded.total_pull_sequences_examined == unbounded.total_pull_sequences_examined
+    for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+        expected, actual = getattr(unbounded, name), getattr(bounded, name)
+        assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph, name
+        assert [c.p1_duration for c in actual.rider_contributions.values()] == [c.p1_duration for c in expected.rider_contributions.values()], name
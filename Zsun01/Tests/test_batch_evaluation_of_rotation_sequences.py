@@ -0,0 +1,42 @@
+import numpy as np
+from jgh_formulae08 import populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, evaluate_rotation_sequences_at_speed
+
+sequences = [
+    [30.0, 30.0, 30.0],
+    [300.0, 0.0, 60.0],
+    [0.0, 0.0, 0.0],
+    [2.0, 3.0, 0.0],    # shorter than one rolling window
+    [7.0, 1.0, 2.5],    # windows straddle more than one boundary
+    [120.0, 240.0, 180.0],
+]
+
+def test_batch_kernel_agrees_with_object_pipeline(riders):
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    for speed_kph in [32.0, 41.5, 47.0]:
+        batch = evaluate_rotation_sequences_at_speed(rider_arrays, np.array(sequences), speed_kph, 0.95)
+        for idx, sequence in enumerate(sequences):
+            _, contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, sequence, [speed_kph] * len(riders), 0.95)
+            for k, contribution in enumerate(contributions.values()):
+                assert np.isclose(batch.average_watts[idx, k], contribution.average_watts, rtol=1e-12, atol=1e-9)
+                assert np.isclose(batch.normalized_watts[idx, k], contribution.normalized_watts, rtol=1e-12, atol=1e-9)
+                assert np.isclose(batch.intensity_factor[idx, k], contribution.intensity_factor, rtol=1e-12, atol=1e-12)
+                assert bool(batch.effort_constraint_violations[idx, k]) == bool(contribution.effort_constraint_violation_reason)
+
+def test_batch_kernel_accepts_one_speed_per_sequence(riders):
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    speeds = np.array([35.0, 45.0])
+    batch = evaluate_rotation_sequences_at_speed(rider_arrays, np.array([[60.0, 60.0, 60.0]] * 2), speeds, 0.95)
+    single = evaluate_rotation_sequences_at_speed(rider_arrays, np.array([[60.0, 60.0, 60.0]]), 45.0, 0.95)
+    assert np.allclose(batch.normalized_watts[1], single.normalized_watts[0])
+    assert batch.normalized_watts[0, 0] < batch.normalized_watts[1, 0]
+
+def test_rider_power_profile_agrees_with_rider_and_pickles(riders):
+    import pickle
+    from jgh_formulae02 import get_rider_power_profile
+    for rider in riders:
+        profile = get_rider_power_profile(rider)
+        assert pickle.loads(pickle.dumps(profile)) == profile
+        assert profile.one_hour_watts == rider.get_one_hour_watts()
+        for seconds in [0.0, 30.0, 60.0, 120.0, 180.0, 240.0, 300.0, 45.0]:
+            assert profile.get_standard_pull_watts(seconds) == rider.get_standard_pull_watts(seconds)
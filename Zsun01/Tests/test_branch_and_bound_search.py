@@ -0,0 +1,30 @@
+import numpy as np
+from jgh_formulae02 import generate_all_paceline_rotation_sequences_in_the_total_solution_space
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, calculate_binding_speeds_of_rotation_sequences
+from jgh_formulae11 import search_for_fastest_paceline_solutions_by_branch_and_bound, generate_fastest_paceline_solutions_by_branch_and_bound
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_branch_and_bound_agrees_with_exhaustive_search(four_riders):
+    for num_riders in [2, 3, 4]:
+        team = four_riders[:num_riders]
+        universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+        binding_kph = calculate_binding_speeds_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation(team), universe, 0.95)
+        num_pullers = (universe != 0).sum(axis=1)
+        fastest_kph = np.where(num_pullers >= 2, binding_kph, -np.inf).max()
+        everybody_kph = np.where(num_pullers == num_riders, binding_kph, -np.inf).max()
+
+        fastest, found_fastest_kph, everybody, found_everybody_kph, _, leaves_scored = search_for_fastest_paceline_solutions_by_branch_and_bound(team, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, 125.0)
+
+        assert found_fastest_kph == fastest_kph
+        assert found_everybody_kph == everybody_kph
+        assert all(period != 0 for period in everybody)
+        assert sum(1 for period in fastest if period != 0) >= 2
+        assert leaves_scored < len(universe)
+
+def test_branch_and_bound_package_reports_the_winning_sequences(ingredients_of_four_riders):
+    report = generate_fastest_paceline_solutions_by_branch_and_bound(ingredients_of_four_riders)
+    assert report.balanced_intensity_of_effort_solution is None
+    assert report.hang_in_solution.algorithm_ran_to_completion
+    assert report.everybody_pull_hard_solution.algorithm_ran_to_completion
+    assert report.hang_in_solution.calculated_average_speed_of_paceline_kph >= report.everybody_pull_hard_solution.calculated_average_speed_of_paceline_kph - 0.01
+    assert all(contribution.p1_duration != 0 for contribution in report.everybody_pull_hard_solution.rider_contributions.values())
@@ -0,0 +1,50 @@
+import pytest
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineComputationReportItem, RiderContributionItem, WorthyCandidateSolutionItem, CandidateSolutionReducerItem
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import is_everyone_pull_hard_solution_candidate, generate_package_of_paceline_solutions
+
+def make_solution(riders: list[ZsunItem], speed_kph: float, dispersion: float, p1_durations: list[float]) -> PacelineComputationReportItem:
+    solution = PacelineComputationReportItem(calculated_average_speed_of_paceline_kph=speed_kph, calculated_dispersion_of_intensity_of_effort=dispersion)
+    for rider, duration in zip(riders, p1_durations):
+        solution.rider_contributions[rider] = RiderContributionItem(p1_duration=duration)
+    return solution
+
+def test_reducer_keeps_the_best_k_in_order_and_skips_ineligible_solutions(riders):
+    reducer = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="allpush "), is_everyone_pull_hard_solution_candidate, top_k=3)
+    for speed in [40.0, 42.0, 41.0, 39.0, 43.0, 41.5]:
+        reducer.consume(make_solution(riders, speed, 0.05, [30.0, 60.0, 30.0]))
+    reducer.consume(make_solution(riders, 50.0, 0.05, [30.0, 0.0, 30.0]))
+    assert [solution.calculated_average_speed_of_paceline_kph for solution in reducer.best_solutions] == [43.0, 42.0, 41.5]
+    assert reducer.candidate.solution is reducer.best_solutions[0]
+    assert reducer.candidate.speed_kph == 43.0
+
+def test_reducer_of_one_matches_testing_each_solution_against_the_candidate(riders):
+    reducer = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="allpush "), is_everyone_pull_hard_solution_candidate)
+    candidate = WorthyCandidateSolutionItem(tag="allpush ")
+    for speed, dispersion in [(40.0, 0.2), (41.0, 0.3), (41.0, 0.1), (41.0, 0.2), (39.0, 0.0)]:
+        solution = make_solution(riders, speed, dispersion, [30.0, 60.0, 30.0])
+        reducer.consume(solution)
+        if is_everyone_pull_hard_solution_candidate(solution, candidate):
+            candidate.speed_kph, candidate.dispersion, candidate.solution = speed, dispersion, solution
+    assert reducer.best_solutions == [candidate.solution]
+
+def test_package_without_a_table_picks_the_plans_of_the_package_with_one(ingredients):
+    for strategy in [PacelineProcessingStrategyEnum.SERIAL, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION]:
+        tabled = generate_package_of_paceline_solutions(ingredients, strategy)
+        streamed = generate_package_of_paceline_solutions(ingredients, strategy, keep_solutions_table=False)
+        assert streamed.solutions_table is None and streamed.all_solutions is None
+        assert streamed.total_pull_sequences_examined == tabled.total_pull_sequences_examined
+        assert streamed.total_compute_iterations_performed == tabled.total_compute_iterations_performed
+        for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+            expected, actual = getattr(tabled, name), getattr(streamed, name)
+            assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph, name
+            assert [contribution.p1_duration for contribution in actual.rider_contributions.values()] == [contribution.p1_duration for contribution in expected.rider_contributions.values()], name
+
+def test_package_without_a_table_keeps_every_solution_only_when_asked(ingredients):
+    retained = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, retain_all_solutions=True, keep_solutions_table=False)
+    assert len(retained.all_solutions) == retained.total_pull_sequences_examined
+
+def test_package_without_a_table_refuses_a_time_budget(ingredients):
+    with pytest.raises(ValueError):
+        generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, time_budget_sec=10.0, keep_solutions_table=False)
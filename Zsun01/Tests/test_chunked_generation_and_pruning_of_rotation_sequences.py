@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from computation_classes import PacelineIngredientsItem
+from jgh_formulae02 import (generate_all_paceline_rotation_sequences_in_the_total_solution_space, prune_all_sequences_of_pull_periods_in_the_total_solution_space,
+    generate_chunks_of_paceline_rotation_sequences_in_the_total_solution_space, generate_pruned_paceline_rotation_sequences_in_chunks)
+from jgh_formulae08 import validate_paceline_ingredients
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_chunks_reassemble_the_universe_in_order():
+    for num_riders in [1, 3, 4]:
+        universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+        for rows_per_chunk in [1, 50, 10_000]:
+            chunks = list(generate_chunks_of_paceline_rotation_sequences_in_the_total_solution_space(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, rows_per_chunk))
+            assert max(len(chunk) for chunk in chunks) <= max(rows_per_chunk, len(STANDARD_PULL_PERIODS_SEC_AS_LIST))
+            assert np.array_equal(np.concatenate(chunks), universe)
+
+def test_chunked_pruning_matches_pruning_the_whole_universe(five_riders):
+    for num_riders in [2, 4, 5]:
+        team = five_riders[:num_riders]
+        universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+        expected = prune_all_sequences_of_pull_periods_in_the_total_solution_space(universe, team)
+        for rows_per_chunk in [49, 343, 1_000_000]:
+            assert np.array_equal(generate_pruned_paceline_rotation_sequences_in_chunks(team, STANDARD_PULL_PERIODS_SEC_AS_LIST, rows_per_chunk), expected)
+
+def test_pruning_ranks_periods_that_are_not_standard_among_themselves(five_riders):
+    universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(5, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    expected = prune_all_sequences_of_pull_periods_in_the_total_solution_space(universe, five_riders)
+    assert np.array_equal(prune_all_sequences_of_pull_periods_in_the_total_solution_space(universe * 1.5 + 0.25, five_riders), expected * 1.5 + 0.25)
+
+def test_pull_periods_out_of_ascending_order_are_refused(five_riders):
+    for periods in [STANDARD_PULL_PERIODS_SEC_AS_LIST[::-1], [0.0, 60.0, 30.0, 120.0], [0.0, 30.0, 30.0, 60.0]]:
+        with pytest.raises(ValueError):
+            generate_pruned_paceline_rotation_sequences_in_chunks(five_riders, periods)
+        with pytest.raises(ValueError):
+            validate_paceline_ingredients(PacelineIngredientsItem(riders_list=five_riders, sequence_of_pull_periods_sec=periods, pull_speeds_kph=[30.0] * len(five_riders), max_exertion_intensity_factor=0.95))
@@ -0,0 +1,28 @@
+import numpy as np
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import (calculate_size_of_next_parallel_chunk, generate_table_of_paceline_solutions, generate_paceline_solutions_using_serial_processing_algorithm,
+    generate_paceline_solutions_using_parallel_chunked_algorithm, shutdown_paceline_solver_worker_pool)
+from constants import MIN_SEQUENCES_PER_PARALLEL_CHUNK, MAX_SEQUENCES_PER_PARALLEL_CHUNK, TARGET_SECONDS_PER_PARALLEL_CHUNK
+
+def test_chunks_grow_with_cheap_sequences_within_limits_and_shrink_at_the_tail():
+    assert calculate_size_of_next_parallel_chunk(0.0, 10_000, 4) == MIN_SEQUENCES_PER_PARALLEL_CHUNK
+    assert calculate_size_of_next_parallel_chunk(1e-9, 10_000, 4) == MAX_SEQUENCES_PER_PARALLEL_CHUNK
+    assert calculate_size_of_next_parallel_chunk(10.0, 10_000, 4) == MIN_SEQUENCES_PER_PARALLEL_CHUNK
+    assert calculate_size_of_next_parallel_chunk(TARGET_SECONDS_PER_PARALLEL_CHUNK / 200, 10_000, 4) == 200
+    assert calculate_size_of_next_parallel_chunk(1e-9, 90, 4) == 23
+    assert calculate_size_of_next_parallel_chunk(1e-9, 1, 4) == 1
+
+def test_chunked_rows_match_serial_rows(ingredients, sequences):
+    columns = ["rotation_sequence_index", "algorithm_ran_to_completion", "is_valid", "calculated_average_speed_of_paceline_kph", "calculated_dispersion_of_intensity_of_effort",
+        "pull_speed_kph", "compute_iterations_performed_count", "bracketing_iterations_performed_count", "p1_duration", "intensity_factor", "normalized_watts", "average_watts"]
+    try:
+        serial = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.SERIAL)
+        chunked = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.PARALLEL_CHUNKED)
+        for column in columns:
+            assert np.array_equal(serial.rows[column], chunked.rows[column]), column
+        reports = generate_paceline_solutions_using_parallel_chunked_algorithm(ingredients, sequences)
+        expected = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences)
+        assert [report.calculated_average_speed_of_paceline_kph for report in reports] == [report.calculated_average_speed_of_paceline_kph for report in expected]
+        assert [list(report.rider_contributions.values()) for report in reports] == [list(report.rider_contributions.values()) for report in expected]
+    finally:
+        shutdown_paceline_solver_worker_pool()
@@ -0,0 +1,38 @@
+import numpy as np
+from memo_utilities import BoundedLruMemo, estimate_size_of_memo_entry_bytes
+from jgh_formulae02 import calculate_overall_average_watts, calculate_overall_normalized_watts
+from jgh_formulae04 import populate_rider_work_assignments
+from jgh_formulae05 import populate_rider_exertions
+from jgh_formulae06 import exertion_fragment_memo, calculate_average_and_normalized_watts_of_exertions
+
+def test_lru_evicts_the_least_recently_used_entry_to_stay_under_the_ceiling():
+    entry_size = estimate_size_of_memo_entry_bytes((1, 2), (0.5, 0.5))
+    memo = BoundedLruMemo(2 * entry_size)
+    memo.put((1, 2), (0.5, 0.5))
+    memo.put((3, 4), (0.5, 0.5))
+    assert memo.get((1, 2)) is not None
+    memo.put((5, 6), (0.5, 0.5))
+    assert memo.get((3, 4)) is None
+    assert memo.get((1, 2)) is not None
+    assert memo.get((5, 6)) is not None
+    assert memo.size_bytes <= memo.ceiling_bytes
+    assert (memo.hits, memo.misses, memo.evictions) == (3, 1, 1)
+
+def test_zero_ceiling_disables_the_memo():
+    memo = BoundedLruMemo(0)
+    memo.put((1, 2), (0.5, 0.5))
+    assert len(memo) == 0
+    assert memo.get((1, 2)) is None
+
+def test_memoised_watts_match_the_uncached_calculation(riders):
+    exertion_fragment_memo.clear()
+    for pull_durations in [[30.0, 60.0, 0.0], [300.0, 30.0, 120.0], [60.0, 30.0, 0.0]]:
+        for speed_kph in [38.0, 41.5]:
+            exertions = populate_rider_exertions(populate_rider_work_assignments(riders, pull_durations, [speed_kph] * len(riders)))
+            for rider, rider_exertions in exertions.items():
+                average_watts, normalized_watts = calculate_average_and_normalized_watts_of_exertions(rider, rider_exertions)
+                assert np.isclose(average_watts, calculate_overall_average_watts(rider_exertions), rtol=1e-12)
+                assert np.isclose(normalized_watts, calculate_overall_normalized_watts(rider_exertions), rtol=1e-12)
+    hits, misses = exertion_fragment_memo.get_counters()
+    assert misses == len(exertion_fragment_memo)
+    assert hits > 0
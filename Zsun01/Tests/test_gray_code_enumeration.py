@@ -0,0 +1,38 @@
+import numpy as np
+from jgh_formulae01 import estimate_drag_ratio_in_paceline
+from jgh_formulae02 import (generate_all_paceline_rotation_sequences_in_the_total_solution_space, generate_all_paceline_rotation_sequences_in_gray_code_order,
+    walk_paceline_rotation_sequences_in_gray_code_order, calculate_upper_bound_speeds_of_paceline_rotation_sequences_in_gray_code_order)
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, calculate_binding_speeds_of_rotation_sequences
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_gray_order_covers_the_cartesian_product_one_step_at_a_time():
+    for num_riders in [1, 2, 3, 4]:
+        gray = generate_all_paceline_rotation_sequences_in_gray_code_order(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+        cartesian = generate_all_paceline_rotation_sequences_in_the_total_solution_space(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+        assert sorted(map(tuple, gray)) == sorted(map(tuple, cartesian))
+        steps = np.diff(np.searchsorted(STANDARD_PULL_PERIODS_SEC_AS_LIST, gray), axis=0)
+        assert (np.abs(steps).sum(axis=1) == 1).all()
+
+def test_walk_matches_the_gray_order_and_rebuilt_totals():
+    num_riders = 4
+    gray = generate_all_paceline_rotation_sequences_in_gray_code_order(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    drag_ratios = np.array([[estimate_drag_ratio_in_paceline((k - j) % num_riders + 1) for j in range(num_riders)] for k in range(num_riders)])
+    count = 0
+    for row, (sequence, total_duration_sec, drag_weighted_sec) in zip(gray, walk_paceline_rotation_sequences_in_gray_code_order(num_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)):
+        assert (sequence == row).all()
+        assert np.isclose(total_duration_sec, row.sum())
+        assert np.allclose(drag_weighted_sec, drag_ratios @ row)
+        count += 1
+    assert count == len(gray)
+
+def test_walk_of_a_single_pull_period_yields_one_sequence():
+    assert len(list(walk_paceline_rotation_sequences_in_gray_code_order(3, [60.0]))) == 1
+
+def test_bounds_read_off_the_walk_are_no_slower_than_the_binding_speeds(riders):
+    gray = generate_all_paceline_rotation_sequences_in_gray_code_order(len(riders), STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    upper_bound_kph = calculate_upper_bound_speeds_of_paceline_rotation_sequences_in_gray_code_order(riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95)
+    binding_kph = calculate_binding_speeds_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation(riders), gray, 0.95)
+    somebody_pulls = (gray != 0).any(axis=1)
+    assert upper_bound_kph.shape == (len(gray),)
+    assert (upper_bound_kph[somebody_pulls] >= binding_kph[somebody_pulls] - 1e-9).all()
+    assert (upper_bound_kph[~somebody_pulls] == 0.0).all()
@@ -0,0 +1,54 @@
+import concurrent.futures
+import pytest
+import numpy as np
+from computation_classes import PacelineIngredientsItem
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae02 import generate_pruned_paceline_rotation_sequences_in_chunks
+from jgh_formulae08 import (dispatch_chunks_of_paceline_rotation_sequences, generate_table_of_paceline_solutions, populate_paceline_solutions_tables_of_several_batches_in_one_pool,
+    generate_package_of_paceline_solutions, generate_packages_of_paceline_solutions_in_one_pool, paceline_solver_worker_pool, shutdown_paceline_solver_worker_pool)
+from jgh_formulae09 import make_paceline_ingredients_for_n_strongest
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+@pytest.fixture
+def ingredients_of_two(riders):
+    return PacelineIngredientsItem(riders_list=riders[1:], sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * 2, max_exertion_intensity_factor=0.9)
+
+def test_no_chunk_spans_a_boundary_and_every_index_is_dispatched_once():
+    chunks = []
+    def submit_chunk(indices):
+        chunks.append(indices.tolist())
+        future = concurrent.futures.Future()
+        future.set_result(len(indices))
+        return future
+    dispatch_chunks_of_paceline_rotation_sequences(1000, submit_chunk, lambda solved: (solved, 1e-9 * solved), [7, 500, 501])
+    assert sorted(index for chunk in chunks for index in chunk) == list(range(1000))
+    for chunk in chunks:
+        assert not any(chunk[0] < boundary <= chunk[-1] for boundary in [7, 500, 501]), chunk
+
+def test_batches_solved_in_one_pool_match_each_batch_solved_on_its_own(riders, ingredients, ingredients_of_two):
+    columns = ["rotation_sequence_index", "algorithm_ran_to_completion", "is_valid", "calculated_average_speed_of_paceline_kph", "pull_speed_kph", "p1_duration", "intensity_factor", "normalized_watts"]
+    batches = [(ingredients, generate_pruned_paceline_rotation_sequences_in_chunks(riders, STANDARD_PULL_PERIODS_SEC_AS_LIST)),
+        (ingredients_of_two, generate_pruned_paceline_rotation_sequences_in_chunks(riders[1:], STANDARD_PULL_PERIODS_SEC_AS_LIST))]
+    try:
+        tables = populate_paceline_solutions_tables_of_several_batches_in_one_pool(batches)
+        for (paceline_ingredients, sequences), table in zip(batches, tables):
+            expected = generate_table_of_paceline_solutions(paceline_ingredients, sequences.tolist(), PacelineProcessingStrategyEnum.SERIAL)
+            for column in columns:
+                assert np.array_equal(expected.rows[column], table.rows[column]), column
+    finally:
+        shutdown_paceline_solver_worker_pool()
+
+def test_packages_planned_in_one_pool_match_packages_planned_one_at_a_time(ingredients, ingredients_of_two, monkeypatch):
+    list_of_ingredients = [ingredients_of_two, ingredients, make_paceline_ingredients_for_n_strongest(ingredients, 2)]
+    monkeypatch.setattr(paceline_solver_worker_pool, "max_workers", 2)
+    try:
+        packages = generate_packages_of_paceline_solutions_in_one_pool(list_of_ingredients)
+        for paceline_ingredients, package in zip(list_of_ingredients, packages):
+            expected = generate_package_of_paceline_solutions(paceline_ingredients, PacelineProcessingStrategyEnum.SERIAL)
+            assert package.dispatch_decision is None and not package.served_from_cache
+            assert package.total_pull_sequences_examined == expected.total_pull_sequences_examined
+            for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+                assert getattr(package, name).calculated_average_speed_of_paceline_kph == getattr(expected, name).calculated_average_speed_of_paceline_kph, name
+                assert list(getattr(package, name).rider_contributions.keys()) == paceline_ingredients.riders_list
+    finally:
+        shutdown_paceline_solver_worker_pool()
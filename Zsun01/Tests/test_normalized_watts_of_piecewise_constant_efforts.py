@@ -0,0 +1,30 @@
+import random
+import numpy as np
+from computation_classes import RiderExertionItem
+from jgh_formulae02 import (calculate_overall_normalized_watts, calculate_overall_normalized_watts_second_by_second,
+    calculate_normalized_watts_of_piecewise_constant_efforts, calculate_normalized_watts_of_piecewise_constant_efforts_numpy)
+
+def make_efforts(durations: list[float], wattages: list[float]) -> list[RiderExertionItem]:
+    return [RiderExertionItem(current_location_in_paceline=idx + 1, duration=d, wattage=w) for idx, (d, w) in enumerate(zip(durations, wattages))]
+
+def test_segment_wise_matches_second_by_second_for_standard_pulls():
+    durations = [300.0, 30.0, 0.0, 120.0, 60.0]
+    wattages = [380.0, 250.0, 240.0, 230.0, 220.0]
+    efforts = make_efforts(durations, wattages)
+    assert np.isclose(calculate_overall_normalized_watts(efforts), calculate_overall_normalized_watts_second_by_second(efforts), rtol=1e-12)
+
+def test_segment_wise_matches_second_by_second_for_awkward_durations():
+    rng = random.Random(42)
+    for _ in range(200):
+        n = rng.randint(1, 8)
+        durations = [rng.choice([0.0, 1.0, 2.0, 3.5, 4.0, 5.0, 7.9, 30.0]) for _ in range(n)]
+        wattages = [rng.uniform(100.0, 500.0) for _ in range(n)]
+        efforts = make_efforts(durations, wattages)
+        expected = calculate_overall_normalized_watts_second_by_second(efforts)
+        assert np.isclose(calculate_overall_normalized_watts(efforts), expected, rtol=1e-12, atol=1e-9)
+        actual = calculate_normalized_watts_of_piecewise_constant_efforts_numpy(np.array([durations]), np.array([[wattages]]))
+        assert np.isclose(actual[0, 0], expected, rtol=1e-12, atol=1e-9)
+
+def test_timeline_shorter_than_one_window_is_zero():
+    assert calculate_normalized_watts_of_piecewise_constant_efforts([2.0, 2.0], [300.0, 200.0]) == 0
+    assert calculate_overall_normalized_watts([]) == 0
@@ -0,0 +1,45 @@
+import numpy as np
+from computation_classes import PacelineSolutionsTable, WorthyCandidateSolutionItem
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae02 import calculate_dispersion_of_intensity_of_effort_numpy
+from jgh_formulae08 import (generate_paceline_solutions_using_serial_processing_algorithm, generate_table_of_paceline_solutions, select_rows_of_candidate_solutions_in_paceline_solutions_table,
+    materialize_paceline_computation_report_from_solutions_table, generate_package_of_paceline_solutions, is_valid_solution, is_thirty_second_pulls_solution_candidate, is_sixty_second_pulls_solution_candidate,
+    is_balanced_intensity_solution_candidate, is_everyone_pull_hard_solution_candidate, is_race_solution_with_possibility_of_drop_candidate)
+
+def test_columnar_selection_picks_the_rows_the_candidate_tests_pick(ingredients, sequences):
+    reports = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences)
+    candidates = [WorthyCandidateSolutionItem() for _ in range(5)]
+    tests = [is_thirty_second_pulls_solution_candidate, is_sixty_second_pulls_solution_candidate, is_balanced_intensity_solution_candidate, is_everyone_pull_hard_solution_candidate, is_race_solution_with_possibility_of_drop_candidate]
+    for report in reports:
+        if is_valid_solution(report):
+            for candidate, is_candidate in zip(candidates, tests):
+                if is_candidate(report, candidate):
+                    candidate.speed_kph, candidate.dispersion, candidate.solution = report.calculated_average_speed_of_paceline_kph, report.calculated_dispersion_of_intensity_of_effort, report
+    expected = tuple(candidate.solution.rotation_sequence_index for candidate in candidates)
+    for strategy in [PacelineProcessingStrategyEnum.SERIAL, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION]:
+        assert select_rows_of_candidate_solutions_in_paceline_solutions_table(generate_table_of_paceline_solutions(ingredients, sequences, strategy)) == expected
+
+def test_winners_are_rebuilt_exactly_as_the_solver_built_them(riders, ingredients, sequences):
+    reports = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences)
+    table = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.SERIAL)
+    for row in [0, len(sequences) // 2, len(sequences) - 1]:
+        rebuilt = materialize_paceline_computation_report_from_solutions_table(table, row, riders, PacelineProcessingStrategyEnum.SERIAL)
+        assert rebuilt.calculated_average_speed_of_paceline_kph == reports[row].calculated_average_speed_of_paceline_kph
+        assert list(rebuilt.rider_contributions.values()) == list(reports[row].rider_contributions.values())
+
+def test_dispersion_of_many_sequences_matches_the_scalar_calculation_to_the_last_bit(ingredients, sequences):
+    table = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.SERIAL)
+    rows = table.rows
+    dispersion = calculate_dispersion_of_intensity_of_effort_numpy(rows["intensity_factor"], rows["p1_duration"])
+    assert np.array_equal(dispersion, rows["calculated_dispersion_of_intensity_of_effort"])
+    assert calculate_dispersion_of_intensity_of_effort_numpy(np.array([[0.8, 0.9]]), np.array([[0.0, 0.0]]))[0] == 100
+
+def test_table_survives_a_round_trip_through_npz(riders, ingredients, tmp_path):
+    package = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+    file_path = str(tmp_path / "solutions.npz")
+    package.solutions_table.save_to_npz(file_path)
+    table = PacelineSolutionsTable.read_from_npz(file_path)
+    assert np.array_equal(table.rows, package.solutions_table.rows)
+    assert table.num_riders == len(riders)
+    assert table.max_exertion_intensity_factor == 0.95
+    assert package.total_compute_iterations_performed == int(table.rows["compute_iterations_performed_count"].sum())
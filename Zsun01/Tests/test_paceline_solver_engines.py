@@ -0,0 +1,61 @@
+import itertools
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem
+from jgh_enums import PacelineSolverEngineEnum
+from jgh_formulae08 import generate_a_single_paceline_solution
+from constants import REQUIRED_PRECISION_OF_SPEED
+
+sequences = [list(sequence) for sequence in itertools.product([0.0, 30.0, 120.0, 300.0], repeat=3)]
+
+def solve(riders: list[ZsunItem], sequence: list[float], engine: PacelineSolverEngineEnum, seed_kph: float = 30.0):
+    return generate_a_single_paceline_solution(PacelineIngredientsItem(riders_list=riders, sequence_of_pull_periods_sec=sequence,
+        pull_speeds_kph=[seed_kph] * len(riders), max_exertion_intensity_factor=0.95, solver_engine=engine))
+
+def test_alternative_engines_agree_with_binary_search(riders):
+    for engine in [PacelineSolverEngineEnum.VECTORIZED_BINARY_SEARCH, PacelineSolverEngineEnum.ANALYTIC_BINDING_SPEED, PacelineSolverEngineEnum.BOUND_INFORMED_BINARY_SEARCH]:
+        for sequence in sequences:
+            expected = solve(riders, sequence, PacelineSolverEngineEnum.BINARY_SEARCH)
+            actual = solve(riders, sequence, engine)
+            assert actual.algorithm_ran_to_completion == expected.algorithm_ran_to_completion
+            assert abs(actual.calculated_average_speed_of_paceline_kph - expected.calculated_average_speed_of_paceline_kph) <= REQUIRED_PRECISION_OF_SPEED + 1e-9
+            if expected.algorithm_ran_to_completion:
+                assert any(contribution.effort_constraint_violation_reason for contribution in actual.rider_contributions.values())
+
+def test_analytic_engine_honours_seed_speed_already_in_violation(riders):
+    expected = solve(riders, [30.0, 30.0, 30.0], PacelineSolverEngineEnum.BINARY_SEARCH, seed_kph=60.0)
+    for engine in [PacelineSolverEngineEnum.ANALYTIC_BINDING_SPEED, PacelineSolverEngineEnum.BOUND_INFORMED_BINARY_SEARCH]:
+        actual = solve(riders, [30.0, 30.0, 30.0], engine, seed_kph=60.0)
+        assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph == 60.0
+
+def test_speed_bracket_straddles_binding_speed(riders):
+    import numpy as np
+    from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, calculate_speed_bracket_of_rotation_sequences, calculate_binding_speeds_of_rotation_sequences
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    lower_kph, upper_kph = calculate_speed_bracket_of_rotation_sequences(rider_arrays, np.array(sequences), 0.95)
+    binding_kph = calculate_binding_speeds_of_rotation_sequences(rider_arrays, np.array(sequences), 0.95)
+    assert np.all(lower_kph <= binding_kph + 1e-9)
+    assert np.all(binding_kph <= upper_kph + 1e-9)
+
+def test_bound_informed_engine_spends_fewer_probes_and_reports_them(riders):
+    for sequence in sequences:
+        expected = solve(riders, sequence, PacelineSolverEngineEnum.BINARY_SEARCH)
+        actual = solve(riders, sequence, PacelineSolverEngineEnum.BOUND_INFORMED_BINARY_SEARCH)
+        assert 0 < actual.bracketing_iterations_performed_count <= actual.compute_iterations_performed_count
+        assert actual.computational_time > 0
+        if expected.algorithm_ran_to_completion:
+            assert actual.compute_iterations_performed_count <= expected.compute_iterations_performed_count
+
+def test_lockstep_batched_bisection_reproduces_serial_processing(riders):
+    from jgh_enums import PacelineProcessingStrategyEnum
+    from jgh_formulae08 import generate_paceline_solutions_using_serial_and_parallel_algorithms
+    ingredients = PacelineIngredientsItem(riders_list=riders, pull_speeds_kph=[30.0] * len(riders), max_exertion_intensity_factor=0.95)
+    serial = generate_paceline_solutions_using_serial_and_parallel_algorithms(ingredients, sequences, PacelineProcessingStrategyEnum.SERIAL)
+    lockstep = generate_paceline_solutions_using_serial_and_parallel_algorithms(ingredients, sequences, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+    assert len(serial) == len(lockstep) == len(sequences)
+    for expected, actual in zip(serial, lockstep):
+        assert actual.algorithm_ran_to_completion == expected.algorithm_ran_to_completion
+        assert actual.compute_iterations_performed_count == expected.compute_iterations_performed_count
+        assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph
+        for rider in riders:
+            assert actual.rider_contributions[rider].effort_constraint_violation_reason == expected.rider_contributions[rider].effort_constraint_violation_reason
+            assert abs(actual.rider_contributions[rider].intensity_factor - expected.rider_contributions[rider].intensity_factor) < 1e-12
@@ -0,0 +1,50 @@
+import os
+from computation_classes import PacelineIngredientsItem
+from process_pool_utilities import PersistentProcessPool
+from jgh_formulae02 import generate_pruned_paceline_rotation_sequences_in_chunks
+from jgh_formulae08 import generate_paceline_solutions_using_serial_processing_algorithm, generate_paceline_solutions_using_parallel_workstealing_algorithm, paceline_solver_worker_pool, shutdown_paceline_solver_worker_pool
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+initialised_with = None
+
+def remember_initargs(value: str) -> None:
+    global initialised_with
+    initialised_with = value
+
+def report_initargs_and_pid(_: int) -> tuple:
+    return initialised_with, os.getpid()
+
+def test_pool_keeps_its_workers_across_batches_until_shut_down():
+    with PersistentProcessPool(max_workers=2, initializer=remember_initargs) as pool:
+        first = list(pool.get_executor(("first",)).map(report_initargs_and_pid, range(8)))
+        second = list(pool.get_executor(("second",)).map(report_initargs_and_pid, range(8)))
+        assert pool.starts == 1
+        assert {value for value, _ in first + second} == {"first"}
+        assert len({pid for _, pid in first + second}) <= 2
+    assert not pool.is_running
+    restarted = list(pool.get_executor(("third",)).map(report_initargs_and_pid, range(2)))
+    pool.shutdown()
+    assert pool.starts == 2
+    assert {value for value, _ in restarted} == {"third"}
+
+def test_broadcast_reaches_every_worker_exactly_once():
+    with PersistentProcessPool(max_workers=3, initializer=remember_initargs) as pool:
+        pool.broadcast(remember_initargs, ("broadcast",), ("started",))
+        answers = list(pool.get_executor().map(report_initargs_and_pid, range(30)))
+        assert {value for value, _ in answers} == {"broadcast"}
+        assert pool.starts == 1
+
+def test_planning_calls_share_the_warm_pool_and_match_serial_processing(riders):
+    shutdown_paceline_solver_worker_pool()
+    ingredients = PacelineIngredientsItem(riders_list=riders[:2], sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * 2, max_exertion_intensity_factor=0.95)
+    sequences = generate_pruned_paceline_rotation_sequences_in_chunks(riders[:2], STANDARD_PULL_PERIODS_SEC_AS_LIST).tolist()
+    try:
+        starts_before = paceline_solver_worker_pool.starts
+        serial = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences)
+        for _ in range(2):
+            parallel = sorted(generate_paceline_solutions_using_parallel_workstealing_algorithm(ingredients, sequences), key=lambda report: report.rotation_sequence_index)
+            assert [report.calculated_average_speed_of_paceline_kph for report in parallel] == [report.calculated_average_speed_of_paceline_kph for report in serial]
+        assert paceline_solver_worker_pool.starts == starts_before + 1
+    finally:
+        shutdown_paceline_solver_worker_pool()
+    assert not paceline_solver_worker_pool.is_running
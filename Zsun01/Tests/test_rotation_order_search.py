@@ -0,0 +1,54 @@
+import math
+import numpy as np
+from jgh_formulae02 import generate_all_paceline_rotation_sequences_in_the_total_solution_space
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, reorder_rider_arrays_for_batch_evaluation, calculate_binding_speeds_of_rotation_sequences
+from jgh_formulae11 import search_for_fastest_paceline_solutions_by_branch_and_bound
+from jgh_formulae13 import generate_rotation_orders_with_first_rider_fixed, search_for_fastest_rotation_order_and_pull_periods
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_orders_keep_the_first_rider_and_start_with_the_order_handed_in():
+    orders = generate_rotation_orders_with_first_rider_fixed(5)
+    assert len(orders) == len(set(orders)) == math.factorial(4)
+    assert orders[0] == (0, 1, 2, 3, 4)
+    assert all(order[0] == 0 and sorted(order) == [0, 1, 2, 3, 4] for order in orders)
+    assert generate_rotation_orders_with_first_rider_fixed(5, 7) == orders[:7]
+    assert generate_rotation_orders_with_first_rider_fixed(1) == [(0,)]
+
+def test_reordered_rider_arrays_match_arrays_prepared_in_that_order(four_riders):
+    order = [0, 3, 1, 2]
+    reordered = reorder_rider_arrays_for_batch_evaluation(prepare_rider_arrays_for_batch_evaluation(four_riders), order)
+    expected = prepare_rider_arrays_for_batch_evaluation([four_riders[i] for i in order])
+    for name in ["weight_kg", "height_cm", "one_hour_watts", "pull_periods_sec", "pull_watts_caps"]:
+        assert np.array_equal(getattr(reordered, name), getattr(expected, name)), name
+
+def test_branch_and_bound_returns_nothing_that_does_not_beat_the_incumbents(four_riders):
+    fastest, fastest_kph, everybody, everybody_kph, _, _ = search_for_fastest_paceline_solutions_by_branch_and_bound(four_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, 125.0)
+    beaten = search_for_fastest_paceline_solutions_by_branch_and_bound(four_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, 125.0, incumbent_kph=(fastest_kph, everybody_kph))
+    assert beaten[0] == [] and beaten[2] == [] and beaten[1] == fastest_kph and beaten[3] == everybody_kph
+    seeded = search_for_fastest_paceline_solutions_by_branch_and_bound(four_riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, 125.0, incumbent_kph=(fastest_kph - 1.0, everybody_kph - 1.0))
+    assert seeded[:4] == (fastest, fastest_kph, everybody, everybody_kph)
+
+def test_joint_search_agrees_with_exhaustive_search_over_orders_and_sequences(four_riders, ingredients_of_four_riders):
+    universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(len(four_riders), STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    num_pullers = (universe != 0).sum(axis=1)
+    best_by_order = {}
+    for order in generate_rotation_orders_with_first_rider_fixed(len(four_riders)):
+        binding_kph = calculate_binding_speeds_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation([four_riders[i] for i in order]), universe, 0.95)
+        best_by_order[order] = (np.where(num_pullers >= 2, binding_kph, -np.inf).max(), np.where(num_pullers == len(four_riders), binding_kph, -np.inf).max())
+
+    search = search_for_fastest_rotation_order_and_pull_periods(ingredients_of_four_riders)
+
+    assert search.rotation_orders_explored == search.total_rotation_orders == math.factorial(len(four_riders) - 1)
+    assert search.fastest_kph == max(best[0] for best in best_by_order.values())
+    assert search.everybody_pulls_kph == max(best[1] for best in best_by_order.values())
+    assert (search.heuristic_fastest_kph, search.heuristic_everybody_pulls_kph) == best_by_order[(0, 1, 2, 3)]
+    assert search.heuristic_order_is_optimal == (search.fastest_kph == search.heuristic_fastest_kph and search.everybody_pulls_kph == search.heuristic_everybody_pulls_kph)
+    assert search.fastest_riders_list[0] == four_riders[0] and sorted(rider.zwift_id for rider in search.fastest_riders_list) == ["1", "2", "3", "4"]
+    assert list(search.fastest_solution.rider_contributions.keys()) == search.fastest_riders_list
+    assert all(contribution.p1_duration != 0 for contribution in search.everybody_pulls_solution.rider_contributions.values())
+
+def test_capped_search_explores_only_the_heuristic_order(four_riders, ingredients_of_four_riders):
+    search = search_for_fastest_rotation_order_and_pull_periods(ingredients_of_four_riders, max_rotation_orders=1)
+    assert search.rotation_orders_explored == 1 and search.total_rotation_orders == 6
+    assert search.fastest_riders_list == four_riders and search.heuristic_order_is_optimal
+    assert search.fastest_kph == search.heuristic_fastest_kph
@@ -0,0 +1,96 @@
+import math
+from computation_classes import PacelineDispatchCalibrationItem
+from jgh_enums import PacelineProcessingStrategyEnum, PacelineSolverEngineEnum
+from jgh_formulae08 import (make_key_of_paceline_dispatch_calibration, read_paceline_dispatch_calibration, write_paceline_dispatch_calibration,
+    predict_seconds_of_paceline_processing_strategies, choose_paceline_processing_strategy, generate_package_of_paceline_solutions, shutdown_paceline_solver_worker_pool,
+    measure_paceline_dispatch_calibration, paceline_solver_worker_pool, PACELINE_DISPATCH_CALIBRATION_FILE_PATH)
+from disk_cache_utilities import get_user_cache_dirpath
+from constants import DISPATCH_CALIBRATION_SAMPLE_SIZE, DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS, DISPATCH_CALIBRATION_FILE_NAME
+
+calibration = PacelineDispatchCalibrationItem(key="host", num_workers=4, serial_seconds_per_sequence=0.01, lockstep_fixed_seconds=0.5,
+    lockstep_seconds_per_sequence=0.001, pool_start_seconds=2.0, parallel_task_overhead_seconds=0.01)
+
+def test_cost_model_charges_pool_start_only_when_the_pool_is_cold():
+    cold = predict_seconds_of_paceline_processing_strategies(calibration, 1000, PacelineSolverEngineEnum.BINARY_SEARCH, pool_is_running=False)
+    warm = predict_seconds_of_paceline_processing_strategies(calibration, 1000, PacelineSolverEngineEnum.BINARY_SEARCH, pool_is_running=True)
+    assert math.isclose(cold[PacelineProcessingStrategyEnum.SERIAL], 10.0)
+    assert math.isclose(warm[PacelineProcessingStrategyEnum.PARALLEL_CHUNKED], (16 * 0.01 + 10.0) / 4)
+    assert math.isclose(cold[PacelineProcessingStrategyEnum.PARALLEL_CHUNKED] - warm[PacelineProcessingStrategyEnum.PARALLEL_CHUNKED], 2.0)
+    assert math.isclose(cold[PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION], 1.5)
+
+def test_lockstep_and_single_worker_parallel_are_no_contenders_where_they_do_not_apply():
+    predicted = predict_seconds_of_paceline_processing_strategies(calibration, 1000, PacelineSolverEngineEnum.ANALYTIC_BINDING_SPEED, pool_is_running=True)
+    assert predicted[PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION] == math.inf
+    single = PacelineDispatchCalibrationItem(key="host", num_workers=1, serial_seconds_per_sequence=0.01)
+    predicted = predict_seconds_of_paceline_processing_strategies(single, 1000, PacelineSolverEngineEnum.BINARY_SEARCH, pool_is_running=True)
+    assert predicted[PacelineProcessingStrategyEnum.PARALLEL_CHUNKED] == math.inf
+
+def test_calibrations_round_trip_through_the_cache_file_beside_each_other(tmp_path):
+    file_path = str(tmp_path / "calibration.json")
+    assert read_paceline_dispatch_calibration("host", file_path) is None
+    write_paceline_dispatch_calibration(calibration, file_path)
+    other = PacelineDispatchCalibrationItem(key="other", serial_seconds_per_sequence=0.02)
+    write_paceline_dispatch_calibration(other, file_path)
+    assert read_paceline_dispatch_calibration("host", file_path) == calibration
+    assert read_paceline_dispatch_calibration("other", file_path) == other
+    (tmp_path / "garbled.json").write_text("{not json")
+    assert read_paceline_dispatch_calibration("host", str(tmp_path / "garbled.json")) is None
+
+def test_calibrations_are_kept_in_the_user_cache_directory_made_when_missing(tmp_path):
+    assert PACELINE_DISPATCH_CALIBRATION_FILE_PATH == get_user_cache_dirpath(DISPATCH_CALIBRATION_FILE_NAME)
+    file_path = str(tmp_path / "missing" / "calibration.json")
+    write_paceline_dispatch_calibration(calibration, file_path)
+    assert read_paceline_dispatch_calibration("host", file_path) == calibration
+
+def test_small_batches_go_serial_without_calibrating(ingredients, sequences, tmp_path):
+    file_path = str(tmp_path / "calibration.json")
+    decision = choose_paceline_processing_strategy(ingredients, sequences[:DISPATCH_CALIBRATION_SAMPLE_SIZE - 1], file_path)
+    assert decision.processing_strategy == PacelineProcessingStrategyEnum.SERIAL
+    assert decision.calibration is None
+    assert read_paceline_dispatch_calibration(make_key_of_paceline_dispatch_calibration(ingredients), file_path) is None
+
+def test_first_choice_calibrates_and_caches_and_the_next_reuses_it(ingredients, sequences, tmp_path):
+    file_path = str(tmp_path / "calibration.json")
+    try:
+        first = choose_paceline_processing_strategy(ingredients, sequences, file_path)
+        second = choose_paceline_processing_strategy(ingredients, sequences, file_path)
+    finally:
+        shutdown_paceline_solver_worker_pool()
+    assert not first.calibration_was_cached and second.calibration_was_cached
+    assert first.calibration == second.calibration
+    assert first.calibration.serial_seconds_per_sequence > 0
+    predicted = {PacelineProcessingStrategyEnum.SERIAL: first.predicted_seconds_serial, PacelineProcessingStrategyEnum.PARALLEL_CHUNKED: first.predicted_seconds_parallel,
+        PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION: first.predicted_seconds_lockstep}
+    assert predicted[first.processing_strategy] == min(predicted.values())
+
+def test_package_records_the_decision_only_when_it_made_it(ingredients, sequences):
+    try:
+        chosen = generate_package_of_paceline_solutions(ingredients)
+        forced = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL)
+    finally:
+        shutdown_paceline_solver_worker_pool()
+    assert chosen.dispatch_decision is not None and chosen.dispatch_decision.num_sequences == len(sequences)
+    assert forced.dispatch_decision is None
+    assert chosen.hang_in_solution.calculated_average_speed_of_paceline_kph == forced.hang_in_solution.calculated_average_speed_of_paceline_kph
+
+def test_calibrating_times_a_cold_start_but_never_shuts_down_a_warm_pool(ingredients, sequences, tmp_path, monkeypatch):
+    file_path = str(tmp_path / "calibration.json")
+    sample = sequences[:DISPATCH_CALIBRATION_SAMPLE_SIZE]
+    monkeypatch.setattr(paceline_solver_worker_pool, "max_workers", 2)
+    shutdown_paceline_solver_worker_pool()
+    try:
+        starts = paceline_solver_worker_pool.starts
+        cold = measure_paceline_dispatch_calibration(ingredients, sample, file_path)
+        assert paceline_solver_worker_pool.starts == starts + 1 and paceline_solver_worker_pool.is_running
+        assert 0.0 < cold.pool_start_seconds != DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS
+
+        warm = measure_paceline_dispatch_calibration(ingredients, sample, file_path)
+        assert paceline_solver_worker_pool.starts == starts + 1
+        assert warm.pool_start_seconds == DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS
+
+        write_paceline_dispatch_calibration(cold, file_path)
+        warm = measure_paceline_dispatch_calibration(ingredients, sample, file_path)
+        assert paceline_solver_worker_pool.starts == starts + 1
+        assert warm.pool_start_seconds == cold.pool_start_seconds
+    finally:
+        shutdown_paceline_solver_worker_pool()
@@ -0,0 +1,44 @@
+import numpy as np
+from computation_classes import PacelineIngredientsItem
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import (get_numeric_fields_of_riders, make_riders_from_numeric_fields, generate_table_of_paceline_solutions, generate_paceline_solutions_using_serial_processing_algorithm,
+    generate_paceline_solutions_using_parallel_chunked_algorithm, shutdown_paceline_solver_worker_pool)
+from shared_memory_utilities import create_shared_array, attach_shared_array, release_shared_memory
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_riders_rebuilt_from_their_numeric_fields_solve_identically(riders, ingredients, sequences):
+    field_names, values = get_numeric_fields_of_riders(riders)
+    assert "weight_kg" in field_names and "zsun_TTT_pull_curve_exponent" in field_names
+    rebuilt = make_riders_from_numeric_fields(field_names, values)
+    for rider, copy in zip(riders, rebuilt):
+        assert all(getattr(copy, name) == getattr(rider, name) for name in field_names)
+    rebuilt_ingredients = PacelineIngredientsItem(riders_list=rebuilt, sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST, pull_speeds_kph=[30.0] * len(rebuilt), max_exertion_intensity_factor=0.95)
+    expected = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences[:20])
+    actual = generate_paceline_solutions_using_serial_processing_algorithm(rebuilt_ingredients, sequences[:20])
+    assert [report.calculated_average_speed_of_paceline_kph for report in actual] == [report.calculated_average_speed_of_paceline_kph for report in expected]
+
+def test_attached_array_sees_what_the_creator_wrote():
+    block, created = create_shared_array((3, 2), np.float64)
+    try:
+        created[:] = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        other, attached = attach_shared_array(block.name, (3, 2), np.float64)
+        assert np.array_equal(attached, created)
+        del attached
+        release_shared_memory(other)
+    finally:
+        del created
+        release_shared_memory(block, unlink=True)
+
+def test_shared_memory_rows_match_serial_rows(ingredients, sequences):
+    columns = ["rotation_sequence_index", "algorithm_ran_to_completion", "is_valid", "calculated_average_speed_of_paceline_kph", "calculated_dispersion_of_intensity_of_effort",
+        "pull_speed_kph", "compute_iterations_performed_count", "bracketing_iterations_performed_count", "p1_duration", "intensity_factor", "normalized_watts", "average_watts"]
+    try:
+        serial = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.SERIAL)
+        shared = generate_table_of_paceline_solutions(ingredients, sequences, PacelineProcessingStrategyEnum.PARALLEL_SHARED_MEMORY)
+        for column in columns:
+            assert np.array_equal(serial.rows[column], shared.rows[column]), column
+        reports = generate_paceline_solutions_using_parallel_chunked_algorithm(ingredients, sequences, use_shared_memory=True)
+        expected = generate_paceline_solutions_using_serial_processing_algorithm(ingredients, sequences)
+        assert [report.calculated_average_speed_of_paceline_kph for report in reports] == [report.calculated_average_speed_of_paceline_kph for report in expected]
+    finally:
+        shutdown_paceline_solver_worker_pool()
@@ -0,0 +1,90 @@
+import os
+import stat
+import dataclasses
+import pytest
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import generate_package_of_paceline_solutions, make_digest_of_paceline_solver_inputs
+from disk_cache_utilities import ContentAddressedDiskCache, make_stable_digest
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+def test_digest_is_stable_and_sensitive_to_every_input(riders, ingredients):
+    assert make_stable_digest({"b": [1.0, 2], "a": None}) == make_stable_digest({"a": None, "b": [1.0, 2]})
+    digest = make_digest_of_paceline_solver_inputs(ingredients, False)
+    assert digest == make_digest_of_paceline_solver_inputs(dataclasses.replace(ingredients, riders_list=list(riders)), False)
+    variants = [
+        dataclasses.replace(ingredients, riders_list=[riders[1], riders[0], riders[2]]),
+        dataclasses.replace(ingredients, riders_list=[dataclasses.replace(riders[0], weight_kg=76.0), riders[1], riders[2]]),
+        dataclasses.replace(ingredients, riders_list=[riders[0], riders[1], dataclasses.replace(riders[2], zsun_TTT_pull_curve_exponent=0.116)]),
+        dataclasses.replace(ingredients, max_exertion_intensity_factor=0.9),
+        dataclasses.replace(ingredients, sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST[:-1]),
+    ]
+    assert len({digest, make_digest_of_paceline_solver_inputs(ingredients, True), make_digest_of_paceline_solver_inputs(ingredients, False, keep_solutions_table=False), *(make_digest_of_paceline_solver_inputs(v, False) for v in variants)}) == len(variants) + 3
+
+def test_digest_ignores_fields_of_riders_the_solver_does_not_read(riders, ingredients):
+    refreshed = [dataclasses.replace(rider, name=rider.name.upper(), zwift_zrs=123, zwiftracingapp_score=456.0, age_years=50, zwift_ftp=300.0, zsun_when_curves_fitted="2025-01-01") for rider in riders]
+    assert make_digest_of_paceline_solver_inputs(dataclasses.replace(ingredients, riders_list=refreshed), False) == make_digest_of_paceline_solver_inputs(ingredients, False)
+
+def test_cache_evicts_the_least_recently_used_entry_to_stay_under_the_ceiling(tmp_path):
+    payload = b"x" * 1000
+    cache = ContentAddressedDiskCache(str(tmp_path), 2500)
+    assert cache.put("a", payload) and cache.put("b", payload)
+    os.utime(cache.path_of("a"), (1000.0, 1000.0))
+    os.utime(cache.path_of("b"), (2000.0, 2000.0))
+    assert cache.get("a") == payload # now the most recently used
+    assert cache.put("c", payload)
+    assert cache.get("b") is None
+    assert cache.get("a") == payload and cache.get("c") == payload
+    assert cache.size_bytes <= cache.ceiling_bytes and len(cache) == 2
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+    assert not cache.put("d", b"x" * 3000)
+
+def test_corrupt_entry_is_a_miss_and_is_removed(tmp_path):
+    cache = ContentAddressedDiskCache(str(tmp_path), 10_000)
+    with open(cache.path_of("bad"), "wb") as cache_file:
+        cache_file.write(b"not a pickle")
+    assert cache.get("bad") is None
+    assert not os.path.exists(cache.path_of("bad"))
+
+def test_second_run_is_served_from_the_cache_with_the_same_plans(riders, ingredients, tmp_path):
+    cache = ContentAddressedDiskCache(str(tmp_path), 64 * 1024 * 1024)
+    solved = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, solution_cache=cache)
+    assert not solved.served_from_cache and len(cache) == 1
+    served = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, solution_cache=cache)
+    assert served.served_from_cache and cache.hits == 1
+    assert served.guid == solved.guid
+    for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+        expected, actual = getattr(solved, name), getattr(served, name)
+        assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph
+        assert list(actual.rider_contributions.keys()) == riders
+
+def test_refreshed_riders_are_served_from_the_cache_under_their_own_keys(riders, ingredients, tmp_path):
+    cache = ContentAddressedDiskCache(str(tmp_path), 64 * 1024 * 1024)
+    generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, solution_cache=cache)
+    refreshed = [dataclasses.replace(rider, zwiftracingapp_score=789.0) for rider in riders]
+    served = generate_package_of_paceline_solutions(dataclasses.replace(ingredients, riders_list=refreshed), PacelineProcessingStrategyEnum.SERIAL, solution_cache=cache)
+    assert served.served_from_cache
+    for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+        assert list(getattr(served, name).rider_contributions.keys()) == refreshed
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no mode bits or owners to check")
+def test_directory_writable_by_others_is_refused(tmp_path):
+    dir_path = tmp_path / "shared"
+    cache = ContentAddressedDiskCache(str(dir_path), 10_000)
+    assert cache.put("a", b"x") and stat.S_IMODE(os.stat(dir_path).st_mode) & 0o077 == 0
+    os.chmod(dir_path, 0o777)
+    assert not cache.put("b", b"x")
+    assert cache.get("a") is None and cache.hits == 0
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no owners to check")
+def test_directory_owned_by_another_user_is_refused(tmp_path, monkeypatch):
+    cache = ContentAddressedDiskCache(str(tmp_path / "theirs"), 10_000)
+    assert cache.put("a", b"x")
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(tmp_path).st_uid + 1)
+    assert not cache.put("b", b"x")
+    assert cache.get("a") is None
+
+def test_package_cut_short_by_the_time_budget_is_not_cached(ingredients, tmp_path):
+    cache = ContentAddressedDiskCache(str(tmp_path), 64 * 1024 * 1024)
+    package = generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL, time_budget_sec=0.0, solution_cache=cache)
+    assert package.ran_out_of_time
+    assert len(cache) == 0
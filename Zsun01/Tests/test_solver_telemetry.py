@@ -0,0 +1,47 @@
+import logging
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_logging import jgh_stop_logging_queue_listener
+from telemetry_utilities import TelemetryCollector
+from jgh_formulae08 import enable_paceline_solver_telemetry, summarise_paceline_solver_telemetry, generate_package_of_paceline_solutions, shutdown_paceline_solver_worker_pool
+
+def test_summary_adds_up_the_tasks_by_exit_reason_and_worker():
+    telemetry = [
+        {"sequence": (30.0, 60.0), "iterations": 10, "exit_reason": "converged", "wall_time_sec": 0.002, "pid": 1},
+        {"sequence": (60.0, 0.0), "iterations": 12, "exit_reason": "converged", "wall_time_sec": 0.005, "pid": 2},
+        {"sequence": (0.0, 0.0), "iterations": 0, "exit_reason": "exception", "wall_time_sec": 0.001, "pid": 2},
+    ]
+    summary = summarise_paceline_solver_telemetry(telemetry, 4)
+    assert summary.num_tasks == 3 and summary.num_tasks_missing == 1
+    assert summary.num_tasks_by_exit_reason == {"converged": 2, "exception": 1}
+    assert summary.num_tasks_by_worker_pid == {1: 1, 2: 2}
+    assert abs(summary.busy_seconds_by_worker_pid[2] - 0.006) < 1e-12
+    assert summary.total_iterations == 22
+    assert summary.max_wall_time_sec == 0.005 and summary.slowest_sequence == (60.0, 0.0)
+
+def test_collector_keeps_only_records_with_telemetry_and_times_out_waiting_for_more():
+    collector = TelemetryCollector()
+    logger = logging.getLogger("test_solver_telemetry.collector")
+    logger.propagate = False
+    logger.addHandler(collector)
+    logger.warning("no telemetry here")
+    logger.warning("task", extra={"task_telemetry": {"n": 1}})
+    logger.removeHandler(collector)
+    assert collector.telemetry == [{"n": 1}]
+    assert collector.wait_for(1, timeout=0.0)
+    assert not collector.wait_for(2, timeout=0.01)
+
+def test_every_task_of_a_run_is_summarised_whichever_process_ran_it(ingredients):
+    enable_paceline_solver_telemetry()
+    try:
+        for strategy in [PacelineProcessingStrategyEnum.SERIAL, PacelineProcessingStrategyEnum.PARALLEL_CHUNKED]:
+            package = generate_package_of_paceline_solutions(ingredients, strategy)
+            summary = package.telemetry_summary
+            assert summary is not None, strategy
+            assert summary.num_tasks == package.total_pull_sequences_examined and summary.num_tasks_missing == 0, strategy
+            assert summary.total_iterations == package.total_compute_iterations_performed, strategy
+            assert sum(summary.num_tasks_by_exit_reason.values()) == summary.num_tasks, strategy
+    finally:
+        enable_paceline_solver_telemetry(False)
+        shutdown_paceline_solver_worker_pool()
+        jgh_stop_logging_queue_listener()
+    assert generate_package_of_paceline_solutions(ingredients, PacelineProcessingStrategyEnum.SERIAL).telemetry_summary is None
@@ -0,0 +1,20 @@
+import numpy as np
+from jgh_formulae01 import (estimate_watts_from_speed, estimate_speed_from_wattage, estimate_speed_from_wattage_numpy,
+    estimate_speed_from_wattage_using_newton_raphson)
+
+def test_closed_form_inverts_watts_from_speed():
+    for kph in [5.0, 25.0, 38.5, 47.0, 60.0]:
+        for weight, height in [(55.0, 160.0), (75.0, 180.0), (110.0, 200.0)]:
+            watts = estimate_watts_from_speed(kph, weight, height)
+            assert abs(estimate_speed_from_wattage(watts, weight, height) - kph) < 1e-9
+
+def test_closed_form_agrees_with_newton_raphson():
+    for watts in [-100.0, 0.0, 150.0, 400.0, 1500.0]:
+        assert abs(estimate_speed_from_wattage(watts, 75.0, 180.0) - estimate_speed_from_wattage_using_newton_raphson(watts, 75.0, 180.0)) < 1e-6
+
+def test_vectorised_version_falls_back_for_degenerate_riders():
+    watts = np.array([100.0, 300.0, 1.0])
+    weights = np.array([75.0, 80.0, 0.0])  # zero weight has no linear term: degenerate
+    speeds = estimate_speed_from_wattage_numpy(watts, weights, 180.0)
+    expected = [estimate_speed_from_wattage(w, m, 180.0) for w, m in zip(watts, weights)]
+    assert np.allclose(speeds, expected, rtol=1e-12)
@@ -0,0 +1,45 @@
+import itertools
+import math
+import pytest
+from jgh_formulae02 import arrange_riders_in_optimal_order, select_n_strongest_riders, calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation
+from jgh_formulae11 import search_for_fastest_paceline_solutions_by_branch_and_bound
+from jgh_formulae14 import calculate_upper_bound_speeds_of_riders_in_any_squad, calculate_upper_bound_speeds_of_squad, select_best_squads_from_pool_of_riders
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST, SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION
+
+def solve_squad_by_branch_and_bound(squad):
+    riders = arrange_riders_in_optimal_order(list(squad))
+    highest_speed_kph = calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders) + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+    _, fastest_kph, _, everybody_kph, _, _ = search_for_fastest_paceline_solutions_by_branch_and_bound(riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, highest_speed_kph)
+    return everybody_kph, fastest_kph
+
+def test_bounds_of_every_squad_are_no_slower_than_its_plans(five_riders):
+    upper_bound_kph_of_riders = calculate_upper_bound_speeds_of_riders_in_any_squad(prepare_rider_arrays_for_batch_evaluation(five_riders), STANDARD_PULL_PERIODS_SEC_AS_LIST, 0.95, 3)
+    for squad in itertools.combinations(range(len(five_riders)), 3):
+        everybody_bound, fastest_bound = calculate_upper_bound_speeds_of_squad(upper_bound_kph_of_riders, squad)
+        everybody_kph, fastest_kph = solve_squad_by_branch_and_bound([five_riders[i] for i in squad])
+        assert everybody_bound >= everybody_kph and fastest_bound >= fastest_kph and fastest_bound >= everybody_bound
+
+def test_best_squads_agree_with_solving_every_squad(five_riders, ingredients_of_five_riders):
+    expected = sorted((solve_squad_by_branch_and_bound(squad) for squad in itertools.combinations(five_riders, 3)), reverse=True)[:3]
+
+    selection = select_best_squads_from_pool_of_riders(ingredients_of_five_riders, 3, 3)
+
+    assert [(squad.everybody_pulls_kph, squad.fastest_kph) for squad in selection.squads] == expected
+    assert selection.total_squads == math.comb(len(five_riders), 3) and 3 <= selection.squads_solved <= selection.total_squads
+    for squad in selection.squads:
+        assert squad.riders_list == arrange_riders_in_optimal_order(list(squad.riders_list))
+        assert list(squad.fastest_solution.rider_contributions.keys()) == squad.riders_list
+        assert all(contribution.p1_duration != 0 for contribution in squad.everybody_pulls_solution.rider_contributions.values())
+
+def test_strongest_squad_is_reported_to_compare(five_riders, ingredients_of_five_riders):
+    selection = select_best_squads_from_pool_of_riders(ingredients_of_five_riders, 3, 1)
+    strongest = select_n_strongest_riders(list(five_riders), 3)
+    assert sorted(rider.zwift_id for rider in selection.strongest_squad.riders_list) == sorted(rider.zwift_id for rider in strongest)
+    assert (selection.strongest_squad.everybody_pulls_kph, selection.strongest_squad.fastest_kph) == solve_squad_by_branch_and_bound(strongest)
+    best = selection.squads[0]
+    assert selection.strongest_squad_is_best == ((selection.strongest_squad.everybody_pulls_kph, selection.strongest_squad.fastest_kph) >= (best.everybody_pulls_kph, best.fastest_kph))
+
+def test_squad_bigger_than_the_pool_is_refused(five_riders, ingredients_of_five_riders):
+    with pytest.raises(ValueError):
+        select_best_squads_from_pool_of_riders(ingredients_of_five_riders, len(five_riders) + 1)
@@ -0,0 +1,57 @@
+import dataclasses
+import pytest
+import numpy as np
+from zsun_rider_item import ZsunItem
+from jgh_enums import PacelineProcessingStrategyEnum
+from jgh_formulae08 import generate_package_of_paceline_solutions
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, identify_binding_constraints_of_rotation_sequences, calculate_binding_speeds_of_rotation_sequences
+from jgh_formulae12 import make_paceline_what_if_baseline, resolve_paceline_solutions_after_rider_edit
+
+@pytest.fixture
+def stronger_weak_rider(riders):
+    return dataclasses.replace(riders[2], zsun_one_hour_curve_coefficient=480.0 * 1.05, zsun_TTT_pull_curve_coefficient=470.0 * 1.05)
+
+substitute_rider = ZsunItem(zwift_id="4", name="substitute", weight_kg=68.0, height_cm=172.0, zsun_one_hour_curve_coefficient=530.0, zsun_one_hour_curve_exponent=0.113, zsun_TTT_pull_curve_coefficient=515.0, zsun_TTT_pull_curve_exponent=0.108)
+
+columns_decided_by_the_inputs = ["rotation_sequence_index", "algorithm_ran_to_completion", "is_valid", "calculated_average_speed_of_paceline_kph", "calculated_dispersion_of_intensity_of_effort",
+    "pull_speed_kph", "compute_iterations_performed_count", "bracketing_iterations_performed_count", "p1_duration", "intensity_factor", "normalized_watts", "average_watts"]
+
+def assert_same_as_a_full_run(what_if, strategy):
+    full = generate_package_of_paceline_solutions(what_if.paceline_ingredients, strategy)
+    for column in columns_decided_by_the_inputs:
+        assert np.array_equal(what_if.package.solutions_table.rows[column], full.solutions_table.rows[column]), column
+    for name in ["thirty_sec_solution", "sixty_sec_solution", "balanced_intensity_of_effort_solution", "everybody_pull_hard_solution", "hang_in_solution"]:
+        expected, actual = getattr(full, name), getattr(what_if.package, name)
+        assert actual.rotation_sequence_index == expected.rotation_sequence_index
+        assert actual.calculated_average_speed_of_paceline_kph == expected.calculated_average_speed_of_paceline_kph
+
+def test_binding_rider_is_the_one_whose_effort_binds_least(riders):
+    sequences = np.array([[300.0, 60.0, 30.0], [30.0, 0.0, 240.0], [0.0, 0.0, 0.0]])
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    binding_speeds_kph, binding_rider_index, _ = identify_binding_constraints_of_rotation_sequences(rider_arrays, sequences, 0.95)
+    assert np.array_equal(binding_speeds_kph.min(axis=1), calculate_binding_speeds_of_rotation_sequences(rider_arrays, sequences, 0.95))
+    assert binding_rider_index[2] == -1
+    assert np.array_equal(binding_rider_index[:2], np.argmin(binding_speeds_kph[:2], axis=1))
+    assert np.isinf(binding_speeds_kph[1, 1])
+
+def test_stronger_rider_gives_the_plans_of_a_full_run_solving_only_some_sequences(riders, ingredients, stronger_weak_rider):
+    baseline = make_paceline_what_if_baseline(ingredients, PacelineProcessingStrategyEnum.SERIAL)
+    what_if = resolve_paceline_solutions_after_rider_edit(baseline, 2, stronger_weak_rider)
+    assert what_if.paceline_ingredients.riders_list == [riders[0], riders[1], stronger_weak_rider]
+    assert what_if.total_pull_sequences_carried_over > 0 and what_if.total_pull_sequences_resolved > 0
+    assert what_if.total_pull_sequences_carried_over + what_if.total_pull_sequences_resolved == len(what_if.rotation_sequences)
+    assert_same_as_a_full_run(what_if, PacelineProcessingStrategyEnum.SERIAL)
+
+def test_substitute_rider_and_edits_upon_edits_give_the_plans_of_a_full_run_in_lockstep(ingredients, stronger_weak_rider):
+    baseline = make_paceline_what_if_baseline(ingredients, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+    what_if = resolve_paceline_solutions_after_rider_edit(baseline, 1, substitute_rider)
+    assert_same_as_a_full_run(what_if, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+    what_if = resolve_paceline_solutions_after_rider_edit(what_if, 2, stronger_weak_rider)
+    assert_same_as_a_full_run(what_if, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+
+def test_edit_that_changes_no_constraint_solves_nothing(riders, ingredients):
+    baseline = make_paceline_what_if_baseline(ingredients, PacelineProcessingStrategyEnum.SERIAL)
+    what_if = resolve_paceline_solutions_after_rider_edit(baseline, 0, dataclasses.replace(riders[0], name="renamed"))
+    assert what_if.total_pull_sequences_resolved == 0
+    assert what_if.package.hang_in_solution.rider_contributions.keys() == set(what_if.paceline_ingredients.riders_list)
+    assert_same_as_a_full_run(what_if, PacelineProcessingStrategyEnum.SERIAL)
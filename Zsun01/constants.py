@@ -26,9 +26,52 @@ REQUIRED_PRECISION_OF_SPEED = 0.01 # The desired precision for the speed binary
 MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION = 30 # Having applied SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH Maximum allowable number of iterations for the binary search to find a constraint-busting speed. This is an arbitrary limit chosen to prevent the search from running indefinitely. The algorithm typically takes 10 iterations when commencing from a safe starting base.
 
 
-SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD = 512 # Below this threshold, serial-processing is faster than parallel-processing.Above this threshold, parallel-processing is faster. The threshold is empirically determined and might be different on different machines with different number physicaland virtual cores. see main01() in formula08.py for details of the determination.
+SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD = 512 # Below this threshold, serial-processing is faster than parallel-processing.Above this threshold, parallel-processing is faster. The threshold is empirically determined and might be different on different machines with different number physicaland virtual cores. see main01() in formula08.py for details of the determination. No longer consulted by the dispatcher, which now calibrates itself on each host (see choose_paceline_processing_strategy() in jgh_formulae08.py).
 
 ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL = 1000 # Emprically researched. See main01() in formula08.py for details of the determination. The sweet zone is 1,000 - 2,500, which keeps compute time within a 7 - 14sec time-frame for up to 6 riders. This constant is an aspirational  target. If the solution space is smaller than 1,000, we do not prune it. We use brute force to analyse and solve the solution space without compromise. If the solution space is more than 1,000, we throw the pruning algorithm at it. The algorithm breaks as soon as the pruned space dips below 1,000. if the algorithm goes all the way and the solution space is still more than 1,000, that's the end of the story. We analyse the space that remains, no matter how time-consuming. The Cartesian cross product of eight riders and seven pull sequences generates a solution space of 5.76 million which takes literally days to compute. The algorithm prunes this down to 3,003 which is maneageble (39sec compute time). 
 
 
 
+NORMALIZED_WATTS_ROLLING_WINDOW_SEC = 5 # Rolling window for normalized watts. TrainingPeaks uses 30 seconds, but our pulls can be as short as 30 seconds, so we use an (arbitrary) 5 seconds. Changing it changes every intensity factor in the system.
+
+
+GALLOPING_SEARCH_INITIAL_STEP_KPH = 0.5 # When a per-sequence speed bracket derived from the pullers' caps turns out to be loose (its upper end is not yet in violation), the upper end is pushed out by this step, doubling each time, until a violation is found. Small, because the derived bracket is almost always right.
+
+
+EXERTION_FRAGMENT_MEMO_CEILING_MB = 32 # Memory ceiling of the memo of speed-normalised average and normalized watts kept by populate_rider_contributions(). Each process, including each worker of a process pool, keeps its own memo, so the total is this times the number of workers. Zero disables the memo.
+
+
+ROTATION_SEQUENCE_UNIVERSE_ROWS_PER_CHUNK = 262_144 # Rows of the Cartesian product of riders and pull periods generated at a time when the universe is streamed for pruning. Bounds peak memory at some 40MB per block for nine riders, however many riders there are.
+
+
+RANKED_ROWS_PER_BLOCK = 32_768 # Rows of pull period sequences ranked and filtered at a time when pruning an array of them. Small enough for the temporaries to stay in cache, which is several times faster than working on the whole array at once.
+
+
+MIN_SEQUENCES_PER_PARALLEL_CHUNK = 64 # Fewest rotation sequences sent to a worker in one task by the chunked parallel strategy, other than the last few. Fewer and the cost of a round trip to the worker starts to show.
+
+
+MAX_SEQUENCES_PER_PARALLEL_CHUNK = 512 # Most rotation sequences sent to a worker in one task by the chunked parallel strategy. More and workers sit idle at the end waiting for the last big chunk.
+
+
+TARGET_SECONDS_PER_PARALLEL_CHUNK = 0.25 # The chunked parallel strategy sizes its chunks, between the two limits above, to take about this long to solve, going by the sequences solved so far.
+
+
+DISPATCH_CALIBRATION_SAMPLE_SIZE = 32 # Rotation sequences solved serially, and by lock-step bisection, to measure what each costs on this host when the dispatcher calibrates itself. Batches smaller than this are solved serially without calibrating.
+
+
+DISPATCH_CALIBRATION_FILE_NAME = "paceline_dispatch_calibration.json" # Where the dispatcher caches its calibrations, in the user's own cache directory (see get_user_cache_dirpath() in disk_cache_utilities), so no other user can plant or overwrite them, one per host, start method, number of workers, number of riders and solver engine. Delete the file to recalibrate.
+
+
+DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS = 2.0 # What the dispatcher takes starting the worker pool to cost when it calibrates itself while the pool is already running, and no calibration of this host, start method and number of workers has measured it. The running pool is not shut down to be timed. Generous on purpose, so that a parallel run is not chosen on the strength of a guess.
+
+
+ANYTIME_SOLVER_FIRST_BATCH_SIZE = 64 # Rotation sequences solved in the first batch when planning against a time budget, always solved however short the time. Later batches are up to twice the size of the one before, as time allows.
+
+
+PACELINE_SOLUTION_CACHE_VERSION = 1 # Part of the key of every cached package of paceline solutions. Bump it whenever a change to the code of the solver changes its answers, so that packages solved by the old code are never served again.
+
+
+PACELINE_SOLUTION_CACHE_DIR_NAME = "paceline_solution_cache" # Where solved packages of paceline solutions are cached, in the user's own cache directory (see get_user_cache_dirpath() in disk_cache_utilities), one file per digest of the inputs. Delete the directory to empty the cache.
+
+
+PACELINE_SOLUTION_CACHE_CEILING_MB = 256 # Most disk space the cache of solved packages may take. Past this the least recently used packages are deleted.
@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 import uuid
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Callable, Tuple, Dict
 from dataclasses import dataclass, field
 from typing import DefaultDict, Optional
 from collections import defaultdict
+import numpy as np
+from numpy.typing import NDArray
 from zsun_rider_item import ZsunItem
+from jgh_enums import PacelineSolverEngineEnum, PacelineProcessingStrategyEnum
 
 @dataclass
 class CurveFittingResultItem:
@@ -50,12 +53,57 @@ class RiderContributionItem():
     intensity_factor      : float = 0.0
     effort_constraint_violation_reason : str = ""
 
+@dataclass(frozen=True, eq=True, slots=True)
+class RiderPowerProfileItem:
+    """
+    Everything the paceline solver needs to know about a rider's power, evaluated once.
+    The ZsunItem getters evaluate the fitted power curves afresh on every call. Here the
+    answers for all the standard pull periods are frozen into plain floats, which are
+    cheap to read and pickle compactly to worker processes.
+    """
+    zwift_id         : str                = ""
+    weight_kg        : float              = 0.0
+    height_cm        : float              = 0.0
+    one_hour_watts   : float              = 0.0
+    strength_wkg     : float              = 0.0
+    pull_periods_sec : tuple[float, ...]  = ()    # STANDARD_PULL_PERIODS_SEC_AS_LIST
+    pull_watts_caps  : tuple[float, ...]  = ()    # permissible pull watts for each of pull_periods_sec
+    c1               : float              = 0.0   # linear coefficient of watts-from-speed (see estimate_watts_from_speed)
+    c2               : float              = 0.0   # cubic coefficient, rider independent
+    c3               : float              = 0.0   # cubic coefficient, weight dependent
+    c4               : float              = 0.0   # cubic coefficient, height dependent
+
+    @staticmethod
+    def from_ZsunItem(rider: ZsunItem, pull_periods_sec: List[float]) -> 'RiderPowerProfileItem':
+        periods = tuple(float(period) for period in pull_periods_sec)
+        return RiderPowerProfileItem(
+            zwift_id         = rider.zwift_id,
+            weight_kg        = rider.weight_kg,
+            height_cm        = rider.height_cm,
+            one_hour_watts   = float(rider.get_one_hour_watts()),
+            strength_wkg     = float(rider.get_strength_wkg()),
+            pull_periods_sec = periods,
+            pull_watts_caps  = tuple(float(rider.get_standard_pull_watts(period)) for period in periods),
+            c1               = 1.86e-02 * rider.weight_kg,
+            c2               = -5.37e-04,
+            c3               = 2.23e-05 * rider.weight_kg,
+            c4               = 1.33e-05 * rider.height_cm,
+        )
+
+    def get_standard_pull_watts(self, seconds: float) -> float:
+        # same semantics as ZsunItem.get_standard_pull_watts(): anything non-standard defaults to one-hour watts
+        for period, watts in zip(self.pull_periods_sec, self.pull_watts_caps):
+            if seconds == period:
+                return watts
+        return self.one_hour_watts
+
 @dataclass
 class PacelineIngredientsItem:
     riders_list                  : List[ZsunItem] = field(default_factory=list)
     sequence_of_pull_periods_sec : List[float]         = field(default_factory=list)
     pull_speeds_kph              : List[float]         = field(default_factory=list)
     max_exertion_intensity_factor: float               = 0.95 # Default to 95% of one hour power, can be overridden by caller
+    solver_engine                : PacelineSolverEngineEnum = PacelineSolverEngineEnum.BINARY_SEARCH # Engine used to find the speed of each sequence
 
 @dataclass
 class PacelineComputationReportItem:
@@ -66,12 +114,135 @@ class PacelineComputationReportItem:
     calculated_average_speed_of_paceline_kph    : float = 0.0
     calculated_dispersion_of_intensity_of_effort : float = 0.0
     rider_contributions                         : DefaultDict[ZsunItem, RiderContributionItem] = field(default_factory=lambda: defaultdict(RiderContributionItem))
+    bracketing_iterations_performed_count       : int   = 0   # the part of compute_iterations_performed_count spent finding a speed bracket before bisecting it
+    computational_time                          : float = 0.0 # seconds spent on this sequence
+    exertion_memo_hits_count                    : int   = 0   # lookups of exertion_fragment_memo in jgh_formulae06 that were answered
+    exertion_memo_misses_count                  : int   = 0
+    rotation_sequence_index                     : int   = -1  # position of the sequence among the alternatives it was solved with
+
+@dataclass
+class PacelineSolutionsTable:
+    """
+    Every solution of a planning run, column by column, in a NumPy structured array with one
+    row per rotation sequence in the order the sequences were given. The scalar columns are
+    named after the fields of PacelineComputationReportItem and the (riders,) columns after
+    those of RiderContributionItem, in the order of the riders in the paceline. pull_speed_kph
+    is the speed the contributions were worked out at, so that the RiderContributionItems of
+    any row can be rebuilt on demand rather than kept for every row. Rows of sequences that
+    were never solved hold NaN speeds and are not valid.
+    """
+    rows                          : NDArray[np.void] = field(default_factory=lambda: np.zeros(0, dtype=PacelineSolutionsTable.make_dtype(0)))
+    max_exertion_intensity_factor : float = 0.95
+
+    @staticmethod
+    def make_dtype(num_riders: int) -> np.dtype:
+        return np.dtype([
+            ("rotation_sequence_index",                      np.int32),
+            ("algorithm_ran_to_completion",                  np.bool_),
+            ("is_valid",                                     np.bool_),
+            ("calculated_average_speed_of_paceline_kph",     np.float64),
+            ("calculated_dispersion_of_intensity_of_effort", np.float64),
+            ("pull_speed_kph",                               np.float64),
+            ("compute_iterations_performed_count",           np.int32),
+            ("bracketing_iterations_performed_count",        np.int32),
+            ("exertion_memo_hits_count",                     np.int64),
+            ("exertion_memo_misses_count",                   np.int64),
+            ("computational_time",                           np.float64),
+            ("p1_duration",                                  np.float64, (num_riders,)),
+            ("intensity_factor",                             np.float64, (num_riders,)),
+            ("normalized_watts",                             np.float64, (num_riders,)),
+            ("average_watts",                                np.float64, (num_riders,)),
+        ])
+
+    @classmethod
+    def allocate(cls, num_sequences: int, num_riders: int, max_exertion_intensity_factor: float) -> "PacelineSolutionsTable":
+        rows = np.zeros(num_sequences, dtype=cls.make_dtype(num_riders))
+        rows["rotation_sequence_index"] = np.arange(num_sequences)
+        rows["calculated_average_speed_of_paceline_kph"] = np.nan
+        rows["calculated_dispersion_of_intensity_of_effort"] = np.nan
+        return cls(rows=rows, max_exertion_intensity_factor=max_exertion_intensity_factor)
+
+    @property
+    def num_riders(self) -> int:
+        return self.rows.dtype["p1_duration"].shape[0]
+
+    def save_to_npz(self, file_path: str) -> None:
+        np.savez_compressed(file_path, rows=self.rows, max_exertion_intensity_factor=self.max_exertion_intensity_factor)
+
+    @classmethod
+    def read_from_npz(cls, file_path: str) -> "PacelineSolutionsTable":
+        with np.load(file_path, allow_pickle=False) as archive:
+            return cls(rows=archive["rows"], max_exertion_intensity_factor=float(archive["max_exertion_intensity_factor"]))
+
+@dataclass(frozen=True)
+class PacelineSharedMemoryBlocksItem:
+    """
+    Where the workers of the shared memory parallel strategy find a batch: the names of its
+    shared memory blocks and the few scalars every sequence shares. Small enough to go with
+    every task. The rider parameters are the numeric fields of each ZsunItem, named in
+    rider_parameter_fields, from which the workers rebuild the riders.
+    """
+    rotation_sequences_name       : str   = ""    # (sequences, riders) float64 pull periods
+    rider_parameters_name         : str   = ""    # (riders, fields) float64
+    solutions_name                : str   = ""    # (sequences,) rows of a PacelineSolutionsTable, written by the workers
+    num_sequences                 : int   = 0
+    num_riders                    : int   = 0
+    rider_parameter_fields        : Tuple[str, ...] = ()
+    pull_speed_kph                : float = 0.0
+    max_exertion_intensity_factor : float = 0.95
+    solver_engine                 : PacelineSolverEngineEnum = PacelineSolverEngineEnum.BINARY_SEARCH
+
+@dataclass(frozen=True)
+class PacelineDispatchCalibrationItem:
+    """
+    What solving costs on this host, measured on a sample of rotation sequences, from which the
+    dispatcher predicts the time each processing strategy would take. The figures hold for the
+    host, start method, number of workers, number of riders and solver engine named in key.
+    """
+    key                            : str   = ""
+    num_workers                    : int   = 1
+    serial_seconds_per_sequence    : float = 0.0
+    lockstep_fixed_seconds         : float = 0.0   # cost of a lock-step batch, however few its sequences
+    lockstep_seconds_per_sequence  : float = 0.0
+    pool_start_seconds             : float = 0.0   # starting the worker pool until every worker is ready. Zero if one worker
+    parallel_task_overhead_seconds : float = 0.0   # round trip of an empty task to a worker. Zero if one worker
+    when_calibrated                : str   = ""
+
+@dataclass(frozen=True)
+class PacelineDispatchDecisionItem:
+    processing_strategy           : PacelineProcessingStrategyEnum = PacelineProcessingStrategyEnum.SERIAL
+    num_sequences                 : int   = 0
+    predicted_seconds_serial      : float = 0.0
+    predicted_seconds_parallel    : float = 0.0   # infinite if not a contender
+    predicted_seconds_lockstep    : float = 0.0   # infinite if not a contender
+    calibration                   : Union[PacelineDispatchCalibrationItem, None] = None # None if too few sequences to be worth calibrating
+    calibration_was_cached        : bool  = False
+
+@dataclass(frozen=True)
+class PacelineSolverTelemetrySummaryItem:
+    """
+    The per-task telemetry of a planning run, summed up. A task is the solving of one rotation
+    sequence by generate_a_single_paceline_solution(), in whichever process it ran.
+    """
+    num_tasks                     : int   = 0
+    num_tasks_by_exit_reason      : Dict[str, int]   = field(default_factory=dict) # converged, did_not_converge or exception
+    num_tasks_by_worker_pid       : Dict[int, int]   = field(default_factory=dict)
+    busy_seconds_by_worker_pid    : Dict[int, float] = field(default_factory=dict)
+    total_iterations              : int   = 0
+    total_wall_time_sec           : float = 0.0
+    mean_wall_time_sec            : float = 0.0
+    max_wall_time_sec             : float = 0.0
+    slowest_sequence              : Tuple[float, ...] = ()
+    num_tasks_missing             : int   = 0     # tasks whose telemetry had not arrived when the run ended
 
 @dataclass
 class PackageOfPacelineComputationReportItem:
     guid                                  : str = field(default_factory=lambda: str(uuid.uuid4()))
     total_pull_sequences_examined         : int   = 0
     total_compute_iterations_performed    : int   = 0
+    total_bracketing_iterations_performed : int   = 0
+    total_exertion_memo_hits              : int   = 0
+    total_exertion_memo_misses            : int   = 0
     computational_time                    : float = 0.0
     thirty_sec_solution                   : Union[PacelineComputationReportItem, None] = None
     sixty_sec_solution                    : Union[PacelineComputationReportItem, None] = None
@@ -79,6 +250,82 @@ class PackageOfPacelineComputationReportItem:
     everybody_pull_hard_solution          : Union[PacelineComputationReportItem, None] = None
     hang_in_solution                      : Union[PacelineComputationReportItem, None] = None
     all_solutions                         : Union[List[PacelineComputationReportItem], None] = None
+    solutions_table                       : Union[PacelineSolutionsTable, None] = None
+    dispatch_decision                     : Union[PacelineDispatchDecisionItem, None] = None # None if the caller chose the strategy
+    ran_out_of_time                       : bool  = False # the time budget ran out before every sequence was solved, so the solutions are the best found in time
+    total_pull_sequences_unevaluated      : int   = 0     # sequences never solved for want of time
+    telemetry_summary                     : Union[PacelineSolverTelemetrySummaryItem, None] = None # None unless telemetry is enabled
+    served_from_cache                     : bool  = False # the package was solved on an earlier run and read back from the cache of solved packages
+
+@dataclass
+class PacelineWhatIfBaselineItem:
+    """
+    A solved package and what is needed to solve it again cheaply after an edit to one rider: the rotation
+    sequences it was solved over, in the order of the rows of its solutions table, and per sequence the
+    speed at which each rider's effort binds and which rider and constraint binds first.
+    """
+    paceline_ingredients               : PacelineIngredientsItem = field(default_factory=PacelineIngredientsItem)
+    processing_strategy                : PacelineProcessingStrategyEnum = PacelineProcessingStrategyEnum.SERIAL
+    package                            : Union[PackageOfPacelineComputationReportItem, None] = None
+    rotation_sequences                 : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0), dtype=np.float64))
+    binding_speeds_kph                 : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0), dtype=np.float64)) # (sequences x riders), infinite for riders who do not pull
+    binding_rider_index                : NDArray[np.int32]   = field(default_factory=lambda: np.zeros(0, dtype=np.int32))        # -1 where nobody's effort binds
+    binding_constraint_is_pull_watts   : NDArray[np.bool_]   = field(default_factory=lambda: np.zeros(0, dtype=np.bool_))       # else the intensity constraint binds
+    total_pull_sequences_carried_over  : int = 0 # of the edit that made this baseline: sequences whose speed could not have changed, so were not solved again
+    total_pull_sequences_resolved      : int = 0 # of the edit that made this baseline: sequences solved again, or for the first time
+
+@dataclass
+class PacelineRotationOrderSearchItem:
+    """
+    The fastest plans found by searching over the order of the riders in the paceline as well as
+    over their pull periods, alongside what the order handed in (usually the heuristic order of
+    arrange_riders_in_optimal_order()) achieves. The first rider is the same in every order.
+    """
+    heuristic_riders_list              : List[ZsunItem] = field(default_factory=list)
+    fastest_riders_list                : List[ZsunItem] = field(default_factory=list) # the order of the fastest plan
+    fastest_solution                   : Union[PacelineComputationReportItem, None] = None
+    everybody_pulls_riders_list        : List[ZsunItem] = field(default_factory=list) # the order of the fastest plan in which everybody pulls
+    everybody_pulls_solution           : Union[PacelineComputationReportItem, None] = None
+    heuristic_fastest_kph              : float = 0.0 # binding speeds of the best sequences in the heuristic order
+    heuristic_everybody_pulls_kph      : float = 0.0
+    fastest_kph                        : float = 0.0 # binding speeds of the best sequences in any order explored
+    everybody_pulls_kph                : float = 0.0
+    heuristic_order_is_optimal         : bool  = False # no order explored beat the heuristic order in either category
+    total_rotation_orders              : int   = 0 # distinct orders with the first rider fixed, (n-1)!
+    rotation_orders_explored           : int   = 0 # fewer than total_rotation_orders if capped
+    total_nodes_visited                : int   = 0
+    total_leaves_scored                : int   = 0
+    computational_time                 : float = 0.0
+
+@dataclass
+class PacelineSquadItem:
+    """
+    A squad picked from a larger pool of riders, in the order of arrange_riders_in_optimal_order(),
+    with its fastest plan and its fastest plan in which everybody pulls.
+    """
+    riders_list                        : List[ZsunItem] = field(default_factory=list)
+    fastest_kph                        : float = 0.0 # binding speeds of the best sequences
+    everybody_pulls_kph                : float = 0.0
+    fastest_kph_upper_bound            : float = 0.0 # the cheap bounds the squad was ranked by before it was solved
+    everybody_pulls_kph_upper_bound    : float = 0.0
+    fastest_solution                   : Union[PacelineComputationReportItem, None] = None
+    everybody_pulls_solution           : Union[PacelineComputationReportItem, None] = None
+
+@dataclass
+class PacelineSquadSelectionItem:
+    """
+    The best squads of a given size from a pool of riders, best first: fastest plan in which
+    everybody pulls first, and where that ties, fastest plan. Alongside is the squad of the
+    strongest riders, as picked by select_n_strongest_riders(), to compare.
+    """
+    squads                             : List[PacelineSquadItem] = field(default_factory=list)
+    strongest_squad                    : Union[PacelineSquadItem, None] = None
+    strongest_squad_is_best            : bool  = False # no squad beat the squad of the strongest riders
+    total_squads                       : int   = 0 # every way of picking the squad from the pool
+    squads_solved                      : int   = 0 # the rest could not have made the list on their bounds alone
+    total_nodes_visited                : int   = 0
+    total_leaves_scored                : int   = 0
+    computational_time                 : float = 0.0
 
 @dataclass
 class WorthyCandidateSolutionItem:
@@ -86,3 +333,59 @@ class WorthyCandidateSolutionItem:
     speed_kph  : float                                = float('-inf')
     dispersion : float                                = float('inf')
     solution   : Optional[PacelineComputationReportItem]  = None
+
+@dataclass
+class CandidateSolutionReducerItem:
+    """
+    Picks the best solution of one plan category as solutions stream past, holding on to
+    no more than top_k of them, best first. is_candidate is the category's test of whether
+    a solution beats a WorthyCandidateSolutionItem (see is_*_candidate in jgh_formulae08).
+    With top_k = 1 the outcome is that of testing every solution against the candidate in turn.
+    """
+    candidate     : WorthyCandidateSolutionItem
+    is_candidate  : Callable[[PacelineComputationReportItem, WorthyCandidateSolutionItem], bool]
+    top_k         : int = 1
+    best_solutions: List[PacelineComputationReportItem] = field(default_factory=list)
+
+    def consume(self, solution: PacelineComputationReportItem) -> None:
+        if self.is_candidate(solution, self.candidate):
+            self.best_solutions.insert(0, solution)
+            self.candidate.speed_kph  = solution.calculated_average_speed_of_paceline_kph
+            self.candidate.dispersion = solution.calculated_dispersion_of_intensity_of_effort
+            self.candidate.solution   = solution
+        else:
+            for idx in range(1, len(self.best_solutions)):
+                if self.is_candidate(solution, self.as_candidate(self.best_solutions[idx])):
+                    self.best_solutions.insert(idx, solution)
+                    break
+            else:
+                if len(self.best_solutions) < self.top_k and self.is_candidate(solution, WorthyCandidateSolutionItem(tag=self.candidate.tag)):
+                    self.best_solutions.append(solution)
+
+        del self.best_solutions[self.top_k:]
+
+    def as_candidate(self, solution: PacelineComputationReportItem) -> WorthyCandidateSolutionItem:
+        return WorthyCandidateSolutionItem(
+            tag        = self.candidate.tag,
+            speed_kph  = solution.calculated_average_speed_of_paceline_kph,
+            dispersion = solution.calculated_dispersion_of_intensity_of_effort,
+            solution   = solution)
+
+@dataclass(frozen=True)
+class PacelineBatchRiderArraysItem:
+    weight_kg        : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))     # (riders,) weight of each rider
+    height_cm        : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))     # (riders,) height of each rider
+    one_hour_watts   : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))     # (riders,) denominator of the intensity factor
+    pull_periods_sec : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))     # (periods,) sorted standard pull periods
+    pull_watts_caps  : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 1))) # (riders, periods+1) permissible pull watts, last column for non-standard periods
+
+@dataclass
+class PacelineBatchEvaluationItem:
+    average_speed_of_paceline_kph     : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))      # (sequences,)
+    pull_watts                        : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0))) # (sequences, riders) watts at the front
+    average_watts                     : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0))) # (sequences, riders)
+    normalized_watts                  : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0))) # (sequences, riders)
+    intensity_factor                  : NDArray[np.float64] = field(default_factory=lambda: np.zeros((0, 0))) # (sequences, riders)
+    effort_constraint_violations      : NDArray[np.bool_]   = field(default_factory=lambda: np.zeros((0, 0), dtype=bool)) # (sequences, riders)
+    any_effort_constraint_violated    : NDArray[np.bool_]   = field(default_factory=lambda: np.zeros(0, dtype=bool))      # (sequences,)
+    dispersion_of_intensity_of_effort : NDArray[np.float64] = field(default_factory=lambda: np.zeros(0))      # (sequences,) 100 where nobody pulls
@@ -217,7 +217,13 @@ class PackageOfPacelineComputationReportDisplayObject:
     caption                            : str = ""
     total_pull_sequences_examined      : int = 0
     total_compute_iterations_performed : int = 0
+    total_bracketing_iterations_performed : int = 0
+    total_exertion_memo_hits           : int = 0
+    total_exertion_memo_misses         : int = 0
     computational_time                 : float = 0.0
+    ran_out_of_time                    : bool = False
+    total_pull_sequences_unevaluated   : int = 0
+    served_from_cache                  : bool = False
     solutions                          : DefaultDict[PacelinePlanTypeEnum, PacelineComputationReportDisplayObject] = field(default_factory=lambda: defaultdict(PacelineComputationReportDisplayObject))
 
     @staticmethod
@@ -243,7 +249,13 @@ class PackageOfPacelineComputationReportDisplayObject:
         return PackageOfPacelineComputationReportDisplayObject(
             total_pull_sequences_examined      = report.total_pull_sequences_examined,
             total_compute_iterations_performed = report.total_compute_iterations_performed,
+            total_bracketing_iterations_performed = report.total_bracketing_iterations_performed,
+            total_exertion_memo_hits           = report.total_exertion_memo_hits,
+            total_exertion_memo_misses         = report.total_exertion_memo_misses,
             computational_time                 = report.computational_time,
+            ran_out_of_time                    = report.ran_out_of_time,
+            total_pull_sequences_unevaluated   = report.total_pull_sequences_unevaluated,
+            served_from_cache                  = report.served_from_cache,
             solutions                          = solutions,
         )
     
@@ -10,3 +10,17 @@ class PacelinePlanTypeEnum(Enum):
     LAST_FIVE = "last_five"
     LAST_FOUR = "last_four"
 
+
+class PacelineSolverEngineEnum(Enum):
+    BINARY_SEARCH = "binary_search"
+    VECTORIZED_BINARY_SEARCH = "vectorized_binary_search"
+    ANALYTIC_BINDING_SPEED = "analytic_binding_speed"
+    BOUND_INFORMED_BINARY_SEARCH = "bound_informed_binary_search"
+
+
+class PacelineProcessingStrategyEnum(Enum):
+    SERIAL = "serial"
+    PARALLEL_WORKSTEALING = "parallel_workstealing"
+    PARALLEL_CHUNKED = "parallel_chunked"
+    PARALLEL_SHARED_MEMORY = "parallel_shared_memory"
+    LOCKSTEP_BATCHED_BISECTION = "lockstep_batched_bisection"
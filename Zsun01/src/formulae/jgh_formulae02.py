@@ -1,24 +1,40 @@
-from typing import  List, DefaultDict, Tuple
+from typing import  List, DefaultDict, Tuple, Iterator, Optional
 import time
+from functools import lru_cache
 from typing import List
 import numpy as np
 from numpy.typing import NDArray
-from constants import ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL
+from constants import ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL, ROTATION_SEQUENCE_UNIVERSE_ROWS_PER_CHUNK, RANKED_ROWS_PER_BLOCK, NORMALIZED_WATTS_ROLLING_WINDOW_SEC, STANDARD_PULL_PERIODS_SEC_AS_LIST
 from jgh_number import safe_divide
 from rolling_average import calculate_rolling_averages
 from jgh_formatting import truncate 
-from jgh_formulae01 import estimate_speed_from_wattage, estimate_watts_from_speed, estimate_drag_ratio_in_paceline
+from jgh_formulae01 import estimate_speed_from_wattage, estimate_watts_from_speed, estimate_drag_ratio_in_paceline, estimate_speed_from_wattage_numpy
 from zsun_rider_item import ZsunItem
-from computation_classes import RiderContributionItem, RiderExertionItem
+from computation_classes import RiderContributionItem, RiderExertionItem, RiderPowerProfileItem
 import logging
 logger = logging.getLogger(__name__)
 
 # All of these functions are called during parallel processing. Logging forbidden
 
+@lru_cache(maxsize=1024)
+def get_rider_power_profile(rider : ZsunItem) -> RiderPowerProfileItem:
+    """
+    Get the power profile of a rider, evaluating the rider's power curves only the 
+    first time the rider is seen by this process. ZsunItem is frozen and hashable, 
+    so it serves as the cache key. Each worker process builds its own cache.
+
+    Args:
+    rider (ZsunItem): The rider.
+
+    Returns:
+    RiderPowerProfileItem: The rider's pull caps, one-hour watts and physics constants.
+    """
+    return RiderPowerProfileItem.from_ZsunItem(rider, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+
 def calculate_kph_riding_alone(rider : ZsunItem, power: float) -> float:
     """
     Estimate the speed (km/h) given the power (wattage), weight_kg (kg), and 
-    height_cm (cm) using the Newton-Raphson method.
+    height_cm (cm) by solving the cubic of estimate_watts_from_speed() in closed form.
 
     Args:
     power (float): The power in watts.
@@ -209,7 +225,7 @@ def calculate_overall_normalized_watts(efforts: List[RiderExertionItem]) -> floa
 
     1. Create a list of instantaneous wattages for every second of the durations 
        of all efforts.
-    2. Calculate the 30-second rolling average power.
+    2. Calculate the 5-second rolling average power.
     3. Raise the smoothed power values to the fourth power.
     4. Calculate the average of these values.
     5. Take the fourth root of the average.
@@ -234,6 +250,23 @@ def calculate_overall_normalized_watts(efforts: List[RiderExertionItem]) -> floa
     The first item has a duration of 60 seconds and a wattage of 200, and the 
     second item has a duration of 30 seconds and a wattage of 180. The function 
     computes the normalized power based on these values.
+
+    The steps above are not carried out literally. Power is constant within each 
+    effort, so the answer is obtained segment by segment with 
+    calculate_normalized_watts_of_piecewise_constant_efforts(), which is exact. 
+    calculate_overall_normalized_watts_second_by_second() is the literal version 
+    and is retained as the reference.
+    """
+    if not efforts:
+        return 0
+
+    return calculate_normalized_watts_of_piecewise_constant_efforts([item.duration for item in efforts], [item.wattage for item in efforts])
+
+def calculate_overall_normalized_watts_second_by_second(efforts: List[RiderExertionItem]) -> float:
+    """
+    Reference implementation of calculate_overall_normalized_watts(). Expands the 
+    efforts into a per-second timeline and rolls a window along it. Slow. Used to 
+    verify the segment-wise algorithm.
     """
     if not efforts:
         return 0
@@ -245,7 +278,7 @@ def calculate_overall_normalized_watts(efforts: List[RiderExertionItem]) -> floa
 
     # Calculate rolling average power - TrainingPeaks uses a 30-second rolling average
     # Our pulls are 30, 60, and 120 seconds long, so we'll use a (arbitrary) 5-second rolling average
-    rolling_avg_power = calculate_rolling_averages(instantaneous_wattages, 5)
+    rolling_avg_power = calculate_rolling_averages(instantaneous_wattages, NORMALIZED_WATTS_ROLLING_WINDOW_SEC)
 
     # Raise the smoothed power values to the fourth power
     rolling_avg_power_4 = [p ** 4 for p in rolling_avg_power]
@@ -258,6 +291,116 @@ def calculate_overall_normalized_watts(efforts: List[RiderExertionItem]) -> floa
 
     return normalized_watts
 
+def calculate_normalized_watts_of_piecewise_constant_efforts(durations_sec: List[float], wattages: List[float],
+    window_size: int = NORMALIZED_WATTS_ROLLING_WINDOW_SEC
+) -> float:
+    """
+    Calculate the normalized power of a sequence of efforts at constant wattage, 
+    segment by segment, in O(number of segments).
+
+    The rolling mean of a piecewise-constant timeline equals the wattage of the 
+    segment everywhere except in the short ramps where a window straddles a 
+    boundary. A segment of s whole seconds at wattage w therefore contributes 
+    max(0, s - window_size + 1) windows worth w^4 each. The straddling windows, at 
+    most window_size - 1 per segment, are summed explicitly. The answer matches 
+    the second-by-second calculation to within floating point tolerance, including 
+    the truncation of durations to whole seconds and the answer of zero when the 
+    timeline is shorter than one window.
+
+    Args:
+        durations_sec (List[float]): The durations of the segments in seconds.
+        wattages (List[float]): The wattage of each segment.
+        window_size (int): Length of the rolling window in seconds.
+
+    Returns:
+        float: The normalized power.
+    """
+    segments = [(int(duration), wattage) for duration, wattage in zip(durations_sec, wattages) if int(duration) > 0]
+
+    total_seconds = sum(seconds for seconds, _ in segments)
+    num_windows = total_seconds - window_size + 1
+    if window_size <= 0 or num_windows <= 0:
+        return 0
+
+    overlap = window_size - 1
+    sum_of_fourth_powers = 0.0
+    start = 0
+
+    for idx, (seconds, wattage) in enumerate(segments):
+        end = start + seconds
+
+        # windows wholly inside the segment
+        sum_of_fourth_powers += max(0, seconds - overlap) * wattage ** 4
+
+        # windows that start inside the segment and run across its end
+        for window_start in range(max(start, end - overlap), min(end - 1, total_seconds - window_size) + 1):
+            remaining = window_size
+            window_sum = 0.0
+            taken = min(end - window_start, remaining)
+            window_sum += taken * wattage
+            remaining -= taken
+            following = idx + 1
+            while remaining > 0:
+                next_seconds, next_wattage = segments[following]
+                taken = min(next_seconds, remaining)
+                window_sum += taken * next_wattage
+                remaining -= taken
+                following += 1
+            sum_of_fourth_powers += (window_sum / window_size) ** 4
+
+        start = end
+
+    return (sum_of_fourth_powers / num_windows) ** 0.25
+
+def calculate_normalized_watts_of_piecewise_constant_efforts_numpy(durations_sec: NDArray[np.float64], wattages: NDArray[np.float64],
+    window_size: int = NORMALIZED_WATTS_ROLLING_WINDOW_SEC
+) -> NDArray[np.float64]:
+    """
+    Array version of calculate_normalized_watts_of_piecewise_constant_efforts() for 
+    many riders in many sequences at once.
+
+    Every rider in a sequence rides the same segments (one per slot of the paceline), 
+    only at different wattages, so the segment boundaries are shared. The straddling 
+    windows are located once per sequence and evaluated for all riders together.
+
+    Args:
+        durations_sec (NDArray): (sequences x slots) durations of the segments.
+        wattages (NDArray): (sequences x riders x slots) wattage of each rider in each segment.
+        window_size (int): Length of the rolling window in seconds.
+
+    Returns:
+        NDArray: (sequences x riders) normalized watts.
+    """
+    seconds = np.trunc(np.asarray(durations_sec, dtype=np.float64)).astype(np.int64)
+    num_sequences, num_slots = seconds.shape
+    num_riders = wattages.shape[1]
+    overlap = window_size - 1
+
+    ends = np.cumsum(seconds, axis=1)
+    starts = ends - seconds
+    total_seconds = ends[:, -1]
+
+    # windows lying wholly inside a single segment
+    plateau_counts = np.maximum(seconds - overlap, 0)
+    sum_of_fourth_powers = np.einsum("sj,skj->sk", plateau_counts.astype(np.float64), wattages ** 4)
+
+    if overlap > 0:
+        # windows that start in segment j and run across its end
+        window_starts = ends[:, :, None] - overlap + np.arange(overlap)                        # (s, j, r)
+        is_counted = (window_starts >= starts[:, :, None]) & (window_starts <= (total_seconds - window_size)[:, None, None])
+        instants = window_starts[..., None] + np.arange(window_size)                            # (s, j, r, o)
+        segment_of_instant = (ends[:, None, None, None, :] <= instants[..., None]).sum(axis=-1)
+        segment_of_instant = np.minimum(segment_of_instant, num_slots - 1).reshape(num_sequences, 1, -1)
+        segment_of_instant = np.broadcast_to(segment_of_instant, (num_sequences, num_riders, segment_of_instant.shape[-1]))
+        watts_at_instant = np.take_along_axis(wattages, segment_of_instant, axis=2)
+        window_means = watts_at_instant.reshape(num_sequences, num_riders, num_slots, overlap, window_size).sum(axis=-1) / window_size
+        sum_of_fourth_powers += np.where(is_counted[:, None, :, :], window_means ** 4, 0.0).sum(axis=(2, 3))
+
+    num_windows = (total_seconds - overlap).astype(np.float64)
+    mean_power4 = np.divide(sum_of_fourth_powers, num_windows[:, None], out=np.zeros_like(sum_of_fourth_powers), where=num_windows[:, None] > 0)
+
+    return mean_power4 ** 0.25
+
 def calculate_overall_average_speed_of_paceline_kph(exertions: DefaultDict[ZsunItem, List[RiderExertionItem]]) -> float:
     """
     Calculate the average speed (km/h) for the rider is the paceline to whom 
@@ -314,7 +457,7 @@ def calculate_overall_intensity_factor_of_rider_contribution(rider: ZsunItem, ri
 
     """
 
-    return  safe_divide(rider_contribution.normalized_watts, rider.get_one_hour_watts())
+    return  safe_divide(rider_contribution.normalized_watts, get_rider_power_profile(rider).one_hour_watts)
 
 def calculate_upper_bound_paceline_speed(riders: List[ZsunItem]) -> Tuple[ZsunItem, float, float]:
     """
@@ -448,6 +591,38 @@ def calculate_dispersion_of_intensity_of_effort(rider_contributions: DefaultDict
 
     return std_deviation_of_intensity_factors
 
+def calculate_dispersion_of_intensity_of_effort_numpy(intensity_factors: NDArray[np.float64], pull_durations_sec: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Array version of calculate_dispersion_of_intensity_of_effort() for many sequences at once.
+
+    Sequences are grouped by their number of pullers so that each group is a dense
+    (sequences x pullers) block and np.std runs over exactly the values, in exactly the
+    order, that the scalar version sees. The answers are therefore identical to the last
+    bit, which matters because candidate plans are chosen on ties of dispersion.
+
+    Args:
+        intensity_factors (NDArray): (sequences x riders) intensity factor of each rider.
+        pull_durations_sec (NDArray): (sequences x riders) pull period of each rider, zero for riders who do not pull.
+
+    Returns:
+        NDArray: (sequences,) standard deviation of the intensity factors of the pullers,
+                 100 where nobody pulls or the result is not finite.
+    """
+    intensity_factors = np.atleast_2d(np.asarray(intensity_factors, dtype=np.float64))
+    is_puller = np.atleast_2d(np.asarray(pull_durations_sec)) != 0
+    num_pullers = is_puller.sum(axis=1)
+
+    answer = np.full(intensity_factors.shape[0], 100.0) # arbitrarily big
+
+    for count in np.unique(num_pullers[num_pullers > 0]):
+        rows = np.flatnonzero(num_pullers == count)
+        values_of_pullers = intensity_factors[rows][is_puller[rows]].reshape(len(rows), count)
+        answer[rows] = np.std(values_of_pullers, axis=1)
+
+    answer[~np.isfinite(answer)] = 100.0 # arbitrarily big
+
+    return answer
+
 def arrange_riders_in_optimal_order(riders: List[ZsunItem]) -> List[ZsunItem]:
     """
     Arrange the riders in an optimal order based on their strength metric.
@@ -536,46 +711,228 @@ def prune_all_sequences_of_pull_periods_in_the_total_solution_space(pull_period_
 
     Notes:
         - Filtering is only applied if the number of input sequences exceeds the solution space size constraint.
-        - Uses NumPy for efficient vectorized filtering.
+        - The rules are evaluated on the ranks of the pull periods, one byte per cell, one broadcast comparison
+          per rule. Their masks are combined as they go and the array is compacted once at the end.
         - Intended to improve computational performance by discarding unlikely or suboptimal sequences before
           more expensive computations are performed.
     """
     if len(pull_period_sequences_being_pruned) < ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL + 1:
         return pull_period_sequences_being_pruned
 
-    arr = pull_period_sequences_being_pruned
-    strengths = np.array([r.get_strength_wkg() for r in riders])
+    pruning_filters = arrange_columns_for_pruning_filters(riders)
+
+    filters_survived = count_pruning_filters_survived_in_blocks(pull_period_sequences_being_pruned, pruning_filters, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    if filters_survived is None:
+        filters_survived = count_pruning_filters_survived_in_blocks(pull_period_sequences_being_pruned, pruning_filters, np.unique(pull_period_sequences_being_pruned))
+
+    filters_to_apply = count_pruning_filters_to_apply(np.bincount(filters_survived, minlength=len(pruning_filters) + 1))
+
+    return pull_period_sequences_being_pruned[filters_survived >= filters_to_apply]
+
+def arrange_columns_for_pruning_filters(riders: List[ZsunItem]) -> List[Tuple[NDArray[np.intp], int, bool]]:
+    """
+    The successive filters of prune_all_sequences_of_pull_periods_in_the_total_solution_space(),
+    each as the columns it constrains, the column they are compared with, and whether that column
+    is a floor (True) or a ceiling (False):
+
+    Filter 1: No rider (except 2nd weakest) can have a pull shorter than the weakest.
+    Filter 2: For n in 1..12, no rider (except top n-1) can have a pull longer than the nth strongest.
+    """
+    strengths = np.array([get_rider_power_profile(r).strength_wkg for r in riders])
+    columns = np.arange(len(riders))
+
     sorted_indices = np.argsort(strengths)
     weakest_idx = sorted_indices[0]
     second_weakest_idx = sorted_indices[1] if len(sorted_indices) > 1 else None
+    pruning_filters = [(columns[columns != second_weakest_idx], weakest_idx, True)]
 
-    # Filter 1: No rider (except 2nd weakest) can have a pull shorter than the weakest
-    weakest_values = arr[:, weakest_idx][:, np.newaxis]
-    mask = np.ones(arr.shape[0], dtype=bool)
-    for idx in range(arr.shape[1]):
-        if idx == second_weakest_idx:
-            continue
-        mask &= arr[:, idx] >= weakest_values[:, 0]
-    arr = arr[mask]
-    if len(arr) < ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL:
-        return arr
-
-    # Filter 2: For n in 1..12, no rider (except top n-1) can have a pull longer than the nth strongest
     strengths_desc = np.argsort(-strengths)
     for n in range(1, min(13, len(riders) + 1)):
-        indices = strengths_desc[:n]
-        nth_strongest_idx = strengths_desc[n-1]
-        nth_values = arr[:, nth_strongest_idx][:, np.newaxis]
-        mask = np.ones(arr.shape[0], dtype=bool)
-        for idx in range(arr.shape[1]):
-            if idx in indices[:-1]:
-                continue
-            mask &= arr[:, idx] <= nth_values[:, 0]
-        arr = arr[mask]
-        if len(arr) < ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL:
-            return arr
-
-    return arr
+        pruning_filters.append((columns[~np.isin(columns, strengths_desc[:n - 1])], strengths_desc[n - 1], False))
+
+    return pruning_filters
+
+def calculate_mask_of_pruning_filter(pull_period_ranks_by_rider: NDArray[np.int8], pruning_filter: Tuple[NDArray[np.intp], int, bool]
+) -> NDArray[np.bool_]:
+    """
+    The sequences that survive one filter from arrange_columns_for_pruning_filters(), in one
+    broadcast comparison. Each filter looks only at the sequence itself, so a block of
+    sequences can be filtered on its own.
+
+    Args:
+        pull_period_ranks_by_rider (NDArray): 2D array of pull periods, or their ranks, one row per
+            rider and one column per sequence. Laid out this way round, each rider's periods are
+            contiguous, which makes the comparison many times faster than one row per sequence.
+        pruning_filter (Tuple): Constrained riders, reference rider, and whether the reference is a floor.
+
+    Returns:
+        NDArray[np.bool_]: True for each sequence that survives.
+    """
+    constrained_riders, reference_rider, is_floor = pruning_filter
+    reference = pull_period_ranks_by_rider[reference_rider]
+    if is_floor:
+        return (pull_period_ranks_by_rider[constrained_riders] >= reference).all(axis=0)
+    return (pull_period_ranks_by_rider[constrained_riders] <= reference).all(axis=0)
+
+def count_pruning_filters_survived(pull_period_ranks: NDArray[np.int8], pruning_filters: List[Tuple[NDArray[np.intp], int, bool]]
+) -> NDArray[np.int8]:
+    """
+    For each row, how many of the filters it survives before the first that removes it.
+    """
+    pull_period_ranks_by_rider = np.ascontiguousarray(pull_period_ranks.T)
+    is_surviving = np.ones(len(pull_period_ranks), dtype=bool)
+    filters_survived = np.zeros(len(pull_period_ranks), dtype=np.int8)
+    for pruning_filter in pruning_filters:
+        is_surviving &= calculate_mask_of_pruning_filter(pull_period_ranks_by_rider, pruning_filter)
+        filters_survived += is_surviving
+    return filters_survived
+
+def count_pruning_filters_to_apply(histogram_of_filters_survived: NDArray[np.int64]) -> int:
+    """
+    How many filters to apply so that pruning stops after the first filter that takes the
+    survivors below ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL, or after the last filter.
+
+    Args:
+        histogram_of_filters_survived (NDArray): Element i is the number of rows that survive
+            exactly i filters, from 0 to the number of filters.
+
+    Returns:
+        int: The number of filters a row must survive to be kept.
+    """
+    survivors_after_filter = np.cumsum(histogram_of_filters_survived[::-1])[::-1][1:]
+    below_goal = np.flatnonzero(survivors_after_filter < ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL)
+    return int(below_goal[0]) + 1 if len(below_goal) else len(survivors_after_filter)
+
+def count_pruning_filters_survived_in_blocks(pull_period_sequences: NDArray[np.float64],
+    pruning_filters: List[Tuple[NDArray[np.intp], int, bool]], pull_periods_in_ascending_order: List[float]
+) -> Optional[NDArray[np.int8]]:
+    """
+    count_pruning_filters_survived() for an array of pull periods, a few thousand rows at a
+    time, so that each block of rows is ranked and filtered while it is in cache. Each pull
+    period is replaced by its rank in pull_periods_in_ascending_order, one byte per cell, which
+    compares exactly as the period does.
+
+    Returns:
+        NDArray[np.int8] or None: Filters survived by each row, or None if any pull period
+            is missing from pull_periods_in_ascending_order.
+    """
+    periods = np.asarray(pull_periods_in_ascending_order, dtype=np.float64)
+    filters_survived = np.empty(len(pull_period_sequences), dtype=np.int8)
+
+    for first_row in range(0, len(pull_period_sequences), RANKED_ROWS_PER_BLOCK):
+        rows = pull_period_sequences[first_row:first_row + RANKED_ROWS_PER_BLOCK]
+        ranks = np.zeros(rows.shape, dtype=np.min_scalar_type(-len(periods)))
+        for period in periods[1:]:
+            ranks += rows >= period
+        if not (periods.take(ranks) == rows).all():
+            return None
+        filters_survived[first_row:first_row + RANKED_ROWS_PER_BLOCK] = count_pruning_filters_survived(ranks, pruning_filters)
+
+    return filters_survived
+
+def generate_chunks_of_paceline_rotation_sequences_in_the_total_solution_space(length_of_paceline: int,
+    standard_pull_periods_seconds: List[float], rows_per_chunk: int = ROTATION_SEQUENCE_UNIVERSE_ROWS_PER_CHUNK
+) -> Iterator[NDArray[np.float64]]:
+    """
+    Lazily generate the rows of generate_all_paceline_rotation_sequences_in_the_total_solution_space(),
+    in the same order, as blocks of at most rows_per_chunk rows (but never fewer than k),
+    so that no more than one block exists at a time.
+
+    Args:
+        length_of_paceline (int): Number of riders in the paceline.
+        standard_pull_periods_seconds (List[float]): Allowed pull durations (in seconds).
+        rows_per_chunk (int): The most rows in a block.
+
+    Yields:
+        NDArray[np.float64]: The next block of pull period sequences.
+    """
+    periods = np.asarray(standard_pull_periods_seconds, dtype=np.float64)
+
+    for chunk in generate_chunks_of_indices_of_paceline_rotation_sequences(length_of_paceline, len(periods), rows_per_chunk):
+        yield periods[chunk]
+
+def generate_chunks_of_indices_of_paceline_rotation_sequences(length_of_paceline: int,
+    number_of_pull_periods: int, rows_per_chunk: int = ROTATION_SEQUENCE_UNIVERSE_ROWS_PER_CHUNK
+) -> Iterator[NDArray[np.int8]]:
+    """
+    As generate_chunks_of_paceline_rotation_sequences_in_the_total_solution_space(), but yielding
+    the indices of the pull periods in the list, one byte per cell, rather than the periods.
+    When the list is in ascending order, as STANDARD_PULL_PERIODS_SEC_AS_LIST must be, an
+    index is also the rank of its period.
+
+    A block is k^m rows in which the leading riders keep the same pull periods and the
+    trailing m riders run through all of theirs. The trailing columns are therefore the
+    same in every block and are built once. The leading columns come from a mixed-radix
+    counter over the block number.
+    """
+    radix = number_of_pull_periods
+    dtype = np.min_scalar_type(-radix)
+
+    trailing_riders = 1
+    while trailing_riders < length_of_paceline and radix ** (trailing_riders + 1) <= rows_per_chunk:
+        trailing_riders += 1
+    trailing_riders = min(trailing_riders, length_of_paceline)
+    leading_riders = length_of_paceline - trailing_riders
+
+    trailing_columns = generate_all_paceline_rotation_sequences_in_the_total_solution_space(trailing_riders, list(range(radix))).astype(dtype)
+
+    for leading_digits in np.ndindex(*([radix] * leading_riders)):
+        chunk = np.empty((len(trailing_columns), length_of_paceline), dtype=dtype)
+        chunk[:, :leading_riders] = leading_digits
+        chunk[:, leading_riders:] = trailing_columns
+        yield chunk
+
+def generate_pruned_paceline_rotation_sequences_in_chunks(riders: List[ZsunItem],
+    standard_pull_periods_seconds: List[float], rows_per_chunk: int = ROTATION_SEQUENCE_UNIVERSE_ROWS_PER_CHUNK
+) -> NDArray[np.float64]:
+    """
+    Same answer as pruning the whole of generate_all_paceline_rotation_sequences_in_the_total_solution_space()
+    with prune_all_sequences_of_pull_periods_in_the_total_solution_space(), without ever
+    holding the whole universe in memory. The pull periods must be in ascending order.
+
+    The pruning stops after the first filter that takes the survivors below
+    ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL, which is a count over the whole universe.
+    So the blocks are streamed twice. The first pass counts the survivors of each
+    successive filter to find where pruning stops. The second pass applies the filters up
+    to there to each block and keeps the survivors. Blocks are pruned as indices into the
+    list of pull periods, and only the survivors become periods. Peak memory is one block
+    plus the answer.
+
+    Args:
+        riders (List[ZsunItem]): The riders, in paceline order.
+        standard_pull_periods_seconds (List[float]): Allowed pull durations (in seconds), in ascending order.
+        rows_per_chunk (int): The most rows in a block.
+
+    Returns:
+        NDArray[np.float64]: The pruned pull period sequences, in the order of the universe.
+
+    Raises:
+        ValueError: If the pull periods are not in strictly ascending order, for then an index is not the rank of its period.
+    """
+    periods = np.asarray(standard_pull_periods_seconds, dtype=np.float64)
+
+    if np.any(np.diff(periods) <= 0):
+        raise ValueError("The standard pull durations must be in strictly ascending order, with no duplicates.")
+
+    def generate_chunks() -> Iterator[NDArray[np.int8]]:
+        return generate_chunks_of_indices_of_paceline_rotation_sequences(len(riders), len(periods), rows_per_chunk)
+
+    if len(periods) ** len(riders) < ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL + 1:
+        return periods[np.concatenate(list(generate_chunks()))]
+
+    pruning_filters = arrange_columns_for_pruning_filters(riders)
+
+    histogram_of_filters_survived = np.zeros(len(pruning_filters) + 1, dtype=np.int64)
+    for chunk in generate_chunks():
+        histogram_of_filters_survived += np.bincount(count_pruning_filters_survived(chunk, pruning_filters), minlength=len(pruning_filters) + 1)
+
+    filters_to_apply = count_pruning_filters_to_apply(histogram_of_filters_survived)
+
+    survivors: List[NDArray[np.int8]] = []
+    for chunk in generate_chunks():
+        survivors.append(chunk[count_pruning_filters_survived(chunk, pruning_filters[:filters_to_apply]) == filters_to_apply])
+
+    return periods[np.concatenate(survivors)]
 
 def generate_all_paceline_rotation_sequences_in_the_total_solution_space(length_of_paceline: int,
     standard_pull_periods_seconds: List[float]
@@ -606,6 +963,146 @@ def generate_all_paceline_rotation_sequences_in_the_total_solution_space(length_
 
     return all_combinations
 
+def generate_all_paceline_rotation_sequences_in_gray_code_order(length_of_paceline: int,
+    standard_pull_periods_seconds: List[float]
+) -> NDArray[np.float64]:
+    """
+    Generate the same k^n sequences as generate_all_paceline_rotation_sequences_in_the_total_solution_space(),
+    but in reflected Gray order: each sequence differs from the one before it in the pull
+    period of exactly one rider, who moves to the neighbouring period in the list. The
+    last rider changes fastest, as in the Cartesian product. The order matches
+    walk_paceline_rotation_sequences_in_gray_code_order() row for row.
+
+    Args:
+        length_of_paceline (int): Number of riders in the paceline.
+        standard_pull_periods_seconds (List[float]): Allowed pull durations (in seconds).
+
+    Returns:
+        NDArray[np.float64]: All possible paceline pull period sequences as a 2D NumPy array.
+    """
+    periods = np.asarray(standard_pull_periods_seconds, dtype=np.float64)
+    radix = len(periods)
+
+    # the digits of each row number, most significant (rider 0) first
+    row_numbers = np.arange(radix ** length_of_paceline)
+    place_values = radix ** np.arange(length_of_paceline - 1, -1, -1)
+    digits = (row_numbers[:, None] // place_values[None, :]) % radix
+
+    # an odd digit reverses the order of everything below it, and reversals compose
+    is_reversed = np.zeros(len(row_numbers), dtype=bool)
+    for idx in range(length_of_paceline):
+        digits[:, idx] = np.where(is_reversed, radix - 1 - digits[:, idx], digits[:, idx])
+        is_reversed ^= digits[:, idx] % 2 == 1
+
+    return periods[digits]
+
+def walk_paceline_rotation_sequences_in_gray_code_order(length_of_paceline: int,
+    standard_pull_periods_seconds: List[float]
+) -> Iterator[Tuple[NDArray[np.float64], float, NDArray[np.float64]]]:
+    """
+    Walk the k^n sequences in the order of generate_all_paceline_rotation_sequences_in_gray_code_order(),
+    carrying each rider's exertion totals along instead of rebuilding them for every sequence.
+
+    Rider k spends the pull of the rider in slot j at the drag ratio of position
+    (k - j) mod n + 1, so the energy rider k spends in one rotation is their watts riding
+    alone times sum_j(duration_j * drag_ratio[k, j]), whatever the speed. When one rider's
+    pull period changes, the rotation's duration and every rider's drag-weighted seconds
+    change by one term each: O(n) per step rather than O(n^2). Uses Knuth's loopless
+    algorithm for the reflected mixed-radix Gray code (TAOCP 7.2.1.1, Algorithm H).
+
+    Args:
+        length_of_paceline (int): Number of riders in the paceline.
+        standard_pull_periods_seconds (List[float]): Allowed pull durations (in seconds).
+
+    Yields:
+        Tuple: (sequence, duration of the rotation in seconds, drag-weighted seconds of each
+            rider). The two arrays are updated in place at the next step. Copy them to keep them.
+    """
+    periods = np.asarray(standard_pull_periods_seconds, dtype=np.float64)
+    radix = len(periods)
+    n = length_of_paceline
+
+    drag_ratios = np.array([[estimate_drag_ratio_in_paceline((k - j) % n + 1) for j in range(n)] for k in range(n)])
+
+    digits = [0] * n
+    sequence = np.full(n, periods[0])
+    total_duration_sec = float(sequence.sum())
+    drag_weighted_sec = drag_ratios @ sequence
+
+    yield sequence, total_duration_sec, drag_weighted_sec
+
+    if radix < 2:
+        return
+
+    # Algorithm H counts digit 0 fastest, so digit j belongs to rider n - 1 - j
+    directions = [1] * n
+    focus = list(range(n + 1))
+    while True:
+        j = focus[0]
+        focus[0] = 0
+        if j == n:
+            return
+        digits[j] += directions[j]
+        if digits[j] == 0 or digits[j] == radix - 1:
+            directions[j] = -directions[j]
+            focus[j] = focus[j + 1]
+            focus[j + 1] = j + 1
+
+        rider = n - 1 - j
+        change_sec = periods[digits[j]] - sequence[rider]
+        sequence[rider] = periods[digits[j]]
+        total_duration_sec += change_sec
+        drag_weighted_sec += change_sec * drag_ratios[:, rider]
+
+        yield sequence, total_duration_sec, drag_weighted_sec
+
+def calculate_upper_bound_speeds_of_paceline_rotation_sequences_in_gray_code_order(riders: List[ZsunItem],
+    standard_pull_periods_seconds: List[float], max_exertion_intensity_factor: float
+) -> NDArray[np.float64]:
+    """
+    An upper bound on the speed of every sequence in the order of generate_all_paceline_rotation_sequences_in_gray_code_order(),
+    read off the running totals of walk_paceline_rotation_sequences_in_gray_code_order() rather than solved for.
+
+    Rider k's average watts over a rotation are their watts riding alone times drag-weighted seconds over
+    the duration of the rotation, and their normalized watts are never below their average watts. So a
+    puller's intensity factor reaches max_exertion_intensity_factor at a speed no higher than that at
+    which their average watts reach max_exertion_intensity_factor x one-hour watts. The least of those
+    speeds over the pullers bounds the sequence. The pull-watts caps are left out, so the bound is loose
+    where a cap binds, but never too low.
+
+    Args:
+        riders (List[ZsunItem]): The riders from head to tail of the paceline.
+        standard_pull_periods_seconds (List[float]): Allowed pull durations (in seconds).
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        NDArray[np.float64]: The bound of each sequence in kph. Zero for the sequence in which nobody pulls.
+    """
+    profiles = [get_rider_power_profile(rider) for rider in riders]
+    num_sequences = len(standard_pull_periods_seconds) ** len(riders)
+
+    is_puller = np.empty((num_sequences, len(riders)), dtype=bool)
+    total_durations_sec = np.empty(num_sequences, dtype=np.float64)
+    drag_weighted_secs = np.empty((num_sequences, len(riders)), dtype=np.float64)
+
+    for idx, (sequence, total_duration_sec, drag_weighted_sec) in enumerate(walk_paceline_rotation_sequences_in_gray_code_order(len(riders), standard_pull_periods_seconds)):
+        is_puller[idx] = sequence != 0
+        total_durations_sec[idx] = total_duration_sec
+        drag_weighted_secs[idx] = drag_weighted_sec
+
+    one_hour_watts = np.array([profile.one_hour_watts for profile in profiles], dtype=np.float64)
+    weight = np.broadcast_to(np.array([profile.weight_kg for profile in profiles], dtype=np.float64), drag_weighted_secs.shape)
+    height = np.broadcast_to(np.array([profile.height_cm for profile in profiles], dtype=np.float64), drag_weighted_secs.shape)
+
+    # the watts riding alone at which each rider's average watts reach the ceiling of their intensity factor.
+    # A rider without one-hour watts has an intensity factor of zero, which never binds
+    has_ceiling = (drag_weighted_secs > 0) & (one_hour_watts[None, :] > 0)
+    target_watts = np.divide(max_exertion_intensity_factor * one_hour_watts[None, :] * total_durations_sec[:, None], drag_weighted_secs,
+        out=np.zeros_like(drag_weighted_secs), where=has_ceiling)
+    binding_kph = np.where(is_puller & has_ceiling, estimate_speed_from_wattage_numpy(target_watts, weight, height), np.inf)
+
+    return np.where(is_puller.any(axis=1), binding_kph.min(axis=1), 0.0)
+
 def main():
     dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
     team_name = "test_sample"
@@ -631,7 +1128,6 @@ def main():
 if __name__ == "__main__":
     from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
     from team_rosters import RepositoryOfTeams
-    from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
     from filenames import RIDERS_FILE_NAME
     from dirpaths import DATA_DIRPATH
     from jgh_logging import jgh_configure_logging
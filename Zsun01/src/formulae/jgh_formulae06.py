@@ -3,10 +3,46 @@ from collections import defaultdict
 from jgh_number import safe_divide
 from zsun_rider_item import ZsunItem
 from computation_classes import RiderExertionItem, RiderContributionItem
-from jgh_formulae02 import calculate_overall_average_watts, calculate_overall_normalized_watts
+from jgh_formulae01 import estimate_drag_ratio_in_paceline
+from jgh_formulae02 import calculate_overall_average_watts, calculate_overall_normalized_watts, get_rider_power_profile, calculate_wattage_riding_alone, calculate_normalized_watts_of_piecewise_constant_efforts
+from memo_utilities import BoundedLruMemo
+from constants import EXERTION_FRAGMENT_MEMO_CEILING_MB
 import logging
 logger = logging.getLogger(__name__)
 
+# Every wattage of a rider at a constant speed is their watts riding alone times the drag
+# ratio of their position, and average and normalized watts both scale with it. So a rider's
+# average and normalized watts per watt riding alone depend only on the positions and durations
+# of their exertions, not on the rider and not on the speed. Every probe of a binary search, and
+# every sequence that puts the same durations at the same relative positions, shares them.
+exertion_fragment_memo = BoundedLruMemo(EXERTION_FRAGMENT_MEMO_CEILING_MB * 1024 * 1024)
+
+
+def calculate_average_and_normalized_watts_of_exertions(rider: ZsunItem, exertions: List[RiderExertionItem]) -> Tuple[float, float]:
+    """
+    Average and normalized watts of a rider's exertions, from exertion_fragment_memo where possible.
+    Exertions at differing speeds are not memoised.
+    """
+    speeds_kph = {exertion.speed_kph for exertion in exertions}
+    if len(speeds_kph) != 1:
+        return calculate_overall_average_watts(exertions), calculate_overall_normalized_watts(exertions)
+
+    key = tuple((exertion.current_location_in_paceline, exertion.duration) for exertion in exertions)
+
+    fragment = exertion_fragment_memo.get(key)
+    if fragment is None:
+        durations = [duration for _, duration in key]
+        drag_ratios = [estimate_drag_ratio_in_paceline(position) for position, _ in key]
+        total_duration = sum(durations)
+        average_drag_ratio = safe_divide(sum(drag_ratio * duration for drag_ratio, duration in zip(drag_ratios, durations)), total_duration)
+        fragment = (average_drag_ratio, calculate_normalized_watts_of_piecewise_constant_efforts(durations, drag_ratios))
+        exertion_fragment_memo.put(key, fragment)
+
+    watts_riding_alone = calculate_wattage_riding_alone(rider, speeds_kph.pop())
+
+    return watts_riding_alone * fragment[0], watts_riding_alone * fragment[1]
+
+
 # This function called during parallel processing. Logging forbidden
 def populate_rider_contributions(riders: DefaultDict[ZsunItem, List[RiderExertionItem]], max_exertion_intensity_factor : float ) -> DefaultDict[ZsunItem, RiderContributionItem]:
 
@@ -49,8 +85,10 @@ def populate_rider_contributions(riders: DefaultDict[ZsunItem, List[RiderExertio
     answer : DefaultDict[ZsunItem, RiderContributionItem] = defaultdict(RiderContributionItem)
 
     for rider, exertions in riders.items():
+        profile = get_rider_power_profile(rider)
         p1w, p2w, p3w, p4w, p5w, p6w, p7w, p8w = extract_watts_sequentially(exertions)
         p1_speed_kph, p1_duration = extract_pull_metrics(exertions)
+        average_watts, normalized_watts = calculate_average_and_normalized_watts_of_exertions(rider, exertions) if exertions else (0, 0)
         rider_contribution = RiderContributionItem(
             speed_kph           = p1_speed_kph,
             p1_duration         = p1_duration,
@@ -62,17 +100,17 @@ def populate_rider_contributions(riders: DefaultDict[ZsunItem, List[RiderExertio
             p6_w                = p6w,
             p7_w                = p7w,
             p8_w                = p8w,
-            average_watts       = calculate_overall_average_watts(exertions),
-            normalized_watts    = calculate_overall_normalized_watts(exertions),
+            average_watts       = average_watts,
+            normalized_watts    = normalized_watts,
         )
-        rider_contribution.intensity_factor = safe_divide(rider_contribution.normalized_watts,rider.get_one_hour_watts())
+        rider_contribution.intensity_factor = safe_divide(rider_contribution.normalized_watts,profile.one_hour_watts)
 
         if rider_contribution.p1_duration != 0.0:
             msg = ""
             if rider_contribution.intensity_factor >= max_exertion_intensity_factor:
                 msg += f" IF>{round(100*max_exertion_intensity_factor)}%"
 
-            if rider_contribution.p1_w >= rider.get_standard_pull_watts(rider_contribution.p1_duration):
+            if rider_contribution.p1_w >= profile.get_standard_pull_watts(rider_contribution.p1_duration):
                 msg += " pull>max W"
 
             rider_contribution.effort_constraint_violation_reason = msg
@@ -1,23 +1,38 @@
-from typing import  List, DefaultDict, Tuple
-import os
+from typing import  Any, List, DefaultDict, Dict, Set, Tuple, Optional, Callable
 from collections import defaultdict
 from copy import deepcopy
 import concurrent.futures
+import os
+import json
+import math
+import platform
+import multiprocessing
+from datetime import datetime
+import uuid
+import dataclasses
 import time
 import numpy as np
+from numpy.typing import NDArray
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from jgh_formatting import (truncate, format_number_with_comma_separators, format_number_1dp, format_pretty_duration_hms)
 from jgh_number import safe_divide
 from zsun_rider_item import ZsunItem
-from computation_classes import (PacelineIngredientsItem, RiderContributionItem, PacelineComputationReportItem, PackageOfPacelineComputationReportItem, WorthyCandidateSolutionItem)
+from computation_classes import (PacelineIngredientsItem, RiderContributionItem, PacelineComputationReportItem, PackageOfPacelineComputationReportItem, WorthyCandidateSolutionItem, CandidateSolutionReducerItem, PacelineSolutionsTable, PacelineSharedMemoryBlocksItem, PacelineDispatchCalibrationItem, PacelineDispatchDecisionItem, PacelineSolverTelemetrySummaryItem)
+from jgh_enums import PacelineSolverEngineEnum, PacelineProcessingStrategyEnum
 from computation_classes_display_objects import PackageOfPacelineComputationReportDisplayObject
-from jgh_formulae02 import (calculate_upper_bound_paceline_speed, calculate_upper_bound_paceline_speed_at_one_hour_watts, calculate_lower_bound_paceline_speed,calculate_lower_bound_paceline_speed_at_one_hour_watts, calculate_overall_average_speed_of_paceline_kph, generate_all_paceline_rotation_sequences_in_the_total_solution_space, prune_all_sequences_of_pull_periods_in_the_total_solution_space, calculate_dispersion_of_intensity_of_effort)
+from jgh_formulae02 import (get_rider_power_profile, calculate_upper_bound_paceline_speed, calculate_upper_bound_paceline_speed_at_one_hour_watts, calculate_lower_bound_paceline_speed,calculate_lower_bound_paceline_speed_at_one_hour_watts, calculate_overall_average_speed_of_paceline_kph, generate_all_paceline_rotation_sequences_in_the_total_solution_space, generate_all_paceline_rotation_sequences_in_gray_code_order, calculate_upper_bound_speeds_of_paceline_rotation_sequences_in_gray_code_order, prune_all_sequences_of_pull_periods_in_the_total_solution_space, generate_pruned_paceline_rotation_sequences_in_chunks, calculate_dispersion_of_intensity_of_effort)
 from jgh_formulae04 import populate_rider_work_assignments
 from jgh_formulae05 import populate_rider_exertions
-from jgh_formulae06 import populate_rider_contributions
-from constants import (SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD, SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION, REQUIRED_PRECISION_OF_SPEED, MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION, ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL, STANDARD_PULL_PERIODS_SEC_AS_LIST)
+from jgh_formulae06 import populate_rider_contributions, exertion_fragment_memo
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, evaluate_rotation_sequences_at_speed, calculate_binding_speeds_of_rotation_sequences, calculate_speed_bracket_of_rotation_sequences, bisect_rotation_sequences_in_lockstep, materialize_rider_contributions_from_batch_evaluation, populate_paceline_solutions_table_from_batch_evaluation, record_report_in_paceline_solutions_table, mark_valid_rows_of_paceline_solutions_table
+from process_pool_utilities import PersistentProcessPool
+from shared_memory_utilities import create_shared_array, attach_shared_array, release_shared_memory
+from telemetry_utilities import TelemetryCollector
+from disk_cache_utilities import ContentAddressedDiskCache, make_stable_digest, get_user_cache_dirpath
+from jgh_logging import jgh_start_logging_queue_listener, jgh_get_logging_queue, jgh_configure_worker_logging
+from constants import (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION, GALLOPING_SEARCH_INITIAL_STEP_KPH, REQUIRED_PRECISION_OF_SPEED, MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION, ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL, STANDARD_PULL_PERIODS_SEC_AS_LIST, MIN_SEQUENCES_PER_PARALLEL_CHUNK, MAX_SEQUENCES_PER_PARALLEL_CHUNK, TARGET_SECONDS_PER_PARALLEL_CHUNK, DISPATCH_CALIBRATION_SAMPLE_SIZE, DISPATCH_CALIBRATION_FILE_NAME, DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS, ANYTIME_SOLVER_FIRST_BATCH_SIZE, POWER_CURVE_IN_PACELINE, SAFE_LOWER_BOUND_KPH, NORMALIZED_WATTS_ROLLING_WINDOW_SEC, PACELINE_SOLUTION_CACHE_VERSION, PACELINE_SOLUTION_CACHE_DIR_NAME, PACELINE_SOLUTION_CACHE_CEILING_MB)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -55,7 +70,10 @@ def log_speed_bounds_of_exertion_constrained_paceline_solutions(riders: List[Zsu
 def log_workload_suffix_message(report : PackageOfPacelineComputationReportDisplayObject) -> None:
 
     message_lines = [
-        f"\nBrute report: did {format_number_with_comma_separators(report.total_compute_iterations_performed)} iterations to evaluate {format_number_with_comma_separators(report.total_pull_sequences_examined)} alternative plans in {format_pretty_duration_hms(report.computational_time)}.",
+        f"\nBrute report: did {format_number_with_comma_separators(report.total_compute_iterations_performed)} iterations ({format_number_with_comma_separators(report.total_bracketing_iterations_performed)} of them bracketing) to evaluate {format_number_with_comma_separators(report.total_pull_sequences_examined)} alternative plans in {format_pretty_duration_hms(report.computational_time)}.",
+        f"Exertion memo: {format_number_with_comma_separators(report.total_exertion_memo_hits)} hits and {format_number_with_comma_separators(report.total_exertion_memo_misses)} misses.",
+        *(["Served from the cache of solved plans: the statistics above are those of the run that solved them."] if report.served_from_cache else []),
+        *([f"Ran out of time: {format_number_with_comma_separators(report.total_pull_sequences_unevaluated)} alternative plans were left unevaluated, the most promising having been evaluated first."] if report.ran_out_of_time else []),
         "Intensity Factor is Normalized Power/one-hour power. zFTP metrics are displayed, but play no role in computations.",
         "Pull capacities are obtained from individual 90-day best power graphs on ZwiftPower.",
         "",
@@ -182,11 +200,14 @@ def generate_a_single_paceline_solution_complying_with_exertion_constraints(pace
             algorithm_ran_to_completion                     = False,  # We did not run to completion, we hit the max iterations
             exertion_intensity_constraint_used              = paceline_ingredients.max_exertion_intensity_factor,
             compute_iterations_performed_count              = compute_iterations_performed,
+            bracketing_iterations_performed_count           = compute_iterations_performed,
             calculated_average_speed_of_paceline_kph        =0,
             calculated_dispersion_of_intensity_of_effort    = 999,
             rider_contributions                             = dict_of_rider_contributions,
         )
 
+    bracketing_iterations_performed = compute_iterations_performed
+
     # Do the binary search. The concept is to search by bouncing back and forth between speeds bounded by  
     # lower_bound_for_next_search_iteration_kph and upper_bound_for_next_search_iteration_kph, continuing
     # until the difference between the two bounds is less than REQUIRED_PRECISION_OF_SPEED i.e. until we are within a small enough range
@@ -196,191 +217,1525 @@ def generate_a_single_paceline_solution_complying_with_exertion_constraints(pace
     # between which is negligible i.e. less than REQUIRED_PRECISION_OF_SPEED. Use the upper_bound_for_next_search_iteration_kph as our answer
 
 
-    while (upper_bound_for_next_search_iteration_kph - lower_bound_for_next_search_iteration_kph) > REQUIRED_PRECISION_OF_SPEED and compute_iterations_performed < MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION:
+    while (upper_bound_for_next_search_iteration_kph - lower_bound_for_next_search_iteration_kph) > REQUIRED_PRECISION_OF_SPEED and compute_iterations_performed < MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION:
+
+        mid_point_kph =safe_divide( (lower_bound_for_next_search_iteration_kph + upper_bound_for_next_search_iteration_kph), 2)
+
+        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [mid_point_kph] * num_riders, max_exertion_intensity_factor)
+
+        compute_iterations_performed += 1
+
+        if any(rider_contribution.effort_constraint_violation_reason for rider_contribution in dict_of_rider_contributions.values()):
+            upper_bound_for_next_search_iteration_kph = mid_point_kph
+        else:
+            lower_bound_for_next_search_iteration_kph = mid_point_kph
+
+    # Knowing the speed, we can rework the contributions and thus the solution
+    speed_of_paceline,dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [upper_bound_for_next_search_iteration_kph] * num_riders , max_exertion_intensity_factor)
+
+    answer = PacelineComputationReportItem(
+        algorithm_ran_to_completion                 = True,  
+        compute_iterations_performed_count          = compute_iterations_performed,
+        bracketing_iterations_performed_count       = bracketing_iterations_performed,
+        exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
+        calculated_average_speed_of_paceline_kph    = speed_of_paceline,
+        calculated_dispersion_of_intensity_of_effort= calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions),
+        rider_contributions                         = dict_of_rider_contributions,
+
+    )
+
+    return answer
+
+
+def generate_a_single_paceline_solution_using_vectorized_binary_search(paceline_ingredients: PacelineIngredientsItem,
+) -> PacelineComputationReportItem:
+    """
+    Alternative engine to generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    The search is the same - the same safe upper bound hunt, the same bisection, the same
+    iteration count - but each probe is scored by the NumPy batch kernel in jgh_formulae10
+    rather than by building work assignments, exertions and contributions out of dataclasses.
+    Rider attributes are extracted into arrays once per call. Once the speed is pinned down,
+    the contributions are materialised a single time with the regular object pipeline so
+    that the report is indistinguishable from the one produced by the original engine.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    Returns:
+        PacelineComputationReportItem: Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    riders = paceline_ingredients.riders_list
+    standard_pull_periods_seconds = list(paceline_ingredients.sequence_of_pull_periods_sec)
+    lowest_conceivable_kph = truncate(paceline_ingredients.pull_speeds_kph[0],3)
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+
+    num_riders = len(riders)
+
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    sequence_as_array = np.array([standard_pull_periods_seconds[:num_riders]], dtype=np.float64)
+
+    def is_in_violation(speed_kph: float) -> bool:
+        return bool(evaluate_rotation_sequences_at_speed(rider_arrays, sequence_as_array, speed_kph, max_exertion_intensity_factor).any_effort_constraint_violated[0])
+
+    compute_iterations_performed: int = 0
+
+    lower_bound_for_next_search_iteration_kph = lowest_conceivable_kph
+    upper_bound_for_next_search_iteration_kph = lower_bound_for_next_search_iteration_kph
+
+    for _ in range(SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH):
+
+        if is_in_violation(upper_bound_for_next_search_iteration_kph):
+            break
+
+        upper_bound_for_next_search_iteration_kph += CHUNK_OF_KPH_PER_ITERATION
+
+        compute_iterations_performed += 1
+    else:
+        # the last probe was made before the final increment, so that is the speed whose contributions are reported
+        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [upper_bound_for_next_search_iteration_kph - CHUNK_OF_KPH_PER_ITERATION] * num_riders, max_exertion_intensity_factor)
+
+        return PacelineComputationReportItem(
+            algorithm_ran_to_completion                     = False,
+            exertion_intensity_constraint_used              = paceline_ingredients.max_exertion_intensity_factor,
+            compute_iterations_performed_count              = compute_iterations_performed,
+            bracketing_iterations_performed_count           = compute_iterations_performed,
+            calculated_average_speed_of_paceline_kph        =0,
+            calculated_dispersion_of_intensity_of_effort    = 999,
+            rider_contributions                             = dict_of_rider_contributions,
+        )
+
+    bracketing_iterations_performed = compute_iterations_performed
+
+    while (upper_bound_for_next_search_iteration_kph - lower_bound_for_next_search_iteration_kph) > REQUIRED_PRECISION_OF_SPEED and compute_iterations_performed < MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION:
+
+        mid_point_kph =safe_divide( (lower_bound_for_next_search_iteration_kph + upper_bound_for_next_search_iteration_kph), 2)
+
+        compute_iterations_performed += 1
+
+        if is_in_violation(mid_point_kph):
+            upper_bound_for_next_search_iteration_kph = mid_point_kph
+        else:
+            lower_bound_for_next_search_iteration_kph = mid_point_kph
+
+    speed_of_paceline,dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [upper_bound_for_next_search_iteration_kph] * num_riders , max_exertion_intensity_factor)
+
+    return PacelineComputationReportItem(
+        algorithm_ran_to_completion                 = True,
+        compute_iterations_performed_count          = compute_iterations_performed,
+        bracketing_iterations_performed_count       = bracketing_iterations_performed,
+        exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
+        calculated_average_speed_of_paceline_kph    = speed_of_paceline,
+        calculated_dispersion_of_intensity_of_effort= calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions),
+        rider_contributions                         = dict_of_rider_contributions,
+    )
+
+
+def generate_a_single_paceline_solution_using_analytic_binding_speed(paceline_ingredients: PacelineIngredientsItem,
+) -> PacelineComputationReportItem:
+    """
+    Alternative engine to generate_a_single_paceline_solution_complying_with_exertion_constraints()
+    that removes the search altogether.
+
+    Each puller's pull-watts constraint and intensity constraint are solved directly for the
+    speed at which they bind (see calculate_binding_speeds_of_riders_in_rotation_sequences()
+    in jgh_formulae10). The least of these is the speed the binary search homes in on. The
+    binary search reports a speed up to REQUIRED_PRECISION_OF_SPEED above it; this engine
+    reports the binding speed itself, nudged up by a hair so that the binding rider's
+    contribution is flagged just as it is in the binary search's answer.
+
+    The edge cases of the binary search are preserved. If the seed speed is already in
+    violation, the seed speed is the answer. If nothing is in violation by the last speed the
+    binary search would have probed (including sequences in which nobody pulls), the same
+    incomplete report is returned.
+
+    compute_iterations_performed_count is the number of evaluations made, normally two: one
+    for the binding speeds and one to materialise the contributions.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    Returns:
+        PacelineComputationReportItem: Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    riders = paceline_ingredients.riders_list
+    standard_pull_periods_seconds = list(paceline_ingredients.sequence_of_pull_periods_sec)
+    lowest_conceivable_kph = truncate(paceline_ingredients.pull_speeds_kph[0],3)
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+
+    num_riders = len(riders)
+
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    binding_kph = float(calculate_binding_speeds_of_rotation_sequences(rider_arrays, np.array([standard_pull_periods_seconds[:num_riders]], dtype=np.float64), max_exertion_intensity_factor)[0])
+
+    compute_iterations_performed: int = 1
+
+    highest_speed_probed_by_binary_search_kph = lowest_conceivable_kph + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+
+    if not binding_kph <= highest_speed_probed_by_binary_search_kph:
+        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [highest_speed_probed_by_binary_search_kph] * num_riders, max_exertion_intensity_factor)
+
+        return PacelineComputationReportItem(
+            algorithm_ran_to_completion                     = False,
+            exertion_intensity_constraint_used              = paceline_ingredients.max_exertion_intensity_factor,
+            compute_iterations_performed_count              = compute_iterations_performed + 1,
+            calculated_average_speed_of_paceline_kph        =0,
+            calculated_dispersion_of_intensity_of_effort    = 999,
+            rider_contributions                             = dict_of_rider_contributions,
+        )
+
+    nudge_kph = 1e-9 * max(1.0, abs(binding_kph))
+    speed_kph = lowest_conceivable_kph if binding_kph <= lowest_conceivable_kph else binding_kph + nudge_kph
+
+    # the binding speed is exact, so in floating point the binding rider can land a whisker either side of the limit
+    for _ in range(MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION):
+        speed_of_paceline,dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [speed_kph] * num_riders , max_exertion_intensity_factor)
+        compute_iterations_performed += 1
+        if any(rider_contribution.effort_constraint_violation_reason for rider_contribution in dict_of_rider_contributions.values()):
+            break
+        speed_kph += nudge_kph
+        nudge_kph *= 2
+
+    return PacelineComputationReportItem(
+        algorithm_ran_to_completion                 = True,
+        compute_iterations_performed_count          = compute_iterations_performed,
+        exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
+        calculated_average_speed_of_paceline_kph    = speed_of_paceline,
+        calculated_dispersion_of_intensity_of_effort= calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions),
+        rider_contributions                         = dict_of_rider_contributions,
+    )
+
+
+def generate_a_single_paceline_solution_using_bound_informed_binary_search(paceline_ingredients: PacelineIngredientsItem,
+) -> PacelineComputationReportItem:
+    """
+    Alternative engine to generate_a_single_paceline_solution_complying_with_exertion_constraints()
+    that seeds the bisection with a bracket derived from the pullers' own caps instead of
+    hunting upwards from the seed speed in chunks of CHUNK_OF_KPH_PER_ITERATION.
+
+    The bracket comes from calculate_speed_bracket_of_rotation_sequences() in jgh_formulae10.
+    Its upper end is the slowest puller's speed at their pull cap, where somebody is bound to be
+    in violation, so the bracket is usually confirmed with a single probe. Should the probe
+    come back clean (floating point at the very edge of a cap), the upper end gallops upwards
+    from GALLOPING_SEARCH_INITIAL_STEP_KPH, doubling each time, no further than the last speed
+    the chunked hunt would have probed. Then the bracket is bisected to REQUIRED_PRECISION_OF_SPEED
+    exactly as before. When the pull caps bind, the bracket is already narrower than that and
+    no bisection is needed at all.
+
+    The edge cases of the binary search are preserved. If the seed speed is already in
+    violation, the seed speed is the answer. If nothing is in violation by the last speed the
+    binary search would have probed (including sequences in which nobody pulls), the same
+    incomplete report is returned.
+
+    Probes are scored by the batch kernel. bracketing_iterations_performed_count is the
+    number of probes spent establishing the bracket, and is included in
+    compute_iterations_performed_count.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    Returns:
+        PacelineComputationReportItem: Same as for generate_a_single_paceline_solution_complying_with_exertion_constraints().
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    riders = paceline_ingredients.riders_list
+    standard_pull_periods_seconds = list(paceline_ingredients.sequence_of_pull_periods_sec)
+    lowest_conceivable_kph = truncate(paceline_ingredients.pull_speeds_kph[0],3)
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+
+    num_riders = len(riders)
+
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    sequence_as_array = np.array([standard_pull_periods_seconds[:num_riders]], dtype=np.float64)
+
+    def is_in_violation(speed_kph: float) -> bool:
+        return bool(evaluate_rotation_sequences_at_speed(rider_arrays, sequence_as_array, speed_kph, max_exertion_intensity_factor).any_effort_constraint_violated[0])
+
+    lower_bounds_kph, upper_bounds_kph = calculate_speed_bracket_of_rotation_sequences(rider_arrays, sequence_as_array, max_exertion_intensity_factor)
+
+    highest_speed_probed_by_binary_search_kph = lowest_conceivable_kph + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+
+    # the upper end of the bracket is exact, so nudge it a hair into violation
+    upper_bound_kph = float(upper_bounds_kph[0])
+    upper_bound_kph = upper_bound_kph + 1e-9 * max(1.0, abs(upper_bound_kph))
+
+    lower_bound_for_next_search_iteration_kph = max(lowest_conceivable_kph, min(float(lower_bounds_kph[0]), highest_speed_probed_by_binary_search_kph))
+    upper_bound_for_next_search_iteration_kph = max(lower_bound_for_next_search_iteration_kph, min(upper_bound_kph, highest_speed_probed_by_binary_search_kph))
+
+    compute_iterations_performed: int = 0
+
+    # the chunked hunt starts by probing the seed speed. Only necessary here if the seed is not known to be safe.
+    is_seed_in_violation = False
+    if lowest_conceivable_kph > lower_bounds_kph[0]:
+        compute_iterations_performed += 1
+        is_seed_in_violation = is_in_violation(lowest_conceivable_kph)
+
+    if is_seed_in_violation:
+        upper_bound_for_next_search_iteration_kph = lowest_conceivable_kph
+    else:
+        galloping_step_kph = GALLOPING_SEARCH_INITIAL_STEP_KPH
+
+        for _ in range(SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH):
+
+            compute_iterations_performed += 1
+
+            if is_in_violation(upper_bound_for_next_search_iteration_kph):
+                break
+
+            if upper_bound_for_next_search_iteration_kph >= highest_speed_probed_by_binary_search_kph:
+                _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [highest_speed_probed_by_binary_search_kph] * num_riders, max_exertion_intensity_factor)
+
+                return PacelineComputationReportItem(
+                    algorithm_ran_to_completion                     = False,
+                    exertion_intensity_constraint_used              = paceline_ingredients.max_exertion_intensity_factor,
+                    compute_iterations_performed_count              = compute_iterations_performed,
+                    bracketing_iterations_performed_count           = compute_iterations_performed,
+                    calculated_average_speed_of_paceline_kph        =0,
+                    calculated_dispersion_of_intensity_of_effort    = 999,
+                    rider_contributions                             = dict_of_rider_contributions,
+                )
+
+            # the bracket was loose. Gallop.
+            lower_bound_for_next_search_iteration_kph = upper_bound_for_next_search_iteration_kph
+            upper_bound_for_next_search_iteration_kph = min(upper_bound_for_next_search_iteration_kph + galloping_step_kph, highest_speed_probed_by_binary_search_kph)
+            galloping_step_kph *= 2
+
+    bracketing_iterations_performed = compute_iterations_performed
+
+    while (upper_bound_for_next_search_iteration_kph - lower_bound_for_next_search_iteration_kph) > REQUIRED_PRECISION_OF_SPEED and compute_iterations_performed < MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION:
+
+        mid_point_kph =safe_divide( (lower_bound_for_next_search_iteration_kph + upper_bound_for_next_search_iteration_kph), 2)
+
+        compute_iterations_performed += 1
+
+        if is_in_violation(mid_point_kph):
+            upper_bound_for_next_search_iteration_kph = mid_point_kph
+        else:
+            lower_bound_for_next_search_iteration_kph = mid_point_kph
+
+    speed_of_paceline,dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [upper_bound_for_next_search_iteration_kph] * num_riders , max_exertion_intensity_factor)
+
+    return PacelineComputationReportItem(
+        algorithm_ran_to_completion                 = True,
+        compute_iterations_performed_count          = compute_iterations_performed,
+        bracketing_iterations_performed_count       = bracketing_iterations_performed,
+        exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
+        calculated_average_speed_of_paceline_kph    = speed_of_paceline,
+        calculated_dispersion_of_intensity_of_effort= calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions),
+        rider_contributions                         = dict_of_rider_contributions,
+    )
+
+
+def generate_a_single_paceline_solution(paceline_ingredients: PacelineIngredientsItem,
+) -> PacelineComputationReportItem:
+    """
+    Computes a single paceline solution with the engine nominated in paceline_ingredients.solver_engine,
+    times it, and counts its lookups of the exertion fragment memo of this process. If telemetry is
+    enabled in this process, emits a record of the task (see emit_paceline_solver_task_telemetry()).
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY, OTHER THAN THE TELEMETRY RECORD. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    The telemetry record is the one exception: it is emitted only when telemetry is on, and a worker then logs to the queue of the QueueListener of the parent and to nothing else (see initialise_paceline_solver_worker()).
+    """
+    start_time = time.perf_counter()
+    hits_before, misses_before = exertion_fragment_memo.get_counters()
+
+    try:
+        if paceline_ingredients.solver_engine == PacelineSolverEngineEnum.VECTORIZED_BINARY_SEARCH:
+            answer = generate_a_single_paceline_solution_using_vectorized_binary_search(paceline_ingredients)
+        elif paceline_ingredients.solver_engine == PacelineSolverEngineEnum.ANALYTIC_BINDING_SPEED:
+            answer = generate_a_single_paceline_solution_using_analytic_binding_speed(paceline_ingredients)
+        elif paceline_ingredients.solver_engine == PacelineSolverEngineEnum.BOUND_INFORMED_BINARY_SEARCH:
+            answer = generate_a_single_paceline_solution_using_bound_informed_binary_search(paceline_ingredients)
+        else:
+            answer = generate_a_single_paceline_solution_complying_with_exertion_constraints(paceline_ingredients)
+    except Exception:
+        if paceline_solver_telemetry_enabled:
+            emit_paceline_solver_task_telemetry(paceline_ingredients.sequence_of_pull_periods_sec, 0, "exception", time.perf_counter() - start_time)
+        raise
+
+    answer.computational_time = time.perf_counter() - start_time
+    hits_after, misses_after = exertion_fragment_memo.get_counters()
+    answer.exertion_memo_hits_count = hits_after - hits_before
+    answer.exertion_memo_misses_count = misses_after - misses_before
+
+    if paceline_solver_telemetry_enabled:
+        emit_paceline_solver_task_telemetry(paceline_ingredients.sequence_of_pull_periods_sec, answer.compute_iterations_performed_count,
+            "converged" if answer.algorithm_ran_to_completion else "did_not_converge", answer.computational_time)
+
+    return answer
+
+
+# Per-task telemetry of the solver. Off unless enable_paceline_solver_telemetry() has been called, in which
+# case every task emits a DEBUG record to paceline_solver_telemetry_logger with its telemetry in the
+# task_telemetry attribute. In a worker the record goes on the queue of the QueueListener of the parent (see
+# jgh_configure_logging() in jgh_logging), which hands it to the logger of the same name in the parent, so
+# nothing is written from the worker. In the parent the records go to the collector of the run and no
+# further: they do not propagate, so as not to flood the console.
+paceline_solver_telemetry_enabled: bool = False
+paceline_solver_telemetry_logger = logging.getLogger(f"{__name__}.telemetry")
+paceline_solver_telemetry_logger.setLevel(logging.DEBUG)
+paceline_solver_telemetry_logger.propagate = False
+
+
+def emit_paceline_solver_task_telemetry(sequence: List[float], iterations: int, exit_reason: str, wall_time_sec: float) -> None:
+    paceline_solver_telemetry_logger.debug("paceline solver task", extra={"task_telemetry": {
+        "sequence"      : tuple(sequence),
+        "iterations"    : iterations,
+        "exit_reason"   : exit_reason,
+        "wall_time_sec" : wall_time_sec,
+        "pid"           : os.getpid(),
+    }})
+
+
+def enable_paceline_solver_telemetry(enabled: bool = True) -> None:
+    """
+    Turns per-task telemetry of the solver on or off in this process and in the workers of paceline_solver_worker_pool.
+    Turning it on starts the QueueListener of jgh_logging if it is not running. Workers pick up the change when next
+    started, which the next parallel call does if need be. Off, it costs a test of a flag per sequence.
+
+    While it is on, the workers are started by spawn rather than fork. The listener runs a thread in this process,
+    and forking a process in which other threads are running can deadlock the child.
+    """
+    global paceline_solver_telemetry_enabled
+    paceline_solver_telemetry_enabled = enabled
+    paceline_solver_worker_pool.start_method = "spawn" if enabled else None
+    if enabled:
+        jgh_start_logging_queue_listener()
+
+
+def summarise_paceline_solver_telemetry(telemetry: List[Dict[str, Any]], num_tasks_expected: int) -> PacelineSolverTelemetrySummaryItem:
+    num_tasks_by_exit_reason: DefaultDict[str, int] = defaultdict(int)
+    num_tasks_by_worker_pid: DefaultDict[int, int] = defaultdict(int)
+    busy_seconds_by_worker_pid: DefaultDict[int, float] = defaultdict(float)
+
+    for task in telemetry:
+        num_tasks_by_exit_reason[task["exit_reason"]] += 1
+        num_tasks_by_worker_pid[task["pid"]] += 1
+        busy_seconds_by_worker_pid[task["pid"]] += task["wall_time_sec"]
+
+    total_wall_time_sec = sum(task["wall_time_sec"] for task in telemetry)
+    slowest = max(telemetry, key=lambda task: task["wall_time_sec"], default=None)
+
+    return PacelineSolverTelemetrySummaryItem(
+        num_tasks                   = len(telemetry),
+        num_tasks_by_exit_reason    = dict(num_tasks_by_exit_reason),
+        num_tasks_by_worker_pid     = dict(num_tasks_by_worker_pid),
+        busy_seconds_by_worker_pid  = dict(busy_seconds_by_worker_pid),
+        total_iterations            = sum(task["iterations"] for task in telemetry),
+        total_wall_time_sec         = total_wall_time_sec,
+        mean_wall_time_sec          = safe_divide(total_wall_time_sec, len(telemetry)),
+        max_wall_time_sec           = 0.0 if slowest is None else slowest["wall_time_sec"],
+        slowest_sequence            = () if slowest is None else slowest["sequence"],
+        num_tasks_missing           = max(0, num_tasks_expected - len(telemetry)),
+    )
+
+
+def log_paceline_solver_telemetry_summary(summary: PacelineSolverTelemetrySummaryItem) -> None:
+    if summary.num_tasks == 0 and summary.num_tasks_missing == 0:
+        return
+
+    message_lines = [
+        f"\nSolver telemetry: {format_number_with_comma_separators(summary.num_tasks)} tasks, {format_number_with_comma_separators(summary.total_iterations)} iterations, "
+        f"mean {1000 * summary.mean_wall_time_sec:.2f}ms, max {1000 * summary.max_wall_time_sec:.2f}ms for {list(summary.slowest_sequence)}.",
+        f"Exit reasons: {', '.join(f'{reason} {count}' for reason, count in sorted(summary.num_tasks_by_exit_reason.items()))}.",
+        *[f"Worker {pid}: {summary.num_tasks_by_worker_pid[pid]} tasks, busy {summary.busy_seconds_by_worker_pid[pid]:.2f}s." for pid in sorted(summary.num_tasks_by_worker_pid)],
+        *([f"Telemetry of {summary.num_tasks_missing} tasks never arrived."] if summary.num_tasks_missing else []),
+    ]
+    log_multiline(message_lines)
+
+
+def initialise_paceline_solver_worker(riders: List[ZsunItem], telemetry_queue: Any = None) -> None:
+    """
+    Runs once in each worker of paceline_solver_worker_pool as it starts. By then the worker has
+    imported the solver modules and the constants. This fills the cache of rider power profiles
+    (see get_rider_power_profile() in jgh_formulae02) for the riders of the call that started the
+    pool. Riders of later calls are added to it as they are first seen. If given a telemetry_queue,
+    the worker logs to it, and only to it, and emits telemetry.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION. IT RUNS IN THE WORKERS OF THE ProcessPoolExecutor.
+    """
+    global paceline_solver_telemetry_enabled
+
+    for rider in riders:
+        get_rider_power_profile(rider)
+
+    paceline_solver_telemetry_logger.handlers.clear() # a forked worker inherits the collector of the run in the parent
+
+    if telemetry_queue is not None:
+        jgh_configure_worker_logging(telemetry_queue)
+        paceline_solver_telemetry_logger.propagate = True # up to the QueueHandler on the root logger of the worker
+        paceline_solver_telemetry_enabled = True
+
+
+# One pool for every planning call in the process, so that workers are spawned, and modules
+# imported in them, once and not once per call. Started on first use. Owners of the process
+# must call shutdown_paceline_solver_worker_pool() when they have no more planning to do.
+paceline_solver_worker_pool = PersistentProcessPool(initializer=initialise_paceline_solver_worker)
+
+
+def make_initargs_of_paceline_solver_worker_pool(riders: List[ZsunItem]) -> Tuple[List[ZsunItem], Any]:
+    """
+    The initargs for initialise_paceline_solver_worker(): the riders and, if telemetry is enabled, the queue of the
+    QueueListener. A queue can only be handed to a worker as it starts, so if the running workers were started
+    with another, or without, they are shut down for the pool to be started afresh.
+    """
+    telemetry_queue = jgh_get_logging_queue() if paceline_solver_telemetry_enabled else None
+    if paceline_solver_worker_pool.is_running and paceline_solver_worker_pool.initargs[1:] != (telemetry_queue,):
+        paceline_solver_worker_pool.shutdown()
+    return riders, telemetry_queue
+
+
+def shutdown_paceline_solver_worker_pool() -> None:
+    """Stops the workers of paceline_solver_worker_pool. The next parallel call starts new ones."""
+    paceline_solver_worker_pool.shutdown()
+
+
+# In each worker of paceline_solver_worker_pool, what every chunk of the current batch of the chunked
+# parallel strategy shares: the ingredients and the matrix of rotation sequences. Keyed by a token
+# for the batch. Never modified once installed.
+paceline_solver_worker_payload: Dict[str, Tuple[PacelineIngredientsItem, NDArray[np.float64]]] = {}
+
+
+def install_paceline_solver_worker_payload(token: str, paceline_ingredients: PacelineIngredientsItem, rotation_sequences: NDArray[np.float64]) -> None:
+    """
+    Runs once in each worker at the start of a batch of the chunked parallel strategy. Only the
+    current batch is kept.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION. IT RUNS IN THE WORKERS OF THE ProcessPoolExecutor.
+    """
+    paceline_solver_worker_payload.clear()
+    paceline_solver_worker_payload[token] = (paceline_ingredients, rotation_sequences)
+
+
+def solve_chunk_of_paceline_rotation_sequences(paceline_ingredients: PacelineIngredientsItem, rotation_sequences: NDArray[np.float64],
+    indices: NDArray[np.int32]
+) -> NDArray[np.void]:
+    """
+    Solves the rotation sequences at the given indices and packs the solutions into rows of a
+    PacelineSolutionsTable. A sequence that raises is left unsolved, with a NaN speed.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    chunk = PacelineSolutionsTable.allocate(len(indices), len(paceline_ingredients.riders_list), paceline_ingredients.max_exertion_intensity_factor)
+
+    for position, idx in enumerate(indices.tolist()):
+        ingredients_of_sequence = PacelineIngredientsItem(
+            riders_list                     = paceline_ingredients.riders_list,
+            sequence_of_pull_periods_sec    = rotation_sequences[idx].tolist(),
+            pull_speeds_kph                 = paceline_ingredients.pull_speeds_kph,
+            max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+            solver_engine                   = paceline_ingredients.solver_engine)
+        try:
+            result = generate_a_single_paceline_solution(ingredients_of_sequence)
+        except Exception:
+            continue
+        result.calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(result.rider_contributions)
+        result.rotation_sequence_index = position
+        record_report_in_paceline_solutions_table(chunk, result)
+
+    chunk.rows["rotation_sequence_index"] = indices
+
+    return chunk.rows
+
+
+def install_several_paceline_solver_worker_payloads(payloads: Dict[str, Tuple[PacelineIngredientsItem, NDArray[np.float64]]]) -> None:
+    """
+    As install_paceline_solver_worker_payload(), for several batches to be solved side by side, each under its own token.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION. IT RUNS IN THE WORKERS OF THE ProcessPoolExecutor.
+    """
+    paceline_solver_worker_payload.clear()
+    paceline_solver_worker_payload.update(payloads)
+
+
+def generate_chunk_of_paceline_solutions(token: str, indices: NDArray[np.int32]) -> NDArray[np.void]:
+    """
+    Solves the rotation sequences at the given indices of the installed batch. The rows travel back as a single array.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    paceline_ingredients, rotation_sequences = paceline_solver_worker_payload[token]
+
+    return solve_chunk_of_paceline_rotation_sequences(paceline_ingredients, rotation_sequences, indices)
+
+
+def generate_chunk_of_paceline_solutions_of_one_of_several_batches(token: str, indices: NDArray[np.int32]) -> Tuple[str, NDArray[np.void]]:
+    """
+    As generate_chunk_of_paceline_solutions(), with the token of the batch alongside the rows, so that the rows can be told apart from those of the other batches.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    return token, generate_chunk_of_paceline_solutions(token, indices)
+
+
+def get_numeric_fields_of_riders(riders: List[ZsunItem]) -> Tuple[Tuple[str, ...], NDArray[np.float64]]:
+    """
+    The names of the numeric fields of ZsunItem and a (riders, fields) matrix of their values. Every
+    field that bears on a solution is numeric, so a rider rebuilt from them solves identically.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(ZsunItem) if isinstance(f.default, (int, float)) and not isinstance(f.default, bool))
+    return field_names, np.array([[float(getattr(rider, name)) for name in field_names] for rider in riders], dtype=np.float64).reshape(len(riders), len(field_names))
+
+
+def make_riders_from_numeric_fields(field_names: Tuple[str, ...], values: NDArray[np.float64]) -> List[ZsunItem]:
+    defaults = {f.name: f.default for f in dataclasses.fields(ZsunItem)}
+    return [
+        ZsunItem(**{name: int(value) if isinstance(defaults[name], int) else float(value) for name, value in zip(field_names, row)})
+        for row in values.tolist()
+    ]
+
+
+# In each worker of paceline_solver_worker_pool, its attachment to the shared memory blocks of the current
+# batch of the shared memory parallel strategy, and what it has made of them: the ingredients, the matrix
+# of sequences and the rows of the table. Replaced when a task of a new batch arrives.
+paceline_solver_worker_attachment: Dict[str, Any] = {}
+
+
+def attach_paceline_solver_worker_to_shared_memory(blocks: PacelineSharedMemoryBlocksItem) -> Tuple[PacelineIngredientsItem, NDArray[np.float64], NDArray[np.void]]:
+    """
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION. IT RUNS IN THE WORKERS OF THE ProcessPoolExecutor.
+    """
+    if paceline_solver_worker_attachment.get("blocks") != blocks:
+        handles = paceline_solver_worker_attachment.get("handles", [])
+        paceline_solver_worker_attachment.clear() # drop the arrays over the old blocks before closing them
+        for handle in handles:
+            release_shared_memory(handle)
+
+        sequences_block, rotation_sequences = attach_shared_array(blocks.rotation_sequences_name, (blocks.num_sequences, blocks.num_riders), np.float64)
+        riders_block, rider_parameters = attach_shared_array(blocks.rider_parameters_name, (blocks.num_riders, len(blocks.rider_parameter_fields)), np.float64)
+        solutions_block, rows = attach_shared_array(blocks.solutions_name, (blocks.num_sequences,), PacelineSolutionsTable.make_dtype(blocks.num_riders))
+
+        riders = make_riders_from_numeric_fields(blocks.rider_parameter_fields, rider_parameters)
+
+        paceline_solver_worker_attachment.update(
+            blocks      = blocks,
+            handles     = [sequences_block, riders_block, solutions_block],
+            ingredients = PacelineIngredientsItem(
+                riders_list                     = riders,
+                pull_speeds_kph                 = [blocks.pull_speed_kph] * len(riders),
+                max_exertion_intensity_factor   = blocks.max_exertion_intensity_factor,
+                solver_engine                   = blocks.solver_engine),
+            rotation_sequences = rotation_sequences,
+            rows        = rows,
+        )
+
+    return paceline_solver_worker_attachment["ingredients"], paceline_solver_worker_attachment["rotation_sequences"], paceline_solver_worker_attachment["rows"]
+
+
+def generate_chunk_of_paceline_solutions_in_shared_memory(blocks: PacelineSharedMemoryBlocksItem, indices: NDArray[np.int32]) -> Tuple[int, float]:
+    """
+    Solves the rotation sequences at the given indices of the batch in shared memory and writes their rows
+    straight into the shared table. Only the number of sequences solved and the time they took travel back.
+
+    WARNING: DO NOT USE LOGGING IN THIS FUNCTION OR ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY. IT IS CALLED BY THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    paceline_ingredients, rotation_sequences, rows = attach_paceline_solver_worker_to_shared_memory(blocks)
+
+    chunk_rows = solve_chunk_of_paceline_rotation_sequences(paceline_ingredients, rotation_sequences, indices)
+    rows[indices] = chunk_rows
+
+    return count_and_time_solved_rows(chunk_rows)
+
+
+def count_and_time_solved_rows(rows: NDArray[np.void]) -> Tuple[int, float]:
+    is_solved = ~np.isnan(rows["calculated_average_speed_of_paceline_kph"])
+    return int(is_solved.sum()), float(rows["computational_time"][is_solved].sum())
+
+
+def calculate_size_of_next_parallel_chunk(seconds_per_sequence: float, sequences_remaining: int, num_workers: int) -> int:
+    """
+    Enough sequences to take about TARGET_SECONDS_PER_PARALLEL_CHUNK, within MIN_ and MAX_SEQUENCES_PER_PARALLEL_CHUNK,
+    and no more than a fair share of what is left for every worker, so that none sits idle while another finishes.
+    Before any timings are in, the minimum.
+    """
+    if seconds_per_sequence <= 0:
+        size = MIN_SEQUENCES_PER_PARALLEL_CHUNK
+    else:
+        size = min(max(round(TARGET_SECONDS_PER_PARALLEL_CHUNK / seconds_per_sequence), MIN_SEQUENCES_PER_PARALLEL_CHUNK), MAX_SEQUENCES_PER_PARALLEL_CHUNK)
+
+    fair_share = -(-sequences_remaining // max(num_workers, 1))
+
+    return max(1, min(size, fair_share))
+
+
+def generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    consume_report: Optional[Callable[[PacelineComputationReportItem], None]] = None
+) -> List[PacelineComputationReportItem]:
+    """
+    Compute paceline paceline_computation_reports for a set of candidate pull period sequences using serial (single-threaded) processing.
+
+    This function evaluates each candidate paceline rotation schedule one at a time, generating a solution for each by
+    invoking the exertion-constrained paceline solver. For each alternative, it constructs a PacelineIngredientsItem
+    with the specified pull periods, computes the optimal paceline speed and rider contributions, and collects the results.
+    Any exceptions encountered during computation are logged and the corresponding alternative is skipped.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            The base input parameters for the computation, including the list of riders, initial pull speeds,
+            and exertion constraints. The pull periods are overridden for each alternative.
+        paceline_rotation_sequence_alternatives: List[List[float]]
+            A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        consume_report: Optional[Callable[[PacelineComputationReportItem], None]]
+            If given, each report is handed to it as soon as it is ready and is not kept, and the returned list is empty.
+
+    Returns:
+        List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative.
+            Each report contains the number of compute iterations performed and the computed rider contributions.
+
+    Notes:
+        - This function processes alternatives sequentially and is intended for use when the number of alternatives is small.
+        - If an exception occurs for a particular alternative, it is logged and that alternative is skipped.
+        - For large numbers of alternatives, consider using parallel processing for improved performance.
+    """
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                     = paceline_ingredients.riders_list,
+        pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
+        max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+        solver_engine                   = paceline_ingredients.solver_engine)
+
+    paceline_computation_reports: List[PacelineComputationReportItem] = []
+    consume_report = consume_report or paceline_computation_reports.append
+
+    for idx, sequence in enumerate(paceline_rotation_sequence_alternatives):
+        try:
+            paceline_ingredients.sequence_of_pull_periods_sec = list(sequence)
+            result = generate_a_single_paceline_solution(paceline_ingredients)
+            answer = PacelineComputationReportItem(
+                algorithm_ran_to_completion                 = result.algorithm_ran_to_completion,
+                compute_iterations_performed_count          = result.compute_iterations_performed_count,
+                bracketing_iterations_performed_count       = result.bracketing_iterations_performed_count,
+                computational_time                          = result.computational_time,
+                exertion_memo_hits_count                    = result.exertion_memo_hits_count,
+                exertion_memo_misses_count                  = result.exertion_memo_misses_count,
+                exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
+                calculated_average_speed_of_paceline_kph    = result.calculated_average_speed_of_paceline_kph,
+                calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(result.rider_contributions),
+                rider_contributions                         = result.rider_contributions,
+                rotation_sequence_index                     = idx,
+            )
+            consume_report(answer)
+
+        except Exception as exc:
+            # serial processing, so we can log the error, logging OK
+            logger.error(f"Exception in function generate_paceline_solutions_using_serial_processing_algorithm(): {exc}")
+
+    return paceline_computation_reports
+
+
+def generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    consume_report: Optional[Callable[[PacelineComputationReportItem], None]] = None
+) -> List[PacelineComputationReportItem]:
+    """
+    Computes paceline paceline_computation_reports for multiple candidate pull period sequences using parallel processing with a work-stealing process pool.
+    The pool is paceline_solver_worker_pool, kept warm across calls.
+
+    This function distributes the evaluation of each candidate paceline rotation schedule across available CPU cores using a process pool,
+    allowing for efficient computation when the number of alternatives is large. For each alternative, it constructs a PacelineIngredientsItem
+    with the specified pull periods, computes the optimal paceline speed and rider contributions, and collects the results. Invalid or incomplete
+    results are skipped. DO NOT USE LOGGING IN ANY FUNCTIONS CALLED BY THE ProcessPoolExecutor. IT WILL LEAD TO GARBAGE OUTPUT.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            The base input parameters for the computation, including the list of riders, initial pull speeds,
+            and exertion constraints. The pull periods are overridden for each alternative.
+        paceline_rotation_sequence_alternatives: List[List[float]]
+            A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        consume_report: Optional[Callable[[PacelineComputationReportItem], None]]
+            If given, each report is handed to it as soon as it is ready and is not kept, and the returned list is empty.
+
+    Returns:
+        List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative.
+            Each report contains the number of compute iterations performed and the computed rider contributions.
+
+    Notes:
+        - This function is intended for use when the number of alternatives is large enough to benefit from parallel processing.
+        - If an exception occurs for a particular alternative, it is logged and that alternative is skipped.
+        - Invalid or incomplete results are logged as warnings and not included in the output list.
+
+    WARNING: DO NOT USE LOGGING IN ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY WITHIN THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+
+    """
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                     = paceline_ingredients.riders_list,
+        pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
+        max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+        solver_engine                   = paceline_ingredients.solver_engine)
+
+    list_of_instructions: List[PacelineIngredientsItem] = []    
+    
+    for sequence in paceline_rotation_sequence_alternatives:
+        paceline_ingredients.sequence_of_pull_periods_sec = list(sequence)
+        list_of_instructions.append(deepcopy(paceline_ingredients))
+
+    paceline_computation_reports: List[PacelineComputationReportItem] = []
+    consume_report = consume_report or paceline_computation_reports.append
+
+    executor = paceline_solver_worker_pool.get_executor(make_initargs_of_paceline_solver_worker_pool(paceline_ingredients.riders_list))
+
+    future_to_params = {
+        executor.submit(generate_a_single_paceline_solution, p): idx
+        for idx, p in enumerate(list_of_instructions)
+    }
+    for future in concurrent.futures.as_completed(future_to_params):
+        try:
+            result = future.result()
+            idx = future_to_params.pop(future) # release the result once it has been consumed
+
+            answer = PacelineComputationReportItem(
+                algorithm_ran_to_completion              = result.algorithm_ran_to_completion,
+                compute_iterations_performed_count       = result.compute_iterations_performed_count,
+                bracketing_iterations_performed_count    = result.bracketing_iterations_performed_count,
+                computational_time                       = result.computational_time,
+                exertion_memo_hits_count                 = result.exertion_memo_hits_count,
+                exertion_memo_misses_count               = result.exertion_memo_misses_count,
+                exertion_intensity_constraint_used       = paceline_ingredients.max_exertion_intensity_factor,
+                calculated_average_speed_of_paceline_kph = result.calculated_average_speed_of_paceline_kph,
+                calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(result.rider_contributions),
+                rider_contributions                      = result.rider_contributions,
+                rotation_sequence_index                  = idx,
+            )
+            consume_report(answer)
+        except Exception as exc:
+            logger.error(f"Exception in function generate_paceline_solutions_using_parallel_workstealing_algorithm(): {exc}")
+
+
+    return paceline_computation_reports
+
+
+def populate_paceline_solutions_table_using_parallel_chunked_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    table: PacelineSolutionsTable
+) -> None:
+    """
+    Fills a PacelineSolutionsTable by solving the sequences in parallel, in chunks.
+
+    Unlike generate_paceline_solutions_using_parallel_workstealing_algorithm(), the ingredients and the matrix of
+    sequences are not copied into every task. They are installed once in every worker of paceline_solver_worker_pool
+    (see install_paceline_solver_worker_payload()), after which a task is no more than a block of sequence indices,
+    and its answer a block of table rows (see generate_chunk_of_paceline_solutions()). Chunks start at
+    MIN_SEQUENCES_PER_PARALLEL_CHUNK and are then sized by calculate_size_of_next_parallel_chunk() from the time
+    taken per sequence so far. Two chunks per worker are kept in flight.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            The base input parameters for the computation, including the list of riders, initial pull speeds,
+            and exertion constraints. The pull periods are overridden for each alternative.
+        paceline_rotation_sequence_alternatives: List[List[float]]
+            A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        table: PacelineSolutionsTable
+            Allocated with one row per alternative. Filled in place, other than the is_valid column.
+
+    WARNING: DO NOT USE LOGGING IN ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY WITHIN THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    if not paceline_rotation_sequence_alternatives:
+        return
+
+    sequences = np.array(paceline_rotation_sequence_alternatives, dtype=np.float64)
+
+    shared_ingredients = PacelineIngredientsItem(
+        riders_list                     = paceline_ingredients.riders_list,
+        pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
+        max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+        solver_engine                   = paceline_ingredients.solver_engine)
+
+    token = str(uuid.uuid4())
+    paceline_solver_worker_pool.broadcast(install_paceline_solver_worker_payload, (token, shared_ingredients, sequences), make_initargs_of_paceline_solver_worker_pool(paceline_ingredients.riders_list))
+
+    executor = paceline_solver_worker_pool.get_executor()
+
+    def take_rows(rows: NDArray[np.void]) -> Tuple[int, float]:
+        table.rows[rows["rotation_sequence_index"]] = rows
+        return count_and_time_solved_rows(rows)
+
+    dispatch_chunks_of_paceline_rotation_sequences(len(sequences), lambda indices: executor.submit(generate_chunk_of_paceline_solutions, token, indices), take_rows)
+
+
+def populate_paceline_solutions_table_using_parallel_shared_memory_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    table: PacelineSolutionsTable
+) -> None:
+    """
+    Fills a PacelineSolutionsTable by solving the sequences in parallel, in chunks, with nothing but names,
+    indices and counts pickled.
+
+    The matrix of sequences, the numeric fields of the riders and the rows of the table are placed in blocks
+    of shared memory. Every task is a PacelineSharedMemoryBlocksItem and a block of sequence indices. The
+    worker attaches to the blocks by name, once per batch, and writes its rows straight into the shared
+    table (see generate_chunk_of_paceline_solutions_in_shared_memory()). Chunks are sized as by
+    populate_paceline_solutions_table_using_parallel_chunked_algorithm(). The blocks are unlinked when done.
+
+    Args:
+        As for populate_paceline_solutions_table_using_parallel_chunked_algorithm().
+
+    WARNING: DO NOT USE LOGGING IN ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY WITHIN THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    """
+    if not paceline_rotation_sequence_alternatives:
+        return
+
+    riders = paceline_ingredients.riders_list
+    field_names, rider_parameters = get_numeric_fields_of_riders(riders)
+
+    sequences_block, shared_sequences = create_shared_array((len(paceline_rotation_sequence_alternatives), len(riders)), np.float64)
+    riders_block, shared_rider_parameters = create_shared_array(rider_parameters.shape, np.float64)
+    solutions_block, shared_rows = create_shared_array(table.rows.shape, table.rows.dtype)
+
+    try:
+        shared_sequences[:] = np.array(paceline_rotation_sequence_alternatives, dtype=np.float64)
+        shared_rider_parameters[:] = rider_parameters
+        shared_rows[:] = table.rows
+
+        blocks = PacelineSharedMemoryBlocksItem(
+            rotation_sequences_name         = sequences_block.name,
+            rider_parameters_name           = riders_block.name,
+            solutions_name                  = solutions_block.name,
+            num_sequences                   = len(shared_sequences),
+            num_riders                      = len(riders),
+            rider_parameter_fields          = field_names,
+            pull_speed_kph                  = paceline_ingredients.pull_speeds_kph[0],
+            max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+            solver_engine                   = paceline_ingredients.solver_engine)
+
+        executor = paceline_solver_worker_pool.get_executor(make_initargs_of_paceline_solver_worker_pool(riders))
+
+        dispatch_chunks_of_paceline_rotation_sequences(len(shared_sequences), lambda indices: executor.submit(generate_chunk_of_paceline_solutions_in_shared_memory, blocks, indices), lambda counts: counts)
+
+        table.rows[:] = shared_rows
+    finally:
+        del shared_sequences, shared_rider_parameters, shared_rows # drop the arrays over the blocks before closing them
+        for block in [sequences_block, riders_block, solutions_block]:
+            release_shared_memory(block, unlink=True)
+
+
+def dispatch_chunks_of_paceline_rotation_sequences(num_sequences: int, submit_chunk: Callable[[NDArray[np.int32]], concurrent.futures.Future],
+    take_answer: Callable[[Any], Tuple[int, float]], boundaries: Optional[List[int]] = None
+) -> None:
+    """
+    Hands the sequence indices 0..num_sequences-1 to submit_chunk() in blocks sized by calculate_size_of_next_parallel_chunk(),
+    keeping two chunks per worker of paceline_solver_worker_pool in flight. take_answer() is given the answer of each
+    chunk as it completes and returns the number of sequences it solved and the seconds they took, from which the
+    next chunks are sized. A chunk that raises is logged and skipped. No chunk spans any of the indices in boundaries:
+    a chunk that would is cut short there.
+    """
+    num_workers = paceline_solver_worker_pool.max_workers
+    sorted_boundaries = np.unique(np.asarray(boundaries if boundaries else [], dtype=np.int64))
+
+    next_index = 0
+    sequences_timed = 0
+    seconds_timed = 0.0
+    futures_in_flight: Set[concurrent.futures.Future] = set()
+
+    def submit_chunks_while_there_is_room() -> None:
+        nonlocal next_index
+        while next_index < num_sequences and len(futures_in_flight) < 2 * num_workers:
+            size = calculate_size_of_next_parallel_chunk(safe_divide(seconds_timed, sequences_timed), num_sequences - next_index, num_workers)
+            next_boundary = np.searchsorted(sorted_boundaries, next_index, side="right")
+            if next_boundary < len(sorted_boundaries):
+                size = min(size, int(sorted_boundaries[next_boundary]) - next_index)
+            futures_in_flight.add(submit_chunk(np.arange(next_index, next_index + size, dtype=np.int32)))
+            next_index += size
+
+    submit_chunks_while_there_is_room()
+
+    while futures_in_flight:
+        done, futures_in_flight = concurrent.futures.wait(futures_in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            try:
+                solved, seconds = take_answer(future.result())
+                sequences_timed += solved
+                seconds_timed += seconds
+            except Exception as exc:
+                logger.error(f"Exception in function dispatch_chunks_of_paceline_rotation_sequences(): {exc}")
+        submit_chunks_while_there_is_room()
+
+
+def generate_paceline_solutions_using_parallel_chunked_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    consume_report: Optional[Callable[[PacelineComputationReportItem], None]] = None,
+    use_shared_memory: bool = False
+) -> List[PacelineComputationReportItem]:
+    """
+    Computes paceline_computation_reports with populate_paceline_solutions_table_using_parallel_chunked_algorithm(),
+    or populate_paceline_solutions_table_using_parallel_shared_memory_algorithm() if use_shared_memory,
+    rebuilding a report from every solved row of the table. Sequences that raised are skipped.
+
+    Args:
+        As for generate_paceline_solutions_using_parallel_workstealing_algorithm().
+
+    Returns:
+        List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative, in the same order.
+    """
+    table = PacelineSolutionsTable.allocate(len(paceline_rotation_sequence_alternatives), len(paceline_ingredients.riders_list), paceline_ingredients.max_exertion_intensity_factor)
+
+    if use_shared_memory:
+        populate_paceline_solutions_table_using_parallel_shared_memory_algorithm(paceline_ingredients, paceline_rotation_sequence_alternatives, table)
+    else:
+        populate_paceline_solutions_table_using_parallel_chunked_algorithm(paceline_ingredients, paceline_rotation_sequence_alternatives, table)
+
+    paceline_computation_reports: List[PacelineComputationReportItem] = []
+    consume_report = consume_report or paceline_computation_reports.append
+
+    for row in np.flatnonzero(~np.isnan(table.rows["calculated_average_speed_of_paceline_kph"])):
+        consume_report(materialize_paceline_computation_report_from_solutions_table(table, int(row), paceline_ingredients.riders_list))
+
+    return paceline_computation_reports
+
+
+def generate_paceline_solutions_using_lockstep_batched_bisection_algorithm(paceline_ingredients: PacelineIngredientsItem,
+    paceline_rotation_sequence_alternatives: List[List[float]],
+    consume_report: Optional[Callable[[PacelineComputationReportItem], None]] = None
+) -> List[PacelineComputationReportItem]:
+    """
+    Computes paceline_computation_reports for a set of candidate pull period sequences by bisecting all of them together.
+
+    Instead of running a binary search per sequence, this function keeps lower and upper speed brackets as vectors
+    across every sequence and advances them in lock-step, scoring every sequence still in play with one call to the
+    batch kernel per round (see bisect_rotation_sequences_in_lockstep() in jgh_formulae10). Sequences retire as they
+    converge. The contributions of all sequences are then materialised from one final batch evaluation. The probes are
+    identical to those of generate_a_single_paceline_solution_complying_with_exertion_constraints(), so are the answers.
+    paceline_ingredients.solver_engine plays no part.
+
+    Args:
+        paceline_ingredients: PacelineIngredientsItem
+            The base input parameters for the computation, including the list of riders, initial pull speeds,
+            and exertion constraints. The pull periods are overridden for each alternative.
+        paceline_rotation_sequence_alternatives: List[List[float]]
+            A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        consume_report: Optional[Callable[[PacelineComputationReportItem], None]]
+            If given, each report is handed to it as soon as it is ready and is not kept, and the returned list is empty.
+
+    Returns:
+        List[PacelineComputationReportItem]: A list of computation reports, one for each alternative, in the same order.
+
+    Notes:
+        - Runs in the calling process. The work is vectorised rather than distributed.
+    """
+    riders = paceline_ingredients.riders_list
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+
+    if not paceline_rotation_sequence_alternatives:
+        return []
+
+    sequences = np.array(paceline_rotation_sequence_alternatives, dtype=np.float64)
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+
+    start_time = time.perf_counter()
+
+    speeds_kph, iterations, bracketing_iterations, found = bisect_rotation_sequences_in_lockstep(rider_arrays, sequences, truncate(paceline_ingredients.pull_speeds_kph[0], 3), max_exertion_intensity_factor)
+
+    list_of_rider_contributions, batch = materialize_rider_contributions_from_batch_evaluation(riders, rider_arrays, sequences, speeds_kph, max_exertion_intensity_factor)
+
+    # the work is shared, so each sequence is charged an equal slice of it
+    time_per_sequence = (time.perf_counter() - start_time) / len(list_of_rider_contributions)
+
+    paceline_computation_reports: List[PacelineComputationReportItem] = []
+    consume_report = consume_report or paceline_computation_reports.append
+
+    for idx, dict_of_rider_contributions in enumerate(list_of_rider_contributions):
+        ran_to_completion = bool(found[idx])
+        consume_report(PacelineComputationReportItem(
+            algorithm_ran_to_completion                  = ran_to_completion,
+            compute_iterations_performed_count           = int(iterations[idx]),
+            bracketing_iterations_performed_count        = int(bracketing_iterations[idx]),
+            computational_time                           = time_per_sequence,
+            exertion_intensity_constraint_used           = max_exertion_intensity_factor,
+            calculated_average_speed_of_paceline_kph     = float(batch.average_speed_of_paceline_kph[idx]) if ran_to_completion else 0,
+            calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions) if ran_to_completion else 999,
+            rider_contributions                          = dict_of_rider_contributions,
+            rotation_sequence_index                      = idx,
+        ))
+
+    return paceline_computation_reports
+
+
+PACELINE_DISPATCH_CALIBRATION_FILE_PATH = get_user_cache_dirpath(DISPATCH_CALIBRATION_FILE_NAME)
+
+
+def make_key_of_paceline_worker_pool_of_this_host() -> str:
+    return "|".join([platform.node(), paceline_solver_worker_pool.start_method or multiprocessing.get_start_method(), str(paceline_solver_worker_pool.max_workers)])
+
+
+def make_key_of_paceline_dispatch_calibration(paceline_ingredients: PacelineIngredientsItem) -> str:
+    return "|".join([make_key_of_paceline_worker_pool_of_this_host(), str(len(paceline_ingredients.riders_list)), paceline_ingredients.solver_engine.value])
+
+
+def read_paceline_dispatch_calibration(key: str, file_path: str) -> Optional[PacelineDispatchCalibrationItem]:
+    """
+    The calibration cached under key in the JSON file at file_path, if there is one. A missing or unreadable file is no calibration.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as json_file:
+            entry = json.load(json_file).get(key)
+        return None if entry is None else PacelineDispatchCalibrationItem(**entry)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        logger.warning(f"Ignoring unreadable dispatch calibration file {file_path}: {exc}")
+        return None
+
+
+def write_paceline_dispatch_calibration(calibration: PacelineDispatchCalibrationItem, file_path: str) -> None:
+    """
+    Adds the calibration to the JSON file at file_path, keeping the calibrations of other keys, and makes its directory
+    if need be. The file is replaced whole, so a reader never sees it half written. Failing to write is logged, not
+    raised: the calibration is only a cache.
+    """
+    calibrations: Dict[str, Any] = {}
+    try:
+        with open(file_path, "r", encoding="utf-8") as json_file:
+            calibrations = json.load(json_file)
+    except (OSError, ValueError):
+        pass
+    if not isinstance(calibrations, dict):
+        calibrations = {}
+
+    calibrations[calibration.key] = dataclasses.asdict(calibration)
+
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", mode=0o700, exist_ok=True)
+        temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_file_path, "w", encoding="utf-8") as json_file:
+            json.dump(calibrations, json_file, indent=4)
+        os.replace(temporary_file_path, file_path)
+    except OSError as exc:
+        logger.warning(f"Unable to save dispatch calibration to {file_path}: {exc}")
+
+
+def read_saved_paceline_pool_start_seconds(file_path: str) -> float:
+    """
+    The most that starting paceline_solver_worker_pool took in any calibration saved in the JSON file at file_path for this
+    host, start method and number of workers, whatever its riders and engine: starting the pool costs the same whichever
+    pacelines it goes on to solve. DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS if none measured it.
+    """
+    prefix = make_key_of_paceline_worker_pool_of_this_host() + "|"
+    try:
+        with open(file_path, "r", encoding="utf-8") as json_file:
+            calibrations = json.load(json_file)
+        measured = [float(entry["pool_start_seconds"]) for key, entry in calibrations.items() if key.startswith(prefix) and entry.get("pool_start_seconds", 0.0) > 0.0]
+    except (OSError, ValueError, TypeError, AttributeError, KeyError):
+        measured = []
+    return max(measured, default=DISPATCH_CALIBRATION_DEFAULT_POOL_START_SECONDS)
+
+
+def measure_paceline_dispatch_calibration(paceline_ingredients: PacelineIngredientsItem, sample_of_rotation_sequences: List[List[float]],
+    calibration_file_path: str = PACELINE_DISPATCH_CALIBRATION_FILE_PATH
+) -> PacelineDispatchCalibrationItem:
+    """
+    Measures on this host what it costs to solve the sample serially and by lock-step bisection, and, if there is more than
+    one worker, what it costs to start paceline_solver_worker_pool and to send a worker a task. The pool is left running.
+    Its start is timed only if it is not running already: warm workers are never shut down to be timed. Their start is
+    then taken from read_saved_paceline_pool_start_seconds() on the calibrations at calibration_file_path.
+
+    The cost of lock-step bisection is mostly per round, not per sequence, so it is timed on the sample and on the sample
+    four times over, and split into a fixed cost and a cost per sequence.
+    """
+    num_workers = paceline_solver_worker_pool.max_workers
+
+    start_time = time.perf_counter()
+    generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, sample_of_rotation_sequences, lambda report: None)
+    serial_seconds_per_sequence = (time.perf_counter() - start_time) / len(sample_of_rotation_sequences)
+
+    lockstep_fixed_seconds = 0.0
+    lockstep_seconds_per_sequence = 0.0
+    if paceline_ingredients.solver_engine == PacelineSolverEngineEnum.BINARY_SEARCH:
+        seconds_by_size: Dict[int, float] = {}
+        for sequences in [sample_of_rotation_sequences, sample_of_rotation_sequences * 4]:
+            start_time = time.perf_counter()
+            generate_table_of_paceline_solutions(paceline_ingredients, sequences, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION)
+            seconds_by_size[len(sequences)] = time.perf_counter() - start_time
+        (small, small_seconds), (large, large_seconds) = sorted(seconds_by_size.items())
+        lockstep_seconds_per_sequence = max(0.0, (large_seconds - small_seconds) / (large - small))
+        lockstep_fixed_seconds = max(0.0, small_seconds - small * lockstep_seconds_per_sequence)
+
+    pool_start_seconds = 0.0
+    parallel_task_overhead_seconds = 0.0
+    if num_workers > 1:
+        initargs = make_initargs_of_paceline_solver_worker_pool(paceline_ingredients.riders_list)
+        if paceline_solver_worker_pool.is_running:
+            pool_start_seconds = read_saved_paceline_pool_start_seconds(calibration_file_path)
+        else:
+            start_time = time.perf_counter()
+            paceline_solver_worker_pool.broadcast(time.perf_counter, (), initargs)
+            pool_start_seconds = time.perf_counter() - start_time
+
+        executor = paceline_solver_worker_pool.get_executor(initargs)
+        round_trips = 8
+        start_time = time.perf_counter()
+        for _ in range(round_trips):
+            executor.submit(time.perf_counter).result()
+        parallel_task_overhead_seconds = (time.perf_counter() - start_time) / round_trips
+
+    return PacelineDispatchCalibrationItem(
+        key                             = make_key_of_paceline_dispatch_calibration(paceline_ingredients),
+        num_workers                     = num_workers,
+        serial_seconds_per_sequence     = serial_seconds_per_sequence,
+        lockstep_fixed_seconds          = lockstep_fixed_seconds,
+        lockstep_seconds_per_sequence   = lockstep_seconds_per_sequence,
+        pool_start_seconds              = pool_start_seconds,
+        parallel_task_overhead_seconds  = parallel_task_overhead_seconds,
+        when_calibrated                 = datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+def predict_seconds_of_paceline_processing_strategies(calibration: PacelineDispatchCalibrationItem, num_sequences: int,
+    solver_engine: PacelineSolverEngineEnum, pool_is_running: bool
+) -> Dict[PacelineProcessingStrategyEnum, float]:
+    """
+    The cost model of the dispatcher. Serial is the sequences times their cost. Parallel chunked is the same work shared
+    among the workers, plus a round trip for every chunk of the smallest size, shared likewise, plus starting the pool if it
+    is not running. It is no contender with one worker. Lock-step is its fixed cost plus the sequences times their cost.
+    It is no contender unless the solver engine is binary search, the one engine whose answers it reproduces.
+    """
+    serial_seconds = num_sequences * calibration.serial_seconds_per_sequence
+
+    parallel_seconds = math.inf
+    if calibration.num_workers > 1:
+        num_chunks = math.ceil(num_sequences / MIN_SEQUENCES_PER_PARALLEL_CHUNK)
+        parallel_seconds = (0.0 if pool_is_running else calibration.pool_start_seconds) + (
+            num_chunks * calibration.parallel_task_overhead_seconds + serial_seconds) / calibration.num_workers
+
+    lockstep_seconds = math.inf
+    if solver_engine == PacelineSolverEngineEnum.BINARY_SEARCH:
+        lockstep_seconds = calibration.lockstep_fixed_seconds + num_sequences * calibration.lockstep_seconds_per_sequence
 
-        mid_point_kph =safe_divide( (lower_bound_for_next_search_iteration_kph + upper_bound_for_next_search_iteration_kph), 2)
+    return {
+        PacelineProcessingStrategyEnum.SERIAL                       : serial_seconds,
+        PacelineProcessingStrategyEnum.PARALLEL_CHUNKED             : parallel_seconds,
+        PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION   : lockstep_seconds,
+    }
 
-        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [mid_point_kph] * num_riders, max_exertion_intensity_factor)
 
-        compute_iterations_performed += 1
+def choose_paceline_processing_strategy(paceline_ingredients: PacelineIngredientsItem, rotation_sequences: List[List[float]],
+    calibration_file_path: str = PACELINE_DISPATCH_CALIBRATION_FILE_PATH
+) -> PacelineDispatchDecisionItem:
+    """
+    Chooses the processing strategy predicted to solve the rotation sequences soonest on this host: serial, parallel chunked
+    or lock-step batched bisection.
 
-        if any(rider_contribution.effort_constraint_violation_reason for rider_contribution in dict_of_rider_contributions.values()):
-            upper_bound_for_next_search_iteration_kph = mid_point_kph
-        else:
-            lower_bound_for_next_search_iteration_kph = mid_point_kph
+    The prediction comes from predict_seconds_of_paceline_processing_strategies() and a calibration of this host, read from
+    the JSON file at calibration_file_path or, failing that, measured on a sample of the sequences with
+    measure_paceline_dispatch_calibration() and saved there. Batches smaller than DISPATCH_CALIBRATION_SAMPLE_SIZE are not
+    worth calibrating for, so they are solved serially unless a calibration is already saved. On a tie, the simpler
+    strategy wins: serial, then lock-step, then parallel.
 
-    # Knowing the speed, we can rework the contributions and thus the solution
-    speed_of_paceline,dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, standard_pull_periods_seconds, [upper_bound_for_next_search_iteration_kph] * num_riders , max_exertion_intensity_factor)
+    Returns:
+        PacelineDispatchDecisionItem: The strategy chosen, the times predicted and the calibration they came from.
+    """
+    key = make_key_of_paceline_dispatch_calibration(paceline_ingredients)
 
-    answer = PacelineComputationReportItem(
-        algorithm_ran_to_completion                 = True,  
-        compute_iterations_performed_count          = compute_iterations_performed,
-        exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
-        calculated_average_speed_of_paceline_kph    = speed_of_paceline,
-        calculated_dispersion_of_intensity_of_effort= calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions),
-        rider_contributions                         = dict_of_rider_contributions,
+    calibration = read_paceline_dispatch_calibration(key, calibration_file_path)
+    calibration_was_cached = calibration is not None
+
+    if calibration is None:
+        if len(rotation_sequences) < DISPATCH_CALIBRATION_SAMPLE_SIZE:
+            return PacelineDispatchDecisionItem(processing_strategy=PacelineProcessingStrategyEnum.SERIAL, num_sequences=len(rotation_sequences),
+                predicted_seconds_parallel=math.inf, predicted_seconds_lockstep=math.inf)
+
+        stride = len(rotation_sequences) // DISPATCH_CALIBRATION_SAMPLE_SIZE
+        calibration = measure_paceline_dispatch_calibration(paceline_ingredients, rotation_sequences[::stride][:DISPATCH_CALIBRATION_SAMPLE_SIZE], calibration_file_path)
+        write_paceline_dispatch_calibration(calibration, calibration_file_path)
 
+    predicted_seconds = predict_seconds_of_paceline_processing_strategies(calibration, len(rotation_sequences), paceline_ingredients.solver_engine, paceline_solver_worker_pool.is_running)
+
+    order_of_preference = [PacelineProcessingStrategyEnum.SERIAL, PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION, PacelineProcessingStrategyEnum.PARALLEL_CHUNKED]
+    processing_strategy = min(order_of_preference, key=lambda strategy: predicted_seconds[strategy])
+
+    decision = PacelineDispatchDecisionItem(
+        processing_strategy         = processing_strategy,
+        num_sequences               = len(rotation_sequences),
+        predicted_seconds_serial    = predicted_seconds[PacelineProcessingStrategyEnum.SERIAL],
+        predicted_seconds_parallel  = predicted_seconds[PacelineProcessingStrategyEnum.PARALLEL_CHUNKED],
+        predicted_seconds_lockstep  = predicted_seconds[PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION],
+        calibration                 = calibration,
+        calibration_was_cached      = calibration_was_cached,
     )
 
-    return answer
+    logger.debug(f"Dispatching {len(rotation_sequences)} sequences {processing_strategy.value}. Predicted seconds: serial {decision.predicted_seconds_serial:.3f}, parallel {decision.predicted_seconds_parallel:.3f}, lock-step {decision.predicted_seconds_lockstep:.3f}")
 
+    return decision
 
-def generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients: PacelineIngredientsItem,
-    paceline_rotation_sequence_alternatives: List[List[float]]
+
+def generate_paceline_solutions_using_serial_and_parallel_algorithms(paceline_ingredients: PacelineIngredientsItem, rotation_sequences : List[List[float]],
+    processing_strategy: Optional[PacelineProcessingStrategyEnum] = None,
+    consume_report: Optional[Callable[[PacelineComputationReportItem], None]] = None
 ) -> List[PacelineComputationReportItem]:
     """
-    Compute paceline paceline_computation_reports for a set of candidate pull period sequences using serial (single-threaded) processing.
+    Computes paceline solutions for a set of candidate pull period sequences using the most efficient processing strategy.
 
-    This function evaluates each candidate paceline rotation schedule one at a time, generating a solution for each by
-    invoking the exertion-constrained paceline solver. For each alternative, it constructs a PacelineIngredientsItem
-    with the specified pull periods, computes the optimal paceline speed and rider contributions, and collects the results.
-    Any exceptions encountered during computation are logged and the corresponding alternative is skipped.
+    Unless told which, this function chooses between serial, parallel chunked and lock-step batched bisection processing with
+    choose_paceline_processing_strategy(), which predicts from a calibration of this host which will be soonest done for this
+    many alternatives. Each alternative is evaluated to determine the optimal paceline speed and rider contributions under
+    exertion constraints.
 
     Args:
         paceline_ingredients: PacelineIngredientsItem
             The base input parameters for the computation, including the list of riders, initial pull speeds,
             and exertion constraints. The pull periods are overridden for each alternative.
-        paceline_rotation_sequence_alternatives: List[List[float]]
+        rotation_sequences: List[List[float]]
             A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        processing_strategy: Optional[PacelineProcessingStrategyEnum]
+            Forces a strategy: serial, parallel work-stealing, parallel chunked, parallel shared memory or lock-step batched bisection. If None,
+            the choice is made by choose_paceline_processing_strategy().
+        consume_report: Optional[Callable[[PacelineComputationReportItem], None]]
+            If given, each report is handed to it as soon as it is ready and is not kept, and the returned list is empty.
 
     Returns:
         List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative.
             Each report contains the number of compute iterations performed and the computed rider contributions.
 
     Notes:
-        - This function processes alternatives sequentially and is intended for use when the number of alternatives is small.
+        - The first automatic choice on a host calibrates it on a sample of the alternatives, which takes a moment. The calibration is cached on disk.
         - If an exception occurs for a particular alternative, it is logged and that alternative is skipped.
-        - For large numbers of alternatives, consider using parallel processing for improved performance.
+        - For large numbers of alternatives, parallel processing can significantly reduce computation time.
     """
 
-    paceline_ingredients = PacelineIngredientsItem(
-        riders_list                     = paceline_ingredients.riders_list,
-        pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
-        max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor)
+    if processing_strategy is None:
+        processing_strategy = choose_paceline_processing_strategy(paceline_ingredients, rotation_sequences).processing_strategy
 
-    paceline_computation_reports: List[PacelineComputationReportItem] = []
+    if processing_strategy == PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION:
+        return generate_paceline_solutions_using_lockstep_batched_bisection_algorithm(paceline_ingredients, rotation_sequences, consume_report)
 
-    for sequence in paceline_rotation_sequence_alternatives:
-        try:
-            paceline_ingredients.sequence_of_pull_periods_sec = list(sequence)
-            result = generate_a_single_paceline_solution_complying_with_exertion_constraints(paceline_ingredients)
-            answer = PacelineComputationReportItem(
-                algorithm_ran_to_completion                 = result.algorithm_ran_to_completion,
-                compute_iterations_performed_count          = result.compute_iterations_performed_count,
-                exertion_intensity_constraint_used          = paceline_ingredients.max_exertion_intensity_factor,
-                calculated_average_speed_of_paceline_kph    = result.calculated_average_speed_of_paceline_kph,
-                calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(result.rider_contributions),
-                rider_contributions                         = result.rider_contributions,
-            )
-            paceline_computation_reports.append(answer)
+    if processing_strategy == PacelineProcessingStrategyEnum.SERIAL:
+        return generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, rotation_sequences, consume_report)
 
-        except Exception as exc:
-            # serial processing, so we can log the error, logging OK
-            logger.error(f"Exception in function generate_paceline_solutions_using_serial_processing_algorithm(): {exc}")
+    if processing_strategy == PacelineProcessingStrategyEnum.PARALLEL_WORKSTEALING:
+        return generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients, rotation_sequences, consume_report)
 
-    return paceline_computation_reports
+    if processing_strategy == PacelineProcessingStrategyEnum.PARALLEL_CHUNKED:
+        return generate_paceline_solutions_using_parallel_chunked_algorithm(paceline_ingredients, rotation_sequences, consume_report)
 
+    if processing_strategy == PacelineProcessingStrategyEnum.PARALLEL_SHARED_MEMORY:
+        return generate_paceline_solutions_using_parallel_chunked_algorithm(paceline_ingredients, rotation_sequences, consume_report, use_shared_memory=True)
 
-def generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients: PacelineIngredientsItem,
-    paceline_rotation_sequence_alternatives: List[List[float]]
-) -> List[PacelineComputationReportItem]:
+    return generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, rotation_sequences, consume_report)
+
+
+def generate_table_of_paceline_solutions(paceline_ingredients: PacelineIngredientsItem, rotation_sequences : List[List[float]],
+    processing_strategy: Optional[PacelineProcessingStrategyEnum] = None
+) -> PacelineSolutionsTable:
     """
-    Computes paceline paceline_computation_reports for multiple candidate pull period sequences using parallel processing with a work-stealing process pool.
+    Computes paceline solutions for a set of candidate pull period sequences into a PacelineSolutionsTable,
+    one row per sequence in the order given.
 
-    This function distributes the evaluation of each candidate paceline rotation schedule across available CPU cores using a process pool,
-    allowing for efficient computation when the number of alternatives is large. For each alternative, it constructs a PacelineIngredientsItem
-    with the specified pull periods, computes the optimal paceline speed and rider contributions, and collects the results. Invalid or incomplete
-    results are skipped. DO NOT USE LOGGING IN ANY FUNCTIONS CALLED BY THE ProcessPoolExecutor. IT WILL LEAD TO GARBAGE OUTPUT.
+    Serial and parallel work-stealing solutions are reduced to their row as each report comes in, and the
+    report is dropped. The parallel chunked strategy gets its rows back from the workers ready made, the
+    parallel shared memory strategy has the workers write them into the table in place, and the lock-step strategy goes straight from its arrays to the table, so neither builds a report per sequence.
+    If no strategy is given, it is chosen by choose_paceline_processing_strategy().
 
     Args:
         paceline_ingredients: PacelineIngredientsItem
-            The base input parameters for the computation, including the list of riders, initial pull speeds,
-            and exertion constraints. The pull periods are overridden for each alternative.
-        paceline_rotation_sequence_alternatives: List[List[float]]
+            As for generate_paceline_solutions_using_serial_and_parallel_algorithms().
+        rotation_sequences: List[List[float]]
             A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
+        processing_strategy: Optional[PacelineProcessingStrategyEnum]
+            As for generate_paceline_solutions_using_serial_and_parallel_algorithms().
 
     Returns:
-        List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative.
-            Each report contains the number of compute iterations performed and the computed rider contributions.
+        PacelineSolutionsTable: The solutions, with the is_valid column set.
+    """
+    riders = paceline_ingredients.riders_list
+    table = PacelineSolutionsTable.allocate(len(rotation_sequences), len(riders), paceline_ingredients.max_exertion_intensity_factor)
 
-    Notes:
-        - This function is intended for use when the number of alternatives is large enough to benefit from parallel processing.
-        - If an exception occurs for a particular alternative, it is logged and that alternative is skipped.
-        - Invalid or incomplete results are logged as warnings and not included in the output list.
+    if not rotation_sequences:
+        return table
 
-    WARNING: DO NOT USE LOGGING IN ANY FUNCTIONS IT CALLS DIRECTLY OR INDIRECTLY WITHIN THE ProcessPoolExecutor. ANY CALL TO LOGGING OFF THE MAIN THREAD WILL LEAD TO GARBAGE OUTPUT.
+    if processing_strategy is None:
+        processing_strategy = choose_paceline_processing_strategy(paceline_ingredients, rotation_sequences).processing_strategy
 
-    """
+    if processing_strategy == PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION:
+        sequences = np.array(rotation_sequences, dtype=np.float64)
+        rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
 
-    paceline_ingredients = PacelineIngredientsItem(
-        riders_list                     = paceline_ingredients.riders_list,
-        pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
-        max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor)
+        start_time = time.perf_counter()
 
-    list_of_instructions: List[PacelineIngredientsItem] = []    
-    
-    for sequence in paceline_rotation_sequence_alternatives:
-        paceline_ingredients.sequence_of_pull_periods_sec = list(sequence)
-        list_of_instructions.append(deepcopy(paceline_ingredients))
+        speeds_kph, iterations, bracketing_iterations, found = bisect_rotation_sequences_in_lockstep(rider_arrays, sequences, truncate(paceline_ingredients.pull_speeds_kph[0], 3), paceline_ingredients.max_exertion_intensity_factor)
 
-    paceline_computation_reports: List[PacelineComputationReportItem] = []
+        # the work is shared, so each sequence is charged an equal slice of it
+        time_per_sequence = (time.perf_counter() - start_time) / len(sequences)
 
-    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-        future_to_params = {
-            executor.submit(generate_a_single_paceline_solution_complying_with_exertion_constraints, p): p
-            for p in list_of_instructions
-        }
-        for future in concurrent.futures.as_completed(future_to_params):
-            try:
-                result = future.result()
-
-                answer = PacelineComputationReportItem(
-                    algorithm_ran_to_completion              = result.algorithm_ran_to_completion,
-                    compute_iterations_performed_count       = result.compute_iterations_performed_count,
-                    exertion_intensity_constraint_used       = paceline_ingredients.max_exertion_intensity_factor,
-                    calculated_average_speed_of_paceline_kph = result.calculated_average_speed_of_paceline_kph,
-                    calculated_dispersion_of_intensity_of_effort = calculate_dispersion_of_intensity_of_effort(result.rider_contributions),
-                    rider_contributions                      = result.rider_contributions,
-                )
-                paceline_computation_reports.append(answer)
-            except Exception as exc:
-                logger.error(f"Exception in function generate_paceline_solutions_using_parallel_workstealing_algorithm(): {exc}")
+        populate_paceline_solutions_table_from_batch_evaluation(table, rider_arrays, sequences, speeds_kph, found, iterations, bracketing_iterations, time_per_sequence)
 
+        return table
 
-    return paceline_computation_reports
+    if processing_strategy == PacelineProcessingStrategyEnum.PARALLEL_CHUNKED:
+        populate_paceline_solutions_table_using_parallel_chunked_algorithm(paceline_ingredients, rotation_sequences, table)
+    elif processing_strategy == PacelineProcessingStrategyEnum.PARALLEL_SHARED_MEMORY:
+        populate_paceline_solutions_table_using_parallel_shared_memory_algorithm(paceline_ingredients, rotation_sequences, table)
+    else:
+        generate_paceline_solutions_using_serial_and_parallel_algorithms(paceline_ingredients, rotation_sequences, processing_strategy,
+            lambda report: record_report_in_paceline_solutions_table(table, report))
 
+    mark_valid_rows_of_paceline_solutions_table(table)
 
-def generate_paceline_solutions_using_serial_and_parallel_algorithms(paceline_ingredients: PacelineIngredientsItem, rotation_sequences : List[List[float]]
-) -> List[PacelineComputationReportItem]:
+    return table
+
+
+def order_paceline_rotation_sequences_by_promise(paceline_ingredients: PacelineIngredientsItem, rotation_sequences: List[List[float]]) -> NDArray[np.int64]:
     """
-    Computes paceline solutions for a set of candidate pull period sequences using the most efficient processing strategy.
+    The indices of the rotation sequences, most promising first, for when there may not be time to solve them all.
+    The promise of a sequence is the upper end of its speed bracket, the speed of its slowest puller at their pull
+    cap (see calculate_speed_bracket_of_rotation_sequences() in jgh_formulae10), which no solution of the sequence
+    can beat. It costs one vectorised pass over all the sequences. Ties keep their order.
+    """
+    _, upper_kph = calculate_speed_bracket_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation(paceline_ingredients.riders_list),
+        np.array(rotation_sequences, dtype=np.float64), paceline_ingredients.max_exertion_intensity_factor)
 
-    This function automatically selects between serial and parallel processing based on the number of candidate alternatives.
-    For a small number of alternatives, it uses serial (single-threaded) processing; for larger sets, it leverages parallel
-    work-stealing to utilize multiple CPU cores for improved performance. Each alternative is evaluated to determine the optimal
-    paceline speed and rider contributions under exertion constraints.
+    return np.argsort(-upper_kph, kind="stable")
 
-    Args:
-        paceline_ingredients: PacelineIngredientsItem
-            The base input parameters for the computation, including the list of riders, initial pull speeds,
-            and exertion constraints. The pull periods are overridden for each alternative.
-        rotation_sequences: List[List[float]]
-            A list of candidate pull period schedules to evaluate, where each schedule is a list of pull durations (seconds).
 
-    Returns:
-        List[PacelineComputationReportItem]: A list of computation reports, one for each successfully evaluated alternative.
-            Each report contains the number of compute iterations performed and the computed rider contributions.
+def generate_table_of_paceline_solutions_before_deadline(paceline_ingredients: PacelineIngredientsItem, rotation_sequences: List[List[float]],
+    processing_strategy: PacelineProcessingStrategyEnum, deadline: float
+) -> Tuple[PacelineSolutionsTable, int]:
+    """
+    As generate_table_of_paceline_solutions(), but solving the sequences most promising first, in batches, and stopping
+    when the next batch would not be done by the deadline, a time.perf_counter() reading.
 
-    Notes:
-        - The function chooses serial or parallel processing based on the __SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD__ constant.
-        - If an exception occurs for a particular alternative, it is logged and that alternative is skipped.
-        - For large numbers of alternatives, parallel processing can significantly reduce computation time.
+    The first batch is ANYTIME_SOLVER_FIRST_BATCH_SIZE sequences and is always solved, so that there is something to
+    show however short the time. Each batch after is up to twice the size of the one before, cut down to as many as
+    the time left allows at the rate so far. Rows of sequences left unsolved hold NaN speeds and are not valid.
+
+    Returns:
+        Tuple containing:
+            - PacelineSolutionsTable: One row per sequence in the order given, with the is_valid column set.
+            - int: The number of sequences left unsolved.
     """
+    table = PacelineSolutionsTable.allocate(len(rotation_sequences), len(paceline_ingredients.riders_list), paceline_ingredients.max_exertion_intensity_factor)
+
+    if not rotation_sequences:
+        return table, 0
+
+    order = order_paceline_rotation_sequences_by_promise(paceline_ingredients, rotation_sequences)
+
+    num_solved = 0
+    seconds_spent = 0.0
+    batch_size = ANYTIME_SOLVER_FIRST_BATCH_SIZE
 
-    if len(rotation_sequences) < SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD:
-        return generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, rotation_sequences)
+    while num_solved < len(order):
+        if num_solved > 0:
+            affordable = int((deadline - time.perf_counter()) / safe_divide(seconds_spent, num_solved)) if seconds_spent > 0 else 2 * batch_size
+            batch_size = min(2 * batch_size, affordable)
+            if batch_size < 1:
+                break
+
+        indices = order[num_solved:num_solved + batch_size]
+
+        start_time = time.perf_counter()
+        batch = generate_table_of_paceline_solutions(paceline_ingredients, [rotation_sequences[idx] for idx in indices], processing_strategy)
+        seconds_spent += time.perf_counter() - start_time
+
+        batch.rows["rotation_sequence_index"] = indices
+        table.rows[indices] = batch.rows
+        num_solved += len(indices)
+
+    return table, len(order) - num_solved
+
+
+def materialize_paceline_computation_report_from_solutions_table(table: PacelineSolutionsTable, row_index: int, riders: List[ZsunItem],
+    processing_strategy: Optional[PacelineProcessingStrategyEnum] = None
+) -> PacelineComputationReportItem:
+    """
+    Rebuilds the PacelineComputationReportItem of one row of a PacelineSolutionsTable, working out the
+    RiderContributionItems again at the row's pull_speed_kph the same way the strategy that filled the
+    table worked them out. So they are the very ones the solver produced.
+    """
+    row = table.rows[row_index]
+    sequence = row["p1_duration"].tolist()
+    pull_speed_kph = float(row["pull_speed_kph"])
+
+    if processing_strategy == PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION:
+        list_of_rider_contributions, _ = materialize_rider_contributions_from_batch_evaluation(riders, prepare_rider_arrays_for_batch_evaluation(riders),
+            np.array([sequence], dtype=np.float64), np.array([pull_speed_kph]), table.max_exertion_intensity_factor)
+        dict_of_rider_contributions = list_of_rider_contributions[0]
     else:
-        return generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients, rotation_sequences)
+        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, sequence, [pull_speed_kph] * len(riders), table.max_exertion_intensity_factor)
+
+    return PacelineComputationReportItem(
+        algorithm_ran_to_completion                  = bool(row["algorithm_ran_to_completion"]),
+        compute_iterations_performed_count           = int(row["compute_iterations_performed_count"]),
+        bracketing_iterations_performed_count        = int(row["bracketing_iterations_performed_count"]),
+        computational_time                           = float(row["computational_time"]),
+        exertion_memo_hits_count                     = int(row["exertion_memo_hits_count"]),
+        exertion_memo_misses_count                   = int(row["exertion_memo_misses_count"]),
+        exertion_intensity_constraint_used           = table.max_exertion_intensity_factor,
+        calculated_average_speed_of_paceline_kph     = float(row["calculated_average_speed_of_paceline_kph"]),
+        calculated_dispersion_of_intensity_of_effort = float(row["calculated_dispersion_of_intensity_of_effort"]),
+        rider_contributions                          = dict_of_rider_contributions,
+        rotation_sequence_index                      = int(row["rotation_sequence_index"]),
+    )
+
+
+# the cache the tools share, in the user's own cache directory. Pass it to generate_package_of_paceline_solutions() to use it
+paceline_solution_cache = ContentAddressedDiskCache(get_user_cache_dirpath(PACELINE_SOLUTION_CACHE_DIR_NAME), PACELINE_SOLUTION_CACHE_CEILING_MB * 1024 * 1024)
+
+# the fields of a rider the solver reads, by way of RiderPowerProfileItem.from_ZsunItem() and the pull caps
+FIELDS_OF_RIDER_IN_DIGEST_OF_PACELINE_SOLVER_INPUTS = ["weight_kg", "height_cm", "gender", "zsun_one_hour_curve_coefficient", "zsun_one_hour_curve_exponent", "zsun_TTT_pull_curve_coefficient", "zsun_TTT_pull_curve_exponent"]
+
+
+def make_digest_of_paceline_solver_inputs(paceline_ingredients: PacelineIngredientsItem, retain_all_solutions: bool,
+    keep_solutions_table: bool = True
+) -> str:
+    """
+    The key of a package in the cache of solved packages: a digest of everything that decides the answer. That is the
+    weight, height, gender and curve coefficients and exponents of every rider, in paceline order, the pull periods, the
+    starting speeds, the exertion cap, the solver engine, whether every solution and the table are kept, and the constants the solver
+    runs on. Names, IDs, race scores and the like are left out, so a refreshed snapshot of the club still hits if the
+    riders' curves are unchanged; rebind_riders_of_cached_package() then puts the riders handed in back into the plans.
+    The processing strategy is left out on purpose: every strategy gives the same plans.
+    """
+    return make_stable_digest({
+        "cache_version"                : PACELINE_SOLUTION_CACHE_VERSION,
+        "riders"                       : [{name: getattr(rider, name) for name in FIELDS_OF_RIDER_IN_DIGEST_OF_PACELINE_SOLVER_INPUTS} for rider in paceline_ingredients.riders_list],
+        "pull_periods_sec"             : [float(period) for period in paceline_ingredients.sequence_of_pull_periods_sec],
+        "pull_speeds_kph"              : [float(speed) for speed in paceline_ingredients.pull_speeds_kph],
+        "max_exertion_intensity_factor": float(paceline_ingredients.max_exertion_intensity_factor),
+        "solver_engine"                : paceline_ingredients.solver_engine.value,
+        "retain_all_solutions"         : retain_all_solutions,
+        "keep_solutions_table"         : keep_solutions_table,
+        "constants"                    : {
+            "POWER_CURVE_IN_PACELINE"                                          : POWER_CURVE_IN_PACELINE.tolist(),
+            "SAFE_LOWER_BOUND_KPH"                                             : SAFE_LOWER_BOUND_KPH,
+            "CHUNK_OF_KPH_PER_ITERATION"                                       : CHUNK_OF_KPH_PER_ITERATION,
+            "GALLOPING_SEARCH_INITIAL_STEP_KPH"                                : GALLOPING_SEARCH_INITIAL_STEP_KPH,
+            "SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH": SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH,
+            "REQUIRED_PRECISION_OF_SPEED"                                      : REQUIRED_PRECISION_OF_SPEED,
+            "MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION"           : MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION,
+            "ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL"                     : ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL,
+            "NORMALIZED_WATTS_ROLLING_WINDOW_SEC"                              : NORMALIZED_WATTS_ROLLING_WINDOW_SEC,
+        },
+    })
+
+
+def rebind_riders_of_cached_package(package: PackageOfPacelineComputationReportItem, riders: List[ZsunItem]) -> PackageOfPacelineComputationReportItem:
+    """
+    The package read from the cache, marked served_from_cache, with the riders in the rider_contributions of
+    its solutions replaced, position by position, by the riders handed in. The riders it was solved with may
+    differ from them in fields the digest leaves out, a name or a race score, and callers look their riders up by key.
+    """
+    def rebind(solution: Optional[PacelineComputationReportItem]) -> Optional[PacelineComputationReportItem]:
+        if solution is None:
+            return None
+        return dataclasses.replace(solution, rider_contributions=defaultdict(RiderContributionItem, zip(riders, solution.rider_contributions.values())))
+
+    return dataclasses.replace(package,
+        thirty_sec_solution                   = rebind(package.thirty_sec_solution),
+        sixty_sec_solution                    = rebind(package.sixty_sec_solution),
+        balanced_intensity_of_effort_solution = rebind(package.balanced_intensity_of_effort_solution),
+        everybody_pull_hard_solution          = rebind(package.everybody_pull_hard_solution),
+        hang_in_solution                      = rebind(package.hang_in_solution),
+        all_solutions                         = None if package.all_solutions is None else [rebind(solution) for solution in package.all_solutions],
+        served_from_cache                     = True,
+    )
 
 
 def validate_paceline_ingredients(paceline_ingredients: PacelineIngredientsItem) -> None:
@@ -394,6 +1749,8 @@ def validate_paceline_ingredients(paceline_ingredients: PacelineIngredientsItem)
         raise ValueError("No standard pull durations provided to generate_paceline_solutions_using_serial_processing_algorithm.")
     if any(d < 0 or not np.isfinite(d) for d in paceline_ingredients.sequence_of_pull_periods_sec):
         raise ValueError("All standard pull durations must be positive and finite.")
+    if any(earlier >= later for earlier, later in zip(paceline_ingredients.sequence_of_pull_periods_sec, paceline_ingredients.sequence_of_pull_periods_sec[1:])):
+        raise ValueError("The standard pull durations must be in strictly ascending order, with no duplicates: the pruning of rotation sequences ranks them by position.")
     if (
         not paceline_ingredients.pull_speeds_kph
         or not np.isfinite(paceline_ingredients.pull_speeds_kph[0])
@@ -692,8 +2049,196 @@ def update_candidate_solution(this_solution: PacelineComputationReportItem,
     candidate.dispersion = this_solution_dispersion
     candidate.solution   = this_solution
 
+def find_best_row_of_paceline_solutions_table(eligible: NDArray[np.bool_], primary_to_minimise: NDArray[np.float64],
+    secondary_to_maximise: NDArray[np.float64]
+) -> Optional[int]:
+    """
+    The eligible row lowest in the primary column, ties broken by the highest secondary value and
+    then by the lowest row index. This is the row that wins when the rows are put one by one to the
+    strict comparisons of an is_*_candidate() function.
+    """
+    rows = np.flatnonzero(eligible)
+    if rows.size == 0:
+        return None
+    primary = primary_to_minimise[rows]
+    rows = rows[primary == primary.min()]
+    return int(rows[np.argmax(secondary_to_maximise[rows])])
+
+
+def select_rows_of_candidate_solutions_in_paceline_solutions_table(table: PacelineSolutionsTable
+) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """
+    Picks the winning row of every plan category with argmin/argmax over the columns of the table,
+    by the rules of the is_*_candidate() functions above, applied to the valid rows only.
+
+    Returns:
+        The row indices of the thirty second, sixty second, balanced intensity, everybody pulls hard
+        and hang-in candidates, each None if no row qualifies.
+    """
+    rows = table.rows
+    speed_kph = rows["calculated_average_speed_of_paceline_kph"]
+    dispersion = rows["calculated_dispersion_of_intensity_of_effort"]
+    p1_duration = rows["p1_duration"]
+
+    valid = rows["is_valid"]
+    all_nonzero = (p1_duration != 0.0).all(axis=1)
+    # pull watts never enter into it, see is_zero_dispersion_permissible_for_simple_solution()
+    zero_dispersion_ok = (dispersion != 0.0) | (table.num_riders <= 1) | (p1_duration == p1_duration[:, :1]).all(axis=1)
+
+    # every qualifying solution replaces the one before, so the last one wins
+    thirty_sec_rows = np.flatnonzero(valid & (p1_duration == 30.0).all(axis=1))
+    sixty_sec_rows = np.flatnonzero(valid & (p1_duration == 60.0).all(axis=1))
+
+    thirty_sec_row = int(thirty_sec_rows[-1]) if thirty_sec_rows.size else None
+    sixty_sec_row = int(sixty_sec_rows[-1]) if sixty_sec_rows.size else None
+    balanced_intensity_row = find_best_row_of_paceline_solutions_table(valid & zero_dispersion_ok & all_nonzero, dispersion, speed_kph)
+    everybody_pulls_hard_row = find_best_row_of_paceline_solutions_table(valid & zero_dispersion_ok & all_nonzero, -speed_kph, -dispersion)
+    hang_in_row = find_best_row_of_paceline_solutions_table(valid & zero_dispersion_ok, -speed_kph, -dispersion)
+
+    return thirty_sec_row, sixty_sec_row, balanced_intensity_row, everybody_pulls_hard_row, hang_in_row
+
 # heap powerful
-def generate_package_of_paceline_solutions(paceline_ingredients: PacelineIngredientsItem
+def assemble_package_of_paceline_solutions(paceline_ingredients: PacelineIngredientsItem, table: PacelineSolutionsTable,
+    processing_strategy: Optional[PacelineProcessingStrategyEnum], num_unevaluated: int, start_time: float,
+    retain_all_solutions: bool = False, dispatch_decision: Optional[PacelineDispatchDecisionItem] = None,
+    telemetry_summary: Optional[PacelineSolverTelemetrySummaryItem] = None
+) -> PackageOfPacelineComputationReportItem:
+    """
+    Picks the plans of every category from a table of solutions, one row per rotation sequence, and packs them up
+    with the statistics of the table as generate_package_of_paceline_solutions() returns them. computational_time
+    runs from start_time, a time.perf_counter() reading. Raises RuntimeError if a category has no plan, unless
+    num_unevaluated sequences were left unsolved for want of time.
+    """
+    riders = paceline_ingredients.riders_list
+
+    # only the winners are turned back into RiderContributionItems
+    winning_rows = select_rows_of_candidate_solutions_in_paceline_solutions_table(table)
+    winners = [None if row is None else materialize_paceline_computation_report_from_solutions_table(table, row, riders, processing_strategy) for row in winning_rows]
+
+    time_taken_to_compute = time.perf_counter() - start_time
+
+    # the tags are merely for pretty debugging and logging purposes
+    thirty_sec_candidate, sixty_sec_candidate, balanced_intensity_candidate, everybody_pulls_hard_candidate, hang_in_candidate = [
+        WorthyCandidateSolutionItem(tag=tag, solution=solution)
+        for tag, solution in zip(["30sec   ", "60sec   ", "bal     ", "allpush ", "race    "], winners)
+    ]
+
+    if num_unevaluated == 0:
+        raise_error_if_any_solutions_missing(
+            thirty_sec_candidate,
+            sixty_sec_candidate,
+            balanced_intensity_candidate,
+            everybody_pulls_hard_candidate,
+            hang_in_candidate
+        )
+    else:
+        logger.warning(f"Ran out of time with {format_number_with_comma_separators(num_unevaluated)} of {format_number_with_comma_separators(len(table.rows))} sequences unevaluated. The plans are the best found in time.")
+
+    all_computation_reports = None
+    if retain_all_solutions:
+        all_computation_reports = [materialize_paceline_computation_report_from_solutions_table(table, row, riders, processing_strategy) for row in np.flatnonzero(~np.isnan(table.rows["calculated_average_speed_of_paceline_kph"]))]
+
+    rows = table.rows
+
+    return PackageOfPacelineComputationReportItem(
+        total_pull_sequences_examined           = len(table.rows) - num_unevaluated,
+        total_compute_iterations_performed      = int(rows["compute_iterations_performed_count"].sum()),
+        total_bracketing_iterations_performed   = int(rows["bracketing_iterations_performed_count"].sum()),
+        total_exertion_memo_hits                = int(rows["exertion_memo_hits_count"].sum()),
+        total_exertion_memo_misses              = int(rows["exertion_memo_misses_count"].sum()),
+        computational_time                      = time_taken_to_compute,
+        thirty_sec_solution                     = thirty_sec_candidate.solution,
+        sixty_sec_solution                      = sixty_sec_candidate.solution,
+        balanced_intensity_of_effort_solution   = balanced_intensity_candidate.solution,
+        everybody_pull_hard_solution            = everybody_pulls_hard_candidate.solution,
+        hang_in_solution                        = hang_in_candidate.solution,
+        all_solutions                           = all_computation_reports,
+        solutions_table                         = table,
+        dispatch_decision                       = dispatch_decision,
+        ran_out_of_time                         = num_unevaluated > 0,
+        total_pull_sequences_unevaluated        = num_unevaluated,
+        telemetry_summary                       = telemetry_summary,
+    )
+
+
+def reduce_paceline_solutions_to_package(paceline_ingredients: PacelineIngredientsItem, rotation_sequences: List[List[float]],
+    processing_strategy: Optional[PacelineProcessingStrategyEnum], start_time: float,
+    retain_all_solutions: bool = False, dispatch_decision: Optional[PacelineDispatchDecisionItem] = None
+) -> PackageOfPacelineComputationReportItem:
+    """
+    As assemble_package_of_paceline_solutions(), but with no table. Each report is handed through the consume_report hook
+    of generate_paceline_solutions_using_serial_and_parallel_algorithms() to a CandidateSolutionReducerItem per plan category
+    and to the workload totals, and then dropped. Under the serial and parallel work-stealing strategies, memory therefore
+    stays the same however many sequences there are. The other strategies hold their sequences in arrays while they solve
+    them. The package has no solutions_table. Raises RuntimeError if a category has no plan.
+    """
+    # the tags are merely for pretty debugging and logging purposes
+    thirty_sec_reducer                  = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="30sec   "), is_thirty_second_pulls_solution_candidate)
+    sixty_sec_reducer                   = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="60sec   "), is_sixty_second_pulls_solution_candidate)
+    balanced_intensity_reducer          = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="bal     "), is_balanced_intensity_solution_candidate)
+    everybody_pulls_hard_reducer        = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="allpush "), is_everyone_pull_hard_solution_candidate)
+    hang_in_reducer                     = CandidateSolutionReducerItem(WorthyCandidateSolutionItem(tag="race    "), is_race_solution_with_possibility_of_drop_candidate)
+
+    reducers = [thirty_sec_reducer, sixty_sec_reducer, balanced_intensity_reducer, everybody_pulls_hard_reducer, hang_in_reducer]
+
+    total_compute_iterations_performed = 0
+    total_bracketing_iterations_performed = 0
+    total_exertion_memo_hits = 0
+    total_exertion_memo_misses = 0
+    all_computation_reports: List[PacelineComputationReportItem] = []
+
+    def consume_report(this_solution: PacelineComputationReportItem) -> None:
+        nonlocal total_compute_iterations_performed, total_bracketing_iterations_performed, total_exertion_memo_hits, total_exertion_memo_misses
+
+        total_compute_iterations_performed += this_solution.compute_iterations_performed_count
+        total_bracketing_iterations_performed += this_solution.bracketing_iterations_performed_count
+        total_exertion_memo_hits += this_solution.exertion_memo_hits_count
+        total_exertion_memo_misses += this_solution.exertion_memo_misses_count
+
+        if retain_all_solutions:
+            all_computation_reports.append(this_solution)
+
+        if not is_valid_solution(this_solution):
+            return
+
+        for reducer in reducers:
+            reducer.consume(this_solution)
+
+    generate_paceline_solutions_using_serial_and_parallel_algorithms(paceline_ingredients, rotation_sequences, processing_strategy, consume_report)
+
+    time_taken_to_compute = time.perf_counter() - start_time
+
+    raise_error_if_any_solutions_missing(
+        thirty_sec_reducer.candidate,
+        sixty_sec_reducer.candidate,
+        balanced_intensity_reducer.candidate,
+        everybody_pulls_hard_reducer.candidate,
+        hang_in_reducer.candidate
+    )
+
+    return PackageOfPacelineComputationReportItem(
+        total_pull_sequences_examined           = len(rotation_sequences),
+        total_compute_iterations_performed      = total_compute_iterations_performed,
+        total_bracketing_iterations_performed   = total_bracketing_iterations_performed,
+        total_exertion_memo_hits                = total_exertion_memo_hits,
+        total_exertion_memo_misses              = total_exertion_memo_misses,
+        computational_time                      = time_taken_to_compute,
+        thirty_sec_solution                     = thirty_sec_reducer.candidate.solution,
+        sixty_sec_solution                      = sixty_sec_reducer.candidate.solution,
+        balanced_intensity_of_effort_solution   = balanced_intensity_reducer.candidate.solution,
+        everybody_pull_hard_solution            = everybody_pulls_hard_reducer.candidate.solution,
+        hang_in_solution                        = hang_in_reducer.candidate.solution,
+        all_solutions                           = all_computation_reports if retain_all_solutions else None,
+        dispatch_decision                       = dispatch_decision,
+    )
+
+
+def generate_package_of_paceline_solutions(paceline_ingredients: PacelineIngredientsItem,
+    processing_strategy: Optional[PacelineProcessingStrategyEnum] = None,
+    retain_all_solutions: bool = False,
+    time_budget_sec: Optional[float] = None,
+    solution_cache: Optional[ContentAddressedDiskCache] = None,
+    keep_solutions_table: bool = True
     ) -> PackageOfPacelineComputationReportItem:
     """
     Generates and returns optimal paceline solutions based on the provided paceline ingredients.
@@ -712,35 +2257,77 @@ def generate_package_of_paceline_solutions(paceline_ingredients: PacelineIngredi
         paceline_ingredients (PacelineIngredientsItem): 
             The input parameters for the computation, including the list of riders, pull durations, initial pull speeds,
             and maximum exertion intensity factor.
+        processing_strategy (Optional[PacelineProcessingStrategyEnum]):
+            Passed through to generate_paceline_solutions_using_serial_and_parallel_algorithms(). None means chosen by
+            choose_paceline_processing_strategy(), and the decision is recorded in the report.
+        retain_all_solutions (bool):
+            Rebuild every solution from the table into all_solutions. Otherwise only the winners are rebuilt.
+        time_budget_sec (Optional[float]):
+            Wall-clock seconds allowed from the call. If given, the sequences are solved most promising first and the
+            solving stops when the next batch would not be done in time (see generate_table_of_paceline_solutions_before_deadline()).
+            The plans are then the best found in time, and a category with nothing in time is None. If None, every sequence is solved.
+        solution_cache (Optional[ContentAddressedDiskCache]):
+            Where solved packages are kept between runs, keyed by make_digest_of_paceline_solver_inputs(), usually
+            paceline_solution_cache. A package found there is returned at once, marked served_from_cache, without solving
+            anything. A package solved here is added, unless the time budget ran out. If None, nothing is cached.
+        keep_solutions_table (bool):
+            Keep every solution as a row of solutions_table. If False, the solutions stream through the candidate reducers
+            instead and are dropped (see reduce_paceline_solutions_to_package()), and solutions_table is None. It cannot be
+            combined with time_budget_sec, which solves the sequences into the table most promising first.
 
     Returns:
         PackageOfPacelineComputationReportItem: 
             An object containing:
                 - total_pull_sequences_examined (int): Number of candidate paceline rotation schedules evaluated.
+                - total_pull_sequences_unevaluated (int): Number left unevaluated when the time budget ran out.
+                - ran_out_of_time (bool): Whether the time budget ran out before every schedule was evaluated.
                 - total_compute_iterations_performed (int): Total number of compute iterations performed across all solutions.
+                - total_bracketing_iterations_performed (int): The part of those iterations spent bracketing the speed before bisecting it.
+                - total_exertion_memo_hits, total_exertion_memo_misses (int): Lookups of the exertion fragment memo, summed over all processes.
                 - computational_time (float): Total time taken for the computation (seconds).
                 - sixty_sec_solution (PacelineComputationReportItem): The best simple solution found.
                 - balanced_intensity_of_effort_solution (PacelineComputationReportItem): The most balanced solution found.
                 - everybody_pull_hard_solution (PacelineComputationReportItem): The best tempo solution found.
                 - hang_in_solution (PacelineComputationReportItem): The best drop solution found.
+                - all_solutions (List[PacelineComputationReportItem]): Every solution, if retain_all_solutions, else None.
+                - solutions_table (PacelineSolutionsTable): Every solution as columns, one row per sequence, if keep_solutions_table, else None. Savable with save_to_npz().
+                - dispatch_decision (PacelineDispatchDecisionItem): The strategy chosen and why, or None if processing_strategy was given.
+                - telemetry_summary (PacelineSolverTelemetrySummaryItem): The per-task telemetry summed up, if enabled with enable_paceline_solver_telemetry(). It is also logged.
+                - served_from_cache (bool): Whether the package came from solution_cache. Its statistics are then those of the run that solved it.
 
     Raises:
         ValueError: If required input parameters are missing or invalid.
-        RuntimeError: If no valid solutions are found for any of the categories.
+        RuntimeError: If no valid solutions are found for any of the categories, unless the time budget ran out.
 
     Notes:
-        - The function first generates all feasible paceline rotation alternatives, then prunes the solution space for efficiency.
+        - The function streams all feasible paceline rotation alternatives in chunks and prunes them as they come, for efficiency.
         - If the number of alternatives is very large, a warning is logged.
         - Only solutions with valid, finite metrics are considered for selection.
+        - Solutions are kept as rows of a PacelineSolutionsTable and the candidates are picked with argmin/argmax over its columns,
+          unless keep_solutions_table is False, when they stream through a CandidateSolutionReducerItem per category instead.
         - The returned solutions are intended to represent both the fastest and the most equitable paceline configurations.
     """
 
     validate_paceline_ingredients(paceline_ingredients)    
 
-    universe_of_rotation_sequences= generate_all_paceline_rotation_sequences_in_the_total_solution_space(len(paceline_ingredients.riders_list), paceline_ingredients.sequence_of_pull_periods_sec)
+    if not keep_solutions_table and time_budget_sec is not None:
+        raise ValueError("A time budget needs the solutions table. Keep it, or give no budget.")
+
+    digest = None
+    if solution_cache is not None:
+        digest = make_digest_of_paceline_solver_inputs(paceline_ingredients, retain_all_solutions, keep_solutions_table)
+        cached_package = solution_cache.get(digest)
+        if isinstance(cached_package, PackageOfPacelineComputationReportItem):
+            logger.info(f"Paceline solutions served from the cache: {solution_cache.path_of(digest)}")
+            return rebind_riders_of_cached_package(cached_package, paceline_ingredients.riders_list)
 
-    pruned_sequences = prune_all_sequences_of_pull_periods_in_the_total_solution_space(
-        universe_of_rotation_sequences, paceline_ingredients.riders_list
+    deadline = None if time_budget_sec is None else time.perf_counter() + time_budget_sec
+
+    size_of_universe_of_rotation_sequences = len(paceline_ingredients.sequence_of_pull_periods_sec) ** len(paceline_ingredients.riders_list)
+
+    # streamed in chunks, so the universe is never held in memory all at once
+    pruned_sequences = generate_pruned_paceline_rotation_sequences_in_chunks(
+        paceline_ingredients.riders_list, paceline_ingredients.sequence_of_pull_periods_sec
     )
 
     # Convert to list of lists for downstream compatibility
@@ -749,67 +2336,173 @@ def generate_package_of_paceline_solutions(paceline_ingredients: PacelineIngredi
     # logger.debug(f"Number of paceline rotation sequence alternatives generated: {len(pruned_sequences)}")
 
     if len(pruned_sequences) > ROTATION_SEQUENCE_UNIVERSE_SIZE_PRUNING_GOAL:
-        logger.warning(f"\n\nWarning. The number of riders is {len(paceline_ingredients.riders_list)}. The number of different pull-periods in the system is {format_number_with_comma_separators(len(STANDARD_PULL_PERIODS_SEC_AS_LIST))}. For n riders and k pull-periods, the Cartesian product generates k^n possible rider sequences to be evaluated. This is {format_number_with_comma_separators(len(universe_of_rotation_sequences))}. We have pruned these down to {format_number_with_comma_separators(len(pruned_sequences))} sequences. This is still a big number. Computation could take a while - like more than twenty seconds. If this is a problem, reduce the number of riders. Pull-periods are specified in system Constants and it would be a pity to reduce them because it would make solutions less granular.\n\n")
+        logger.warning(f"\n\nWarning. The number of riders is {len(paceline_ingredients.riders_list)}. The number of different pull-periods in the system is {format_number_with_comma_separators(len(STANDARD_PULL_PERIODS_SEC_AS_LIST))}. For n riders and k pull-periods, the Cartesian product generates k^n possible rider sequences to be evaluated. This is {format_number_with_comma_separators(size_of_universe_of_rotation_sequences)}. We have pruned these down to {format_number_with_comma_separators(len(pruned_sequences))} sequences. This is still a big number. Computation could take a while - like more than twenty seconds. If this is a problem, reduce the number of riders. Pull-periods are specified in system Constants and it would be a pity to reduce them because it would make solutions less granular.\n\n")
 
     start_time = time.perf_counter()
 
-    all_computation_reports = generate_paceline_solutions_using_serial_and_parallel_algorithms(paceline_ingredients, pruned_sequences)
+    dispatch_decision = None
+    if processing_strategy is None:
+        dispatch_decision = choose_paceline_processing_strategy(paceline_ingredients, pruned_sequences)
+        processing_strategy = dispatch_decision.processing_strategy
+
+    telemetry_collector = None
+    if paceline_solver_telemetry_enabled:
+        telemetry_collector = TelemetryCollector()
+        paceline_solver_telemetry_logger.addHandler(telemetry_collector)
+
+    try:
+        num_unevaluated = 0
+        table = None
+        package = None
+        if not keep_solutions_table:
+            package = reduce_paceline_solutions_to_package(paceline_ingredients, pruned_sequences, processing_strategy, start_time,
+                retain_all_solutions, dispatch_decision)
+        elif deadline is None:
+            table = generate_table_of_paceline_solutions(paceline_ingredients, pruned_sequences, processing_strategy)
+        else:
+            table, num_unevaluated = generate_table_of_paceline_solutions_before_deadline(paceline_ingredients, pruned_sequences, processing_strategy, deadline)
+
+        telemetry_summary = None
+        if telemetry_collector is not None:
+            # lock-step bisection solves no sequence on its own, so it has no tasks
+            num_tasks_expected = 0 if processing_strategy == PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION else len(pruned_sequences) - num_unevaluated
+            telemetry_collector.wait_for(num_tasks_expected, timeout=5.0)
+            telemetry_summary = summarise_paceline_solver_telemetry(list(telemetry_collector.telemetry), num_tasks_expected)
+            log_paceline_solver_telemetry_summary(telemetry_summary)
+    finally:
+        if telemetry_collector is not None:
+            paceline_solver_telemetry_logger.removeHandler(telemetry_collector)
+
+    if package is None:
+        package = assemble_package_of_paceline_solutions(paceline_ingredients, table, processing_strategy, num_unevaluated, start_time,
+            retain_all_solutions, dispatch_decision, telemetry_summary)
+    else:
+        package.telemetry_summary = telemetry_summary
 
-    # for idx, solution in enumerate(all_computation_reports):
-    #     logger.debug(f"sln: {idx+1} {first_n_chars(solution.guid, 2)}  {format_number_3dp(solution.calculated_average_speed_of_paceline_kph)}kph")
+    # a package cut short by the time budget is not the answer to these inputs, only the best found in time
+    if solution_cache is not None and digest is not None and not package.ran_out_of_time:
+        if not solution_cache.put(digest, package):
+            logger.warning(f"Unable to cache the paceline solutions in {solution_cache.dir_path}")
 
-    time_taken_to_compute = time.perf_counter() - start_time
+    return package
 
-    # the tags are merely for pretty debugging and logging purposes
-    thirty_sec_candidate                = WorthyCandidateSolutionItem(tag="30sec   ")
-    sixty_sec_candidate                 = WorthyCandidateSolutionItem(tag="60sec   ")
-    balanced_intensity_candidate        = WorthyCandidateSolutionItem(tag="bal     ")
-    everybody_pulls_hard_candidate      = WorthyCandidateSolutionItem(tag="allpush ")
-    hang_in_candidate                   = WorthyCandidateSolutionItem(tag="race    ")
 
-    total_compute_iterations_performed = 0 
+def populate_paceline_solutions_tables_of_several_batches_in_one_pool(batches: List[Tuple[PacelineIngredientsItem, NDArray[np.float64]]]
+) -> List[PacelineSolutionsTable]:
+    """
+    Solves several batches of rotation sequences, each with its own ingredients, as one stream of work for
+    paceline_solver_worker_pool, in the order given. Every batch is installed in every worker at the outset (see
+    install_several_paceline_solver_worker_payloads()), and the chunks of all of them are then dispatched as if
+    they were one batch (see dispatch_chunks_of_paceline_rotation_sequences()), never a chunk spanning two. So the
+    workers go on to the next batch as the last chunks of the one before are finishing, rather than waiting for them.
 
-    for this_solution in all_computation_reports:
+    Args:
+        batches: List[Tuple[PacelineIngredientsItem, NDArray[np.float64]]]
+            The ingredients of each batch, and its (sequences x riders) pull periods in seconds.
 
-        total_compute_iterations_performed += this_solution.compute_iterations_performed_count
+    Returns:
+        List[PacelineSolutionsTable]: The table of each batch, in the same order, with the is_valid column set.
+    """
+    tables = [PacelineSolutionsTable.allocate(len(sequences), len(paceline_ingredients.riders_list), paceline_ingredients.max_exertion_intensity_factor)
+        for paceline_ingredients, sequences in batches]
 
-        if not is_valid_solution(this_solution):
-                continue
+    tokens = [str(uuid.uuid4()) for _ in batches]
+    table_of_token = dict(zip(tokens, tables))
+    payloads = {token: (PacelineIngredientsItem(
+            riders_list                     = paceline_ingredients.riders_list,
+            pull_speeds_kph                 = [paceline_ingredients.pull_speeds_kph[0]] * len(paceline_ingredients.riders_list),
+            max_exertion_intensity_factor   = paceline_ingredients.max_exertion_intensity_factor,
+            solver_engine                   = paceline_ingredients.solver_engine), np.asarray(sequences, dtype=np.float64))
+        for token, (paceline_ingredients, sequences) in zip(tokens, batches)}
 
-        if is_thirty_second_pulls_solution_candidate(this_solution, thirty_sec_candidate):
-            update_candidate_solution(this_solution, thirty_sec_candidate)
+    # the batches are laid end to end, so that the first index of each is where the one before ends
+    first_indices = np.concatenate([[0], np.cumsum([len(sequences) for _, sequences in batches])]).astype(np.int64)
+    num_sequences = int(first_indices[-1])
+    if num_sequences == 0:
+        return tables
 
-        if is_sixty_second_pulls_solution_candidate(this_solution, sixty_sec_candidate):
-            update_candidate_solution(this_solution, sixty_sec_candidate)
+    paceline_solver_worker_pool.broadcast(install_several_paceline_solver_worker_payloads, (payloads,), make_initargs_of_paceline_solver_worker_pool(batches[0][0].riders_list))
 
-        if is_balanced_intensity_solution_candidate(this_solution, balanced_intensity_candidate):
-            update_candidate_solution(this_solution, balanced_intensity_candidate)
+    executor = paceline_solver_worker_pool.get_executor()
 
-        if is_everyone_pull_hard_solution_candidate(this_solution, everybody_pulls_hard_candidate):
-            update_candidate_solution(this_solution, everybody_pulls_hard_candidate)
+    def submit_chunk(indices: NDArray[np.int32]) -> concurrent.futures.Future:
+        batch_index = int(np.searchsorted(first_indices, indices[0], side="right")) - 1
+        return executor.submit(generate_chunk_of_paceline_solutions_of_one_of_several_batches, tokens[batch_index], (indices - first_indices[batch_index]).astype(np.int32))
 
-        if is_race_solution_with_possibility_of_drop_candidate(this_solution, hang_in_candidate):
-            update_candidate_solution(this_solution, hang_in_candidate)
+    def take_rows(answer: Tuple[str, NDArray[np.void]]) -> Tuple[int, float]:
+        token, rows = answer
+        table_of_token[token].rows[rows["rotation_sequence_index"]] = rows
+        return count_and_time_solved_rows(rows)
 
-    raise_error_if_any_solutions_missing(
-        thirty_sec_candidate,
-        sixty_sec_candidate,
-        balanced_intensity_candidate,
-        everybody_pulls_hard_candidate,
-        hang_in_candidate
-    )
+    dispatch_chunks_of_paceline_rotation_sequences(num_sequences, submit_chunk, take_rows, first_indices[1:-1].tolist())
 
-    return PackageOfPacelineComputationReportItem(
-        total_pull_sequences_examined           = len(pruned_sequences),
-        total_compute_iterations_performed      = total_compute_iterations_performed,
-        computational_time                      = time_taken_to_compute,
-        thirty_sec_solution                     = thirty_sec_candidate.solution,
-        sixty_sec_solution                      = sixty_sec_candidate.solution,
-        balanced_intensity_of_effort_solution   = balanced_intensity_candidate.solution,
-        everybody_pull_hard_solution            = everybody_pulls_hard_candidate.solution,
-        hang_in_solution                        = hang_in_candidate.solution,
-        all_solutions                           = all_computation_reports
-    )
+    for table in tables:
+        mark_valid_rows_of_paceline_solutions_table(table)
+
+    return tables
+
+
+def generate_packages_of_paceline_solutions_in_one_pool(list_of_paceline_ingredients: List[PacelineIngredientsItem],
+    solution_cache: Optional[ContentAddressedDiskCache] = None
+) -> List[PackageOfPacelineComputationReportItem]:
+    """
+    generate_package_of_paceline_solutions() for several pacelines at once, for instance every team of the club, with
+    the work of all of them scheduled into paceline_solver_worker_pool as one stream (see
+    populate_paceline_solutions_tables_of_several_batches_in_one_pool()), the paceline with the most sequences first.
+    Packages found in solution_cache are not solved again, and those solved are added to it.
+
+    With a pool of one worker there is nothing to overlap, so each paceline is then solved in turn by
+    generate_package_of_paceline_solutions(), with the strategy its cost model chooses.
+
+    Args:
+        list_of_paceline_ingredients (List[PacelineIngredientsItem]): The ingredients of each paceline.
+        solution_cache (Optional[ContentAddressedDiskCache]): As for generate_package_of_paceline_solutions().
+
+    Returns:
+        List[PackageOfPacelineComputationReportItem]: The package of each paceline, in the order given. Solved in the
+            pool, the computational_time of each runs from the start of the stream to when its plans were picked, its
+            plans are marked as solved by PARALLEL_CHUNKED, and it has no dispatch_decision.
+
+    Raises:
+        ValueError: If required input parameters of any paceline are missing or invalid.
+        RuntimeError: If no valid solutions are found for any of the categories of any paceline.
+    """
+    for paceline_ingredients in list_of_paceline_ingredients:
+        validate_paceline_ingredients(paceline_ingredients)
+
+    if paceline_solver_worker_pool.max_workers <= 1:
+        return [generate_package_of_paceline_solutions(paceline_ingredients, solution_cache=solution_cache) for paceline_ingredients in list_of_paceline_ingredients]
+
+    packages: List[Optional[PackageOfPacelineComputationReportItem]] = [None] * len(list_of_paceline_ingredients)
+    digests: List[Optional[str]] = [None] * len(list_of_paceline_ingredients)
+
+    if solution_cache is not None:
+        for i, paceline_ingredients in enumerate(list_of_paceline_ingredients):
+            digests[i] = make_digest_of_paceline_solver_inputs(paceline_ingredients, False)
+            cached_package = solution_cache.get(digests[i])
+            if isinstance(cached_package, PackageOfPacelineComputationReportItem):
+                packages[i] = rebind_riders_of_cached_package(cached_package, paceline_ingredients.riders_list)
+
+    to_solve = [i for i, package in enumerate(packages) if package is None]
+    sequences_of = {i: generate_pruned_paceline_rotation_sequences_in_chunks(list_of_paceline_ingredients[i].riders_list, list_of_paceline_ingredients[i].sequence_of_pull_periods_sec) for i in to_solve}
+
+    # largest first, so that the small ones fill in around the stragglers of the large at the end
+    to_solve.sort(key=lambda i: (len(sequences_of[i]), len(list_of_paceline_ingredients[i].riders_list)), reverse=True)
+
+    logger.info(f"Solving {len(to_solve)} pacelines, {format_number_with_comma_separators(sum(len(sequences) for sequences in sequences_of.values()))} sequences in all, in one pool of {paceline_solver_worker_pool.max_workers} workers. {len(packages) - len(to_solve)} served from the cache.")
+
+    start_time = time.perf_counter()
+
+    tables = populate_paceline_solutions_tables_of_several_batches_in_one_pool([(list_of_paceline_ingredients[i], sequences_of[i]) for i in to_solve])
+
+    for i, table in zip(to_solve, tables):
+        package = assemble_package_of_paceline_solutions(list_of_paceline_ingredients[i], table, PacelineProcessingStrategyEnum.PARALLEL_CHUNKED, 0, start_time)
+        digest = digests[i]
+        if solution_cache is not None and digest is not None and not solution_cache.put(digest, package):
+            logger.warning(f"Unable to cache the paceline solutions in {solution_cache.dir_path}")
+        packages[i] = package
+
+    return [package for package in packages if package is not None]
 
 
 def main01():
@@ -827,9 +2520,11 @@ def main01():
         empirically determine the sweet spot for the constant
         SERIAL_TO_PARALLEL_PROCESSING_THRESHOLD. This constant is subsequently
         relied upon by Brute in all scenarios. It is therefore important to get the
-        constant right. The parameter is tuned for my powerful laptop. It will be
-        different for a puny server with fewer cores. At the time of writing (Aug
-        2025), the numbers look like this:-
+        constant right. (Since superseded: the dispatcher now calibrates itself on
+        each host. See choose_paceline_processing_strategy().) The parameter is
+        tuned for my powerful laptop. It will be different for a puny server with
+        fewer cores. At the time of writing (Aug 2025), the numbers look like
+        this:-
 
         Riders  Sequences           serial-processing               parallel-processing
             1           7                  <1s                          5s 
@@ -847,8 +2542,12 @@ def main01():
 
     This function:
       - Loads rider data and team composition from JSON and utility functions.
-      - Generates all possible paceline rotation sequences for the team and standard pull periods.
-      - Runs the paceline solution algorithm using both serial and parallel approaches, timing each.
+      - Generates all possible paceline rotation sequences for the team and standard pull periods,
+        in reflected Gray order so that neighbouring sequences differ in the pull of one rider.
+      - Times a walk of that order that carries each rider's exertion totals from one sequence to the next,
+        reading off an upper bound on the speed of every sequence, and keeps only the sequences whose bound
+        reaches the binding speed of the most promising one, as no other can be the fastest.
+      - Runs the paceline solution algorithm on those using both serial and parallel approaches, timing each.
       - Logs and writes a summary report comparing the compute times and time saved by parallelization.
       - Visualizes the results in a bar chart and saves the chart as a PNG file.
 
@@ -877,19 +2576,31 @@ def main01():
 
     save_filename_without_ext = f"compare_serial_processing_versus_parallel_processing_duration_{len(riders)}"
 
-    logger.debug(f"Starting: head-to-head benchmarking of serial-processing versus parallel-processing with {len(riders)} riders, {len(STANDARD_PULL_PERIODS_SEC_AS_LIST)} pull periods, and consequently {pretty_number_of_sequences_before_pruning} paceline_rotation sequences (no solution-space pruning. all sequences evaluated.")
+    all_conceivable_paceline_rotation_sequences_in_gray_code_order = generate_all_paceline_rotation_sequences_in_gray_code_order(len(riders), STANDARD_PULL_PERIODS_SEC_AS_LIST)
+
+    g1 = time.perf_counter()
+    upper_bound_speeds_kph = calculate_upper_bound_speeds_of_paceline_rotation_sequences_in_gray_code_order(riders, STANDARD_PULL_PERIODS_SEC_AS_LIST, paceline_ingredients.max_exertion_intensity_factor)
+    # the fastest plan is at least as fast as the sequence with the highest bound, so no sequence bounded below that can beat it
+    most_promising_sequence = all_conceivable_paceline_rotation_sequences_in_gray_code_order[[int(np.argmax(upper_bound_speeds_kph))]]
+    incumbent_kph = calculate_binding_speeds_of_rotation_sequences(prepare_rider_arrays_for_batch_evaluation(riders), most_promising_sequence, paceline_ingredients.max_exertion_intensity_factor)[0]
+    sequences_that_could_be_fastest = all_conceivable_paceline_rotation_sequences_in_gray_code_order[upper_bound_speeds_kph >= incumbent_kph - REQUIRED_PRECISION_OF_SPEED]
+    g2 = time.perf_counter()
+    pretty_number_of_sequences_that_could_be_fastest = format_number_with_comma_separators(len(sequences_that_could_be_fastest))
+    logger.debug(f"\nGray-code walk of the universe with running exertion totals: {round(g2 - g1, 2)} seconds. {pretty_number_of_sequences_that_could_be_fastest} sequences could be the fastest.")
+
+    logger.debug(f"Starting: head-to-head benchmarking of serial-processing versus parallel-processing with {len(riders)} riders, {len(STANDARD_PULL_PERIODS_SEC_AS_LIST)} pull periods, and consequently {pretty_number_of_sequences_before_pruning} paceline_rotation sequences (no solution-space pruning. only the {pretty_number_of_sequences_that_could_be_fastest} sequences the walk could not rule out are evaluated.)")
     logger.debug(f"\nCommencing serial processing. This could take a very long time depending on the number of sequences. Please wait....")
 
     # Serial run as the base case (ignore squigglies here, they are inconsequential warnings)
     s1 = time.perf_counter()
-    _ = generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, all_conceivable_paceline_rotation_sequences)
+    _ = generate_paceline_solutions_using_serial_processing_algorithm(paceline_ingredients, sequences_that_could_be_fastest)
     s2 = time.perf_counter()
     logger.debug(f"\nBase-case: serial run compute time: {round(s2 - s1, 2)} seconds")
     logger.debug(f"\nCommencing parallel processing. Please wait....")
 
     # Parallel run (ignore squigglies here, they are inconsequential warnings)
     p1 = time.perf_counter()
-    _ = generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients, all_conceivable_paceline_rotation_sequences)
+    _ = generate_paceline_solutions_using_parallel_workstealing_algorithm(paceline_ingredients, sequences_that_could_be_fastest)
     p2 = time.perf_counter()
 
     logger.debug(f"\nTest-case: parallel run compute time: {round(p2 - p1,2)} seconds")
@@ -900,6 +2611,7 @@ def main01():
     report_lines.append(f"Number of riders: {len(riders)}\n\n")
     report_lines.append(f"Number of standard pull periods: {len(STANDARD_PULL_PERIODS_SEC_AS_LIST)}\n\n")
     report_lines.append(f"Consequential number of paceline-rotation sequences: {pretty_number_of_sequences_before_pruning}\n\n")
+    report_lines.append(f"Gray-code walk with running exertion totals: {round(g2 - g1, 2)} seconds, leaving {pretty_number_of_sequences_that_could_be_fastest} sequences that could be the fastest\n")
     report_lines.append(f"Serial run: Compute time: {round(s2 - s1, 2)} seconds\n")
     report_lines.append(f"Parallel run (work-stealing): Compute time: {round(p2 - p1,2)} seconds\n")
     report_lines.append(f"Time saved by parallelisation: {round((s2 - s1) - (p2 - p1), 2)} seconds")
@@ -1002,6 +2714,14 @@ def main02():
     p2 = time.perf_counter()
 
     logger.debug(f"\nTest-case: parallel run compute time: {round(p2 - p1,2)} seconds")
+    logger.debug(f"\nCommencing lock-step batched bisection. Please wait....")
+
+    # Lock-step batched bisection of all sequences together in this process
+    b1 = time.perf_counter()
+    _ = generate_paceline_solutions_using_lockstep_batched_bisection_algorithm(paceline_ingredients, reduced_paceline_rotation_sequences_after_pruning.tolist())
+    b2 = time.perf_counter()
+
+    logger.debug(f"\nTest-case: lock-step batched bisection compute time: {round(b2 - b1,2)} seconds")
 
     # --- Summary Report ---
     report_lines : List[str] = []
@@ -1013,6 +2733,7 @@ def main02():
     report_lines.append(f"Paceline-rotation sequences after pruning: {pretty_number_of_sequences_after_pruning}\n")
     report_lines.append(f"Serial run: Compute time: {round(s2 - s1, 2)} seconds\n")
     report_lines.append(f"Parallel run (work-stealing): Compute time: {round(p2 - p1,2)} seconds\n")
+    report_lines.append(f"Lock-step batched bisection: Compute time: {round(b2 - b1,2)} seconds\n")
     report_lines.append(f"Time saved by parallelisation: {round((s2 - s1) - (p2 - p1), 2)} seconds")
     report_lines.append("\n")
 
@@ -1026,6 +2747,7 @@ def main02():
     df = pd.DataFrame([
         {"Method": "Serial-processing", "Compute Time (s)": s2 - s1},
         {"Method": "Parallel-processing (work stealing)", "Compute Time (s)": p2 - p1},
+        {"Method": "Lock-step batched bisection", "Compute Time (s)": b2 - b1},
     ])
 
     plt.figure(figsize=(8, 5))
@@ -1061,4 +2783,5 @@ if __name__ == "__main__":
 
 
     # main01()    
-    main02()
\ No newline at end of file
+    main02()
+    shutdown_paceline_solver_worker_pool()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Optional
-from computation_classes import PacelineIngredientsItem
+from disk_cache_utilities import ContentAddressedDiskCache
+from computation_classes import PacelineIngredientsItem, PackageOfPacelineComputationReportItem
 from computation_classes_display_objects import PacelinePlanTypeEnum, PackageOfPacelineComputationReportDisplayObject, PacelineComputationReportDisplayObject
 from jgh_formulae02 import calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph, arrange_riders_in_optimal_order, select_n_strongest_riders
 from jgh_formulae07 import make_pretty_caption_for_a_paceline_plan, log_a_paceline_plan, save_a_paceline_plan_as_html
@@ -11,26 +12,29 @@ from filenames import get_save_filename_for_single_paceline_plan
 import logging
 logger = logging.getLogger(__name__)
 
-def generate_fastest_paceline_plan_for_n_strongest(ingredients: PacelineIngredientsItem, n: int) -> PacelineComputationReportDisplayObject:
-        
-    def get_computation_report_safely(
-        report: Optional[PacelineComputationReportDisplayObject]
-    ) -> PacelineComputationReportDisplayObject:
-        return report if report else PacelineComputationReportDisplayObject()
-
-    riders_n = select_n_strongest_riders(ingredients.riders_list, n)
+def make_paceline_ingredients_for_n_strongest(ingredients: PacelineIngredientsItem, n: int) -> PacelineIngredientsItem:
+    # a copy, because select_n_strongest_riders() sorts the list it is given
+    riders_n = select_n_strongest_riders(list(ingredients.riders_list), n)
     riders_n = arrange_riders_in_optimal_order(riders_n)
-    log_speed_bounds_of_exertion_constrained_paceline_solutions(riders_n)
-    ingredients_n = PacelineIngredientsItem(
+    return PacelineIngredientsItem(
         riders_list=riders_n,
         pull_speeds_kph=[calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders_n)] * len(riders_n),
         sequence_of_pull_periods_sec=STANDARD_PULL_PERIODS_SEC_AS_LIST,
         max_exertion_intensity_factor=DEFAULT_EXERTION_INTENSITY_FACTOR_LIMIT,
     )
-    report_n = generate_package_of_paceline_solutions(ingredients_n)
+
+
+def get_fastest_paceline_plan_of_package(report_n: Optional[PackageOfPacelineComputationReportItem]) -> PacelineComputationReportDisplayObject:
     report_n_displayobject = PackageOfPacelineComputationReportDisplayObject.from_PackageOfPacelineComputationReportItem(report_n)
-    answer = get_computation_report_safely(report_n_displayobject.solutions[PacelinePlanTypeEnum.FASTEST])
-    return answer
+    answer = report_n_displayobject.solutions[PacelinePlanTypeEnum.FASTEST]
+    return answer if answer else PacelineComputationReportDisplayObject()
+
+
+def generate_fastest_paceline_plan_for_n_strongest(ingredients: PacelineIngredientsItem, n: int, solution_cache: Optional[ContentAddressedDiskCache] = None) -> PacelineComputationReportDisplayObject:
+    ingredients_n = make_paceline_ingredients_for_n_strongest(ingredients, n)
+    log_speed_bounds_of_exertion_constrained_paceline_solutions(ingredients_n.riders_list)
+    report_n = generate_package_of_paceline_solutions(ingredients_n, solution_cache=solution_cache)
+    return get_fastest_paceline_plan_of_package(report_n)
 
 
 def save_multiple_individual_paceline_plans_as_html(
@@ -0,0 +1,633 @@
+from typing import List, Union, Tuple, DefaultDict
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+from numpy.typing import NDArray
+from jgh_number import safe_divide
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineBatchRiderArraysItem, PacelineBatchEvaluationItem, RiderContributionItem, PacelineComputationReportItem, PacelineSolutionsTable
+from jgh_formulae01 import estimate_drag_ratio_in_paceline, estimate_watts_from_speed_numpy, estimate_speed_from_wattage_numpy
+from jgh_formulae02 import calculate_normalized_watts_of_piecewise_constant_efforts_numpy, calculate_dispersion_of_intensity_of_effort_numpy, get_rider_power_profile
+from constants import (STANDARD_PULL_PERIODS_SEC_AS_LIST, SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION, REQUIRED_PRECISION_OF_SPEED, MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION, NORMALIZED_WATTS_ROLLING_WINDOW_SEC)
+import logging
+logger = logging.getLogger(__name__)
+
+# All of these functions are called during parallel processing. Logging forbidden
+
+# Batch kernel. Evaluates a whole block of rotation sequences at a given speed in a handful
+# of NumPy passes instead of running every sequence through populate_rider_work_assignments,
+# populate_rider_exertions and populate_rider_contributions (jgh_formulae04/05/06). The
+# arithmetic is identical to those functions: rider k (0-based) occupies position
+# ((k - j) % n) + 1 while the rider in slot j is pulling, so rider k pulls in slot k.
+
+
+@lru_cache(maxsize=32)
+def build_matrix_of_drag_ratios_in_paceline(num_riders: int) -> NDArray[np.float64]:
+    """
+    Build the (riders x slots) matrix of drag ratios for a circulating paceline.
+
+    Element [k, j] is the drag ratio of rider k while the rider in slot j is at the
+    front. The diagonal is therefore 1.0. The matrix is cached and must be treated
+    as read-only.
+
+    Args:
+        num_riders (int): The number of riders in the paceline.
+
+    Returns:
+        NDArray: A (num_riders x num_riders) matrix of drag ratios.
+    """
+    matrix = np.empty((num_riders, num_riders), dtype=np.float64)
+    for k in range(num_riders):
+        for j in range(num_riders):
+            matrix[k, j] = estimate_drag_ratio_in_paceline((k - j) % num_riders + 1)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def prepare_rider_arrays_for_batch_evaluation(riders: List[ZsunItem]) -> PacelineBatchRiderArraysItem:
+    """
+    Lay out the riders' power profiles as flat arrays for the batch kernel. This is
+    done once per solve. The profiles themselves are cached per process by
+    get_rider_power_profile().
+
+    Args:
+        riders (List[ZsunItem]): The riders from head to tail of the paceline.
+
+    Returns:
+        PacelineBatchRiderArraysItem: Weights, heights, one-hour watts and a lookup table of
+            permissible pull watts for every standard pull period.
+    """
+    profiles = [get_rider_power_profile(rider) for rider in riders]
+
+    pull_periods_sec = np.array(sorted(set(STANDARD_PULL_PERIODS_SEC_AS_LIST)), dtype=np.float64)
+
+    # the final column serves any period that is not standard, mirroring the default in ZsunItem.get_standard_pull_watts()
+    pull_watts_caps = np.array(
+        [[profile.get_standard_pull_watts(float(period)) for period in pull_periods_sec] + [profile.one_hour_watts] for profile in profiles],
+        dtype=np.float64).reshape(len(riders), len(pull_periods_sec) + 1)
+
+    return PacelineBatchRiderArraysItem(
+        weight_kg        = np.array([profile.weight_kg for profile in profiles], dtype=np.float64),
+        height_cm        = np.array([profile.height_cm for profile in profiles], dtype=np.float64),
+        one_hour_watts   = np.array([profile.one_hour_watts for profile in profiles], dtype=np.float64),
+        pull_periods_sec = pull_periods_sec,
+        pull_watts_caps  = pull_watts_caps,
+    )
+
+
+def reorder_rider_arrays_for_batch_evaluation(rider_arrays: PacelineBatchRiderArraysItem, order: List[int]) -> PacelineBatchRiderArraysItem:
+    """
+    The rider arrays of the same riders lined up in another order, or of some of them,
+    without preparing their power profiles again.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        order (List[int]): For each position from head to tail, the index of the rider
+            in rider_arrays who rides there. Riders left out are not in the paceline.
+
+    Returns:
+        PacelineBatchRiderArraysItem: The rider arrays in the new order.
+    """
+    index = np.asarray(order, dtype=np.intp)
+    return PacelineBatchRiderArraysItem(
+        weight_kg        = rider_arrays.weight_kg[index],
+        height_cm        = rider_arrays.height_cm[index],
+        one_hour_watts   = rider_arrays.one_hour_watts[index],
+        pull_periods_sec = rider_arrays.pull_periods_sec,
+        pull_watts_caps  = rider_arrays.pull_watts_caps[index],
+    )
+
+
+def look_up_permissible_pull_watts(rider_arrays: PacelineBatchRiderArraysItem, pull_periods_sec: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Look up the permissible pull watts of every rider for their own pull in every sequence.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        pull_periods_sec (NDArray): (sequences x riders) array of pull periods.
+
+    Returns:
+        NDArray: (sequences x riders) array of permissible pull watts.
+    """
+    periods = rider_arrays.pull_periods_sec
+    num_periods = len(periods)
+
+    column = np.searchsorted(periods, pull_periods_sec)
+    clipped = np.minimum(column, num_periods - 1)
+    is_standard = periods[clipped] == pull_periods_sec
+    column = np.where(is_standard, clipped, num_periods)
+
+    rider_index = np.broadcast_to(np.arange(pull_periods_sec.shape[1]), pull_periods_sec.shape)
+    return rider_arrays.pull_watts_caps[rider_index, column]
+
+
+def evaluate_rotation_sequences_at_speed(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    speeds_kph: Union[float, NDArray[np.float64]], max_exertion_intensity_factor: float
+) -> PacelineBatchEvaluationItem:
+    """
+    Score every rotation sequence in a block at a given speed in one pass.
+
+    This is the array equivalent of running populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints()
+    once per sequence with a constant speed. A rider's effort is in violation when they pull
+    and either their intensity factor reaches max_exertion_intensity_factor or their pull watts
+    reach the permissible watts for their pull period.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays from prepare_rider_arrays_for_batch_evaluation().
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        speeds_kph (float or NDArray): One speed for all sequences, or one speed per sequence.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        PacelineBatchEvaluationItem: Per-rider and per-sequence metrics as arrays.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+    num_sequences, num_riders = durations.shape
+    speeds = np.broadcast_to(np.asarray(speeds_kph, dtype=np.float64), (num_sequences,))
+
+    watts_riding_alone = estimate_watts_from_speed_numpy(speeds[:, None], rider_arrays.weight_kg[None, :], rider_arrays.height_cm[None, :])
+    wattages = watts_riding_alone[:, :, None] * build_matrix_of_drag_ratios_in_paceline(num_riders)[None, :, :]
+
+    total_duration = durations.sum(axis=1)
+    has_duration = total_duration > 0
+
+    energy = np.einsum("skj,sj->sk", wattages, durations)
+    average_watts = np.divide(energy, total_duration[:, None], out=np.zeros_like(energy), where=has_duration[:, None])
+
+    normalized_watts = calculate_normalized_watts_of_piecewise_constant_efforts_numpy(durations, wattages)
+
+    one_hour_watts = rider_arrays.one_hour_watts[None, :]
+    intensity_factor = np.divide(normalized_watts, one_hour_watts, out=np.zeros_like(normalized_watts), where=one_hour_watts != 0)
+
+    is_puller = durations != 0
+    pull_watts = watts_riding_alone # drag ratio at the front is 1.0
+    violations = is_puller & ((intensity_factor >= max_exertion_intensity_factor) | (pull_watts >= look_up_permissible_pull_watts(rider_arrays, durations)))
+
+    num_pullers = is_puller.sum(axis=1)
+    safe_count = np.maximum(num_pullers, 1)
+    mean_if = np.where(is_puller, intensity_factor, 0.0).sum(axis=1) / safe_count
+    variance_if = np.where(is_puller, (intensity_factor - mean_if[:, None]) ** 2, 0.0).sum(axis=1) / safe_count
+    dispersion = np.sqrt(variance_if)
+    dispersion = np.where((num_pullers > 0) & np.isfinite(dispersion), dispersion, 100.0) # same sentinel as calculate_dispersion_of_intensity_of_effort()
+
+    return PacelineBatchEvaluationItem(
+        average_speed_of_paceline_kph     = np.where(has_duration, speeds, 0.0).astype(np.float64),
+        pull_watts                        = pull_watts,
+        average_watts                     = average_watts,
+        normalized_watts                  = normalized_watts,
+        intensity_factor                  = intensity_factor,
+        effort_constraint_violations      = violations,
+        any_effort_constraint_violated    = violations.any(axis=1),
+        dispersion_of_intensity_of_effort = dispersion,
+    )
+
+
+def calculate_pull_and_intensity_binding_speeds_of_riders_in_rotation_sequences(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    max_exertion_intensity_factor: float
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Solve directly for the speed at which each puller's effort falls into violation of each of its two constraints.
+
+    Every wattage a rider produces at speed v is drag_ratio x g(v), where g(v) = c1*v + c*v^3
+    is the watts of riding alone. Hence:
+      - the pull-watts constraint binds when g(v) reaches the permissible watts of the pull,
+      - normalized watts, being homogeneous of degree one in wattage, equal g(v) x NP of the
+        rider's drag-ratio profile, so the intensity constraint binds when g(v) reaches
+        max_exertion_intensity_factor x one-hour watts / NP of the drag-ratio profile.
+    Both thresholds are watts-riding-alone targets, inverted to speeds by the closed-form
+    cubic solver. No search is needed for either.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        Tuple containing:
+            - (sequences x riders) speeds in kph at which the pull-watts constraint binds.
+            - (sequences x riders) speeds in kph at which the intensity constraint binds.
+        Both are infinite for riders who do not pull. The second is also infinite for riders whose
+        timeline is too short to have an NP.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+    num_sequences, num_riders = durations.shape
+
+    drag_ratios = np.broadcast_to(build_matrix_of_drag_ratios_in_paceline(num_riders), (num_sequences, num_riders, num_riders))
+    normalized_drag = calculate_normalized_watts_of_piecewise_constant_efforts_numpy(durations, drag_ratios)
+
+    weight = np.broadcast_to(rider_arrays.weight_kg, durations.shape)
+    height = np.broadcast_to(rider_arrays.height_cm, durations.shape)
+
+    pull_binding_kph = estimate_speed_from_wattage_numpy(look_up_permissible_pull_watts(rider_arrays, durations), weight, height)
+
+    # a rider without one-hour watts has an intensity factor of zero, which never binds
+    has_normalized_watts = (normalized_drag > 0) & (rider_arrays.one_hour_watts[None, :] > 0)
+    intensity_target_watts = np.divide(max_exertion_intensity_factor * rider_arrays.one_hour_watts[None, :], normalized_drag,
+        out=np.zeros_like(normalized_drag), where=has_normalized_watts)
+    intensity_binding_kph = np.where(has_normalized_watts, estimate_speed_from_wattage_numpy(intensity_target_watts, weight, height), np.inf)
+
+    is_puller = durations != 0
+    return np.where(is_puller, pull_binding_kph, np.inf), np.where(is_puller, intensity_binding_kph, np.inf)
+
+
+def calculate_binding_speeds_of_riders_in_rotation_sequences(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    max_exertion_intensity_factor: float
+) -> NDArray[np.float64]:
+    """
+    The speed at which each puller's effort first falls into violation, being the lesser of the speeds
+    at which its two constraints bind (see calculate_pull_and_intensity_binding_speeds_of_riders_in_rotation_sequences()).
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        NDArray: (sequences x riders) binding speeds in kph. Infinite for riders who do not pull.
+    """
+    pull_binding_kph, intensity_binding_kph = calculate_pull_and_intensity_binding_speeds_of_riders_in_rotation_sequences(rider_arrays, rotation_sequences, max_exertion_intensity_factor)
+    return np.minimum(pull_binding_kph, intensity_binding_kph)
+
+
+def calculate_binding_speeds_of_rotation_sequences(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    max_exertion_intensity_factor: float
+) -> NDArray[np.float64]:
+    """
+    The speed at which the first rider in each sequence falls into violation, being the
+    least of the binding speeds of its pullers. Infinite where nobody pulls.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        NDArray: (sequences,) binding speeds in kph.
+    """
+    return calculate_binding_speeds_of_riders_in_rotation_sequences(rider_arrays, rotation_sequences, max_exertion_intensity_factor).min(axis=1)
+
+
+def identify_binding_constraints_of_rotation_sequences(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    max_exertion_intensity_factor: float
+) -> Tuple[NDArray[np.float64], NDArray[np.int32], NDArray[np.bool_]]:
+    """
+    Which rider, and which of their constraints, decides the speed of each sequence.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        Tuple containing:
+            - (sequences x riders) binding speeds in kph, as calculate_binding_speeds_of_riders_in_rotation_sequences().
+            - (sequences,) index of the rider whose binding speed is least, -1 where nobody's binds.
+            - (sequences,) True where that rider's pull-watts constraint binds, False where their intensity constraint does.
+    """
+    pull_binding_kph, intensity_binding_kph = calculate_pull_and_intensity_binding_speeds_of_riders_in_rotation_sequences(rider_arrays, rotation_sequences, max_exertion_intensity_factor)
+    binding_speeds_kph = np.minimum(pull_binding_kph, intensity_binding_kph)
+
+    sequence_index = np.arange(binding_speeds_kph.shape[0])
+    binding_rider = np.argmin(binding_speeds_kph, axis=1)
+    binds = np.isfinite(binding_speeds_kph[sequence_index, binding_rider])
+
+    binding_rider_index = np.where(binds, binding_rider, -1).astype(np.int32)
+    binding_is_pull_watts = binds & (pull_binding_kph[sequence_index, binding_rider] <= intensity_binding_kph[sequence_index, binding_rider])
+
+    return binding_speeds_kph, binding_rider_index, binding_is_pull_watts
+
+
+def calculate_speed_bracket_of_rotation_sequences(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    max_exertion_intensity_factor: float
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Cheap per-sequence bounds on the speed at which the first rider falls into violation,
+    derived from the pullers' own caps rather than from a blind hunt upwards in chunks.
+
+      - Upper: the slowest of the pullers' speeds at their permissible pull watts for the
+        duration of their pull. Whoever that is, they are in violation of their pull cap
+        above it. This is never above calculate_upper_bound_paceline_speed() in jgh_formulae02,
+        which is the fastest any rider can pull for any standard duration.
+      - Lower: below the pull-cap speeds of every puller and below the speed at which every
+        puller would exceed max_exertion_intensity_factor even if they rode the whole rotation
+        on the front. No puller's normalized watts can exceed their watts on the front, so
+        nobody is in violation at or below it.
+
+    Both are infinite where nobody pulls.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        Tuple containing:
+            - (sequences,) lower bounds in kph.
+            - (sequences,) upper bounds in kph.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+
+    weight = np.broadcast_to(rider_arrays.weight_kg, durations.shape)
+    height = np.broadcast_to(rider_arrays.height_cm, durations.shape)
+    is_puller = durations != 0
+
+    drag_ratios = build_matrix_of_drag_ratios_in_paceline(durations.shape[1])
+    total_duration = durations.sum(axis=1, keepdims=True)
+    num_windows = total_duration - NORMALIZED_WATTS_ROLLING_WINDOW_SEC + 1
+    has_normalized_watts = (num_windows > 0) & (rider_arrays.one_hour_watts[None, :] > 0)
+
+    def speed_at_intensity_cap(drag_ratio_of_effort: NDArray[np.float64]) -> NDArray[np.float64]:
+        target_watts = np.divide(max_exertion_intensity_factor * rider_arrays.one_hour_watts[None, :], drag_ratio_of_effort,
+            out=np.zeros_like(drag_ratio_of_effort), where=has_normalized_watts & (drag_ratio_of_effort > 0))
+        return np.where(has_normalized_watts, estimate_speed_from_wattage_numpy(target_watts, weight, height), np.inf)
+
+    # Each rolling average is a mean of the window's seconds, so its fourth power is at most the mean of their fourth powers.
+    # No second sits in more than a window's worth of windows, so normalized watts are at most (sum of w^4 / number of windows)^(1/4).
+    highest_drag = np.power(np.divide(durations @ (drag_ratios ** 4).T, num_windows,
+        out=np.zeros_like(durations), where=num_windows > 0), 0.25)
+
+    # Normalized watts are never below average watts but for the ramps at either end, so this is almost always in violation
+    mean_drag = np.divide(durations @ drag_ratios.T, total_duration, out=np.zeros_like(durations), where=total_duration > 0)
+
+    pull_cap_kph = estimate_speed_from_wattage_numpy(look_up_permissible_pull_watts(rider_arrays, durations), weight, height)
+
+    upper_kph = np.where(is_puller, np.minimum(pull_cap_kph, speed_at_intensity_cap(mean_drag)), np.inf).min(axis=1)
+    lower_kph = np.where(is_puller, np.minimum(pull_cap_kph, speed_at_intensity_cap(highest_drag)), np.inf).min(axis=1)
+
+    return lower_kph, upper_kph
+
+
+def bisect_rotation_sequences_in_lockstep(rider_arrays: PacelineBatchRiderArraysItem, rotation_sequences: NDArray[np.float64],
+    lowest_conceivable_kph: float, max_exertion_intensity_factor: float
+) -> Tuple[NDArray[np.float64], NDArray[np.int64], NDArray[np.int64], NDArray[np.bool_]]:
+    """
+    Run the binary search of generate_a_single_paceline_solution_complying_with_exertion_constraints()
+    for every sequence at once. Lower and upper brackets are kept as vectors. Each round
+    evaluates the probe speed of every sequence still in play with one call to
+    evaluate_rotation_sequences_at_speed(), and sequences are retired as they converge.
+    The probes, and hence the answers and iteration counts, are exactly those of the
+    per-sequence search.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        lowest_conceivable_kph (float): The seed speed, already truncated.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        Tuple containing:
+            - (sequences,) the speed to report, being the upper bracket, or for sequences in which
+              no violation was found, the last speed probed.
+            - (sequences,) the iterations performed for each sequence.
+            - (sequences,) the part of those iterations spent finding the safe upper bound.
+            - (sequences,) True where a violation was found and the search ran to completion.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+    num_sequences = durations.shape[0]
+
+    lower_kph = np.full(num_sequences, lowest_conceivable_kph, dtype=np.float64)
+    upper_kph = lower_kph.copy()
+    iterations = np.zeros(num_sequences, dtype=np.int64)
+    found = np.zeros(num_sequences, dtype=bool)
+
+    # find a safe upper bound for every sequence by stepping up in chunks
+    active = np.arange(num_sequences)
+    for _ in range(SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH):
+        if active.size == 0:
+            break
+        violated = evaluate_rotation_sequences_at_speed(rider_arrays, durations[active], upper_kph[active], max_exertion_intensity_factor).any_effort_constraint_violated
+        found[active[violated]] = True
+        active = active[~violated]
+        upper_kph[active] += CHUNK_OF_KPH_PER_ITERATION
+        iterations[active] += 1
+
+    bracketing_iterations = iterations.copy()
+
+    # bisect all bracketed sequences together
+    active = np.nonzero(found)[0]
+    while True:
+        active = active[((upper_kph[active] - lower_kph[active]) > REQUIRED_PRECISION_OF_SPEED) & (iterations[active] < MAX_PERMITTED_ITERATIONS_TO_ACHIEVE_REQUIRED_PRECISION)]
+        if active.size == 0:
+            break
+        mid_point_kph = (lower_kph[active] + upper_kph[active]) / 2
+        violated = evaluate_rotation_sequences_at_speed(rider_arrays, durations[active], mid_point_kph, max_exertion_intensity_factor).any_effort_constraint_violated
+        iterations[active] += 1
+        upper_kph[active] = np.where(violated, mid_point_kph, upper_kph[active])
+        lower_kph[active] = np.where(violated, lower_kph[active], mid_point_kph)
+
+    reported_kph = np.where(found, upper_kph, upper_kph - CHUNK_OF_KPH_PER_ITERATION)
+
+    return reported_kph, iterations, bracketing_iterations, found
+
+
+def materialize_rider_contributions_from_batch_evaluation(riders: List[ZsunItem], rider_arrays: PacelineBatchRiderArraysItem,
+    rotation_sequences: NDArray[np.float64], speeds_kph: NDArray[np.float64], max_exertion_intensity_factor: float
+) -> Tuple[List[DefaultDict[ZsunItem, RiderContributionItem]], PacelineBatchEvaluationItem]:
+    """
+    Build the RiderContributionItems of many sequences from a single batch evaluation,
+    field for field as populate_rider_contributions() builds them from exertions.
+
+    Args:
+        riders (List[ZsunItem]): The riders from head to tail of the paceline.
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        speeds_kph (NDArray): (sequences,) speed of each sequence.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+
+    Returns:
+        Tuple containing:
+            - One mapping of rider to RiderContributionItem per sequence.
+            - The batch evaluation from which they were built.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+    num_riders = durations.shape[1]
+    speeds = np.broadcast_to(np.asarray(speeds_kph, dtype=np.float64), (durations.shape[0],))
+
+    batch = evaluate_rotation_sequences_at_speed(rider_arrays, durations, speeds, max_exertion_intensity_factor)
+    pull_watts_caps = look_up_permissible_pull_watts(rider_arrays, durations)
+
+    # watts in positions 1..8 are the watts of riding alone scaled by the drag ratio of the position, zero beyond the length of the paceline
+    drag_ratio_of_position = np.array([estimate_drag_ratio_in_paceline(position) if position <= num_riders else 0.0 for position in range(1, 9)])
+    watts_by_position = (batch.pull_watts[:, :, None] * drag_ratio_of_position[None, None, :]).tolist()
+
+    pull_watts = batch.pull_watts.tolist()
+    intensity_factor = batch.intensity_factor.tolist()
+    average_watts = batch.average_watts.tolist()
+    normalized_watts = batch.normalized_watts.tolist()
+    caps = pull_watts_caps.tolist()
+    durations_as_list = durations.tolist()
+    speeds_as_list = speeds.tolist()
+
+    answer: List[DefaultDict[ZsunItem, RiderContributionItem]] = []
+
+    for s, sequence in enumerate(durations_as_list):
+        contributions: DefaultDict[ZsunItem, RiderContributionItem] = defaultdict(RiderContributionItem)
+        for k, rider in enumerate(riders):
+            p1w, p2w, p3w, p4w, p5w, p6w, p7w, p8w = watts_by_position[s][k]
+            contribution = RiderContributionItem(
+                speed_kph           = speeds_as_list[s],
+                p1_duration         = sequence[k],
+                p1_w                = p1w,
+                p2_w                = p2w,
+                p3_w                = p3w,
+                p4_w                = p4w,
+                p5_w                = p5w,
+                p6_w                = p6w,
+                p7_w                = p7w,
+                p8_w                = p8w,
+                average_watts       = average_watts[s][k],
+                normalized_watts    = normalized_watts[s][k],
+                intensity_factor    = intensity_factor[s][k],
+            )
+            if contribution.p1_duration != 0.0:
+                msg = ""
+                if contribution.intensity_factor >= max_exertion_intensity_factor:
+                    msg += f" IF>{round(100*max_exertion_intensity_factor)}%"
+                if pull_watts[s][k] >= caps[s][k]:
+                    msg += " pull>max W"
+                contribution.effort_constraint_violation_reason = msg
+            contributions[rider] = contribution
+        answer.append(contributions)
+
+    batch.average_speed_of_paceline_kph = calculate_average_speeds_of_paceline_kph(durations, speeds)
+
+    return answer, batch
+
+
+def calculate_average_speeds_of_paceline_kph(rotation_sequences: NDArray[np.float64], speeds_kph: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Average speed of the paceline of each sequence ridden at a constant speed. Distance over time,
+    summed in the same order as calculate_overall_average_speed_of_paceline_kph() so that ties
+    between sequences break the same way.
+
+    Args:
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        speeds_kph (NDArray): (sequences,) speed of each sequence.
+
+    Returns:
+        NDArray: (sequences,) average speed, zero for sequences of no duration.
+    """
+    durations_as_list = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64)).tolist()
+    speeds_as_list = np.broadcast_to(np.asarray(speeds_kph, dtype=np.float64), (len(durations_as_list),)).tolist()
+
+    answer = np.zeros(len(durations_as_list), dtype=np.float64)
+
+    for s, sequence in enumerate(durations_as_list):
+        total_duration_sec = sum(sequence)
+        total_distance_km = sum(safe_divide(speeds_as_list[s] * duration, 3600.0) for duration in sequence)
+        answer[s] = 0.0 if total_duration_sec == 0 else safe_divide(total_distance_km, safe_divide(total_duration_sec, 3600.0))
+
+    return answer
+
+
+def populate_paceline_solutions_table_from_batch_evaluation(table: PacelineSolutionsTable, rider_arrays: PacelineBatchRiderArraysItem,
+    rotation_sequences: NDArray[np.float64], speeds_kph: NDArray[np.float64], found: NDArray[np.bool_], iterations: NDArray[np.int64],
+    bracketing_iterations: NDArray[np.int64], computational_time_per_sequence: float
+) -> None:
+    """
+    Fill every row of a PacelineSolutionsTable from the outcome of bisect_rotation_sequences_in_lockstep(),
+    with one batch evaluation at the final speeds and no RiderContributionItems at all. The values are
+    those generate_paceline_solutions_using_lockstep_batched_bisection_algorithm() in jgh_formulae08
+    puts in its reports: sequences that did not converge get a speed of 0 and a dispersion of 999.
+
+    Args:
+        table (PacelineSolutionsTable): Allocated with one row per sequence. Filled in place.
+        rider_arrays (PacelineBatchRiderArraysItem): Prepared rider arrays.
+        rotation_sequences (NDArray): (sequences x riders) pull periods in seconds.
+        speeds_kph, found, iterations, bracketing_iterations (NDArray): (sequences,) as returned by bisect_rotation_sequences_in_lockstep().
+        computational_time_per_sequence (float): The share of the shared work charged to each sequence.
+    """
+    durations = np.atleast_2d(np.asarray(rotation_sequences, dtype=np.float64))
+    found = np.asarray(found, dtype=bool)
+    rows = table.rows
+
+    batch = evaluate_rotation_sequences_at_speed(rider_arrays, durations, speeds_kph, table.max_exertion_intensity_factor)
+
+    rows["algorithm_ran_to_completion"]                  = found
+    rows["calculated_average_speed_of_paceline_kph"]     = np.where(found, calculate_average_speeds_of_paceline_kph(durations, speeds_kph), 0.0)
+    rows["calculated_dispersion_of_intensity_of_effort"] = np.where(found, calculate_dispersion_of_intensity_of_effort_numpy(batch.intensity_factor, durations), 999.0)
+    rows["pull_speed_kph"]                               = speeds_kph
+    rows["compute_iterations_performed_count"]           = iterations
+    rows["bracketing_iterations_performed_count"]        = bracketing_iterations
+    rows["computational_time"]                           = computational_time_per_sequence
+    rows["p1_duration"]                                  = durations
+    rows["intensity_factor"]                             = batch.intensity_factor
+    rows["normalized_watts"]                             = batch.normalized_watts
+    rows["average_watts"]                                = batch.average_watts
+
+    mark_valid_rows_of_paceline_solutions_table(table)
+
+
+def record_report_in_paceline_solutions_table(table: PacelineSolutionsTable, report: PacelineComputationReportItem) -> None:
+    """
+    Copy a PacelineComputationReportItem into the row of its rotation_sequence_index. The
+    RiderContributionItems are reduced to their columns and the report can then be dropped.
+    Call mark_valid_rows_of_paceline_solutions_table() once the last report is in.
+    """
+    row = table.rows[report.rotation_sequence_index]
+    contributions = list(report.rider_contributions.values())
+
+    row["algorithm_ran_to_completion"]                  = report.algorithm_ran_to_completion
+    row["calculated_average_speed_of_paceline_kph"]     = report.calculated_average_speed_of_paceline_kph
+    row["calculated_dispersion_of_intensity_of_effort"] = report.calculated_dispersion_of_intensity_of_effort
+    # every contribution is worked out at the one speed, other than those of riders with no exertions, which carry none
+    row["pull_speed_kph"]                               = max((contribution.speed_kph for contribution in contributions), default=0.0)
+    row["compute_iterations_performed_count"]           = report.compute_iterations_performed_count
+    row["bracketing_iterations_performed_count"]        = report.bracketing_iterations_performed_count
+    row["exertion_memo_hits_count"]                     = report.exertion_memo_hits_count
+    row["exertion_memo_misses_count"]                   = report.exertion_memo_misses_count
+    row["computational_time"]                           = report.computational_time
+    row["p1_duration"]                                  = [contribution.p1_duration for contribution in contributions]
+    row["intensity_factor"]                             = [contribution.intensity_factor for contribution in contributions]
+    row["normalized_watts"]                             = [contribution.normalized_watts for contribution in contributions]
+    row["average_watts"]                                = [contribution.average_watts for contribution in contributions]
+
+
+def mark_valid_rows_of_paceline_solutions_table(table: PacelineSolutionsTable) -> None:
+    """
+    Set the is_valid column: finite speed and finite dispersion other than the error value (100),
+    as is_valid_solution() in jgh_formulae08.
+    """
+    rows = table.rows
+    dispersion = rows["calculated_dispersion_of_intensity_of_effort"]
+    rows["is_valid"] = np.isfinite(rows["calculated_average_speed_of_paceline_kph"]) & np.isfinite(dispersion) & (dispersion != 100)
+
+
+def main() -> None:
+    import time
+    from jgh_formulae02 import arrange_riders_in_optimal_order, generate_all_paceline_rotation_sequences_in_the_total_solution_space, prune_all_sequences_of_pull_periods_in_the_total_solution_space
+    from jgh_formulae08 import populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints
+
+    dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+    riderIDs = RepositoryOfTeams.get_IDs_of_riders_on_a_team("test_sample")
+    riders: List[ZsunItem] = arrange_riders_in_optimal_order(get_recognised_ZsunItems_only(riderIDs, dict_of_ZsunItems))
+
+    universe = generate_all_paceline_rotation_sequences_in_the_total_solution_space(len(riders), STANDARD_PULL_PERIODS_SEC_AS_LIST)
+    sequences = prune_all_sequences_of_pull_periods_in_the_total_solution_space(universe, riders)
+    speed_kph = 38.0
+
+    start = time.perf_counter()
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    batch = evaluate_rotation_sequences_at_speed(rider_arrays, sequences, speed_kph, 0.95)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    worst_difference = 0.0
+    for idx, sequence in enumerate(sequences.tolist()):
+        _, contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(riders, sequence, [speed_kph] * len(riders), 0.95)
+        for k, contribution in enumerate(contributions.values()):
+            worst_difference = max(worst_difference, abs(contribution.normalized_watts - batch.normalized_watts[idx, k]))
+    serial_time = time.perf_counter() - start
+
+    logger.info(f"{len(sequences)} sequences @ {speed_kph}kph: batch kernel {batch_time:.4f}s, object pipeline {serial_time:.4f}s, worst NP difference {worst_difference:.2e}W")
+
+
+if __name__ == "__main__":
+    from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+    from team_rosters import RepositoryOfTeams
+    from filenames import RIDERS_FILE_NAME
+    from dirpaths import DATA_DIRPATH
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+
+    main()
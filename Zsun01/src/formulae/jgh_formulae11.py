@@ -0,0 +1,291 @@
+from typing import List, Tuple, Optional
+import time
+import numpy as np
+from jgh_formatting import format_number_with_comma_separators
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem, PacelineComputationReportItem, PackageOfPacelineComputationReportItem, PacelineBatchRiderArraysItem
+from jgh_formulae01 import estimate_watts_from_speed
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, look_up_permissible_pull_watts, build_matrix_of_drag_ratios_in_paceline, calculate_binding_speeds_of_rotation_sequences
+from jgh_formulae08 import generate_a_single_paceline_solution, validate_paceline_ingredients
+from constants import (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION, NORMALIZED_WATTS_ROLLING_WINDOW_SEC)
+import logging
+logger = logging.getLogger(__name__)
+
+# Depth-first branch and bound over pull-duration assignments. Pull periods are assigned
+# slot by slot. Each node is tested against an admissible upper bound on the speed of
+# any completion of it, and subtrees that cannot beat the incumbent of any plan category
+# still in play are cut. Leaves are scored with the exact binding speed (see
+# calculate_binding_speeds_of_riders_in_rotation_sequences() in jgh_formulae10), so
+# there is no pruning heuristic and no precision band: the plans found are optimal.
+#
+# The bound for a puller k whose pull period is already assigned is the lesser of
+#   - the speed at which they reach their pull cap, which depends on nothing else, and
+#   - the speed at which their intensity factor must reach the limit. Every rolling
+#     average is at least the least drag ratio of the rider times their watts riding
+#     alone, and windows lying wholly inside an assigned pull are exactly the drag ratio
+#     of that slot times it. The fewer windows there are, the more the assigned pulls
+#     weigh, so normalized watts are bounded below using the longest rotation that the
+#     unassigned slots could make.
+# Nodes are compared against incumbents in watts-riding-alone rather than in kph so
+# that no cubic needs solving at a node. Leaves that survive are scored in batches, it
+# being the NumPy call rather than the sequence that costs. The incumbents therefore lag
+# a little, which only makes the cuts shallower, never wrong.
+
+LEAVES_SCORED_PER_BATCH = 256
+
+
+def search_for_fastest_paceline_solutions_by_branch_and_bound(riders: List[ZsunItem], pull_periods_sec: List[float],
+    max_exertion_intensity_factor: float, highest_speed_kph: float, rider_arrays: Optional[PacelineBatchRiderArraysItem] = None,
+    incumbent_kph: Optional[Tuple[float, float]] = None
+) -> Tuple[List[float], float, List[float], float, int, int]:
+    """
+    Find the fastest rotation sequence overall and the fastest in which everybody pulls.
+
+    The fastest overall must have at least two pullers (unless there is only one rider),
+    mirroring is_race_solution_with_possibility_of_drop_candidate() in jgh_formulae08, which
+    refuses a dispersion of zero unless everyone pulls alike. Sequences binding above
+    highest_speed_kph are the ones the binary search gives up on, and are not eligible.
+
+    Args:
+        riders (List[ZsunItem]): The riders from head to tail of the paceline.
+        pull_periods_sec (List[float]): The permissible pull periods, including zero for sitting out.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+        highest_speed_kph (float): The fastest speed an eligible sequence may bind at.
+        rider_arrays (Optional[PacelineBatchRiderArraysItem]): The riders prepared for the batch
+            kernel, if the caller already has them. Prepared here if None.
+        incumbent_kph (Optional[Tuple[float, float]]): Speeds, fastest and everybody pulls, that a
+            sequence must beat to be returned, for instance the best found for another order of
+            the same riders. Subtrees that cannot beat them are cut from the outset.
+
+    Returns:
+        Tuple containing:
+            - the fastest sequence, or an empty list if there is none (or none beating incumbent_kph).
+            - its binding speed in kph (the speed in incumbent_kph if none beat it).
+            - the fastest sequence in which everybody pulls, or an empty list if there is none (or none beating incumbent_kph).
+            - its binding speed in kph.
+            - the number of nodes visited.
+            - the number of leaves scored.
+    """
+    num_riders = len(riders)
+    periods = sorted(set(float(period) for period in pull_periods_sec))
+    nonzero_periods = [period for period in periods if period != 0]
+    window = NORMALIZED_WATTS_ROLLING_WINDOW_SEC
+    longest_period = max(periods)
+
+    rider_arrays = rider_arrays or prepare_rider_arrays_for_batch_evaluation(riders)
+    weight = rider_arrays.weight_kg.tolist()
+    height = rider_arrays.height_cm.tolist()
+
+    caps = look_up_permissible_pull_watts(rider_arrays, np.tile(np.array(periods)[:, None], (1, num_riders)))
+    cap_watts = [{period: float(caps[p, k]) for p, period in enumerate(periods)} for k in range(num_riders)]
+    best_cap_watts = [max(cap_watts[k][period] for period in nonzero_periods) for k in range(num_riders)]
+
+    drag = build_matrix_of_drag_ratios_in_paceline(num_riders)
+    drag4 = (drag ** 4).tolist()
+    least_drag4 = (drag ** 4).min(axis=1).tolist()
+    intensity_target_watts = [max_exertion_intensity_factor * float(ftp) if ftp > 0 else np.inf for ftp in rider_arrays.one_hour_watts]
+
+    # incumbents: [fastest, everybody pulls]
+    best_sequences: List[List[float]] = [[], []]
+    best_kph = [-np.inf, -np.inf]
+    threshold_watts = [[-np.inf] * num_riders, [-np.inf] * num_riders]
+
+    def set_incumbent(category: int, sequence: List[float], kph: float) -> None:
+        best_sequences[category] = list(sequence)
+        best_kph[category] = kph
+        threshold_watts[category] = [estimate_watts_from_speed(kph, weight[k], height[k]) for k in range(num_riders)]
+
+    def score_leaves(sequences: List[List[float]]) -> None:
+        binding_kph = calculate_binding_speeds_of_rotation_sequences(rider_arrays, np.array(sequences, dtype=np.float64), max_exertion_intensity_factor)
+        for sequence, kph in zip(sequences, binding_kph.tolist()):
+            if not kph <= highest_speed_kph:
+                continue
+            num_pullers = sum(1 for period in sequence if period != 0)
+            if kph > best_kph[0] and (num_pullers >= 2 or num_riders == 1):
+                set_incumbent(0, sequence, kph)
+            if kph > best_kph[1] and num_pullers == num_riders:
+                set_incumbent(1, sequence, kph)
+
+    if incumbent_kph is not None:
+        for category, kph in enumerate(incumbent_kph):
+            if np.isfinite(kph):
+                set_incumbent(category, [], kph)
+
+    # a good incumbent early makes for deep cuts. Everybody pulling alike is a fair start.
+    score_leaves([[period] * num_riders for period in nonzero_periods])
+    leaves_scored = len(nonzero_periods)
+    nodes_visited = 0
+
+    sequence = [0.0] * num_riders
+    pending_leaves: List[List[float]] = []
+    fourth_powers = [0.0] * num_riders  # sum over assigned slots of (windows wholly inside the slot) x drag^4, per rider
+
+    def can_beat(category: int, depth: int, assigned_duration: float, assigned_windows: float) -> bool:
+        threshold = threshold_watts[category]
+        most_windows = assigned_duration + longest_period * (num_riders - depth) - window + 1
+        for k in range(depth):
+            period = sequence[k]
+            if period == 0:
+                continue
+            if cap_watts[k][period] <= threshold[k]:
+                return False
+            if most_windows > 0:
+                least_normalized4 = (fourth_powers[k] + (most_windows - assigned_windows) * least_drag4[k]) / most_windows
+                if intensity_target_watts[k] <= threshold[k] * least_normalized4 ** 0.25:
+                    return False
+        if category == 1:
+            for k in range(depth, num_riders):
+                if best_cap_watts[k] <= threshold[k]:
+                    return False
+        return True
+
+    def descend(depth: int, assigned_duration: float, assigned_windows: float, num_pullers: int) -> None:
+        nonlocal nodes_visited
+        nodes_visited += 1
+
+        everybody_pulls_so_far = num_pullers == depth
+        in_play_fastest = can_beat(0, depth, assigned_duration, assigned_windows)
+        in_play_everybody = everybody_pulls_so_far and can_beat(1, depth, assigned_duration, assigned_windows)
+        if not (in_play_fastest or in_play_everybody):
+            return
+
+        is_last_slot = depth == num_riders - 1
+
+        candidate_periods = periods if in_play_fastest else nonzero_periods
+        for period in candidate_periods:
+            sequence[depth] = period
+            windows_in_slot = max(0.0, period - window + 1)
+            for k in range(num_riders):
+                fourth_powers[k] += windows_in_slot * drag4[k][depth]
+            if not is_last_slot:
+                descend(depth + 1, assigned_duration + period, assigned_windows + windows_in_slot, num_pullers + (period != 0))
+            elif can_beat(0, num_riders, assigned_duration + period, assigned_windows + windows_in_slot) or (
+                everybody_pulls_so_far and period != 0 and can_beat(1, num_riders, assigned_duration + period, assigned_windows + windows_in_slot)):
+                pending_leaves.append(list(sequence))
+            for k in range(num_riders):
+                fourth_powers[k] -= windows_in_slot * drag4[k][depth]
+        sequence[depth] = 0.0
+
+        if len(pending_leaves) >= LEAVES_SCORED_PER_BATCH:
+            flush_pending_leaves()
+
+    def flush_pending_leaves() -> None:
+        nonlocal leaves_scored
+        if pending_leaves:
+            leaves_scored += len(pending_leaves)
+            score_leaves(pending_leaves)
+            pending_leaves.clear()
+
+    descend(0, 0.0, 0.0, 0)
+    flush_pending_leaves()
+
+    return best_sequences[0], float(best_kph[0]), best_sequences[1], float(best_kph[1]), nodes_visited, leaves_scored
+
+
+def generate_fastest_paceline_solutions_by_branch_and_bound(paceline_ingredients: PacelineIngredientsItem
+) -> PackageOfPacelineComputationReportItem:
+    """
+    Alternative to generate_package_of_paceline_solutions() in jgh_formulae08 for large
+    pacelines. Instead of generating k^n rotation sequences and pruning them with empirical
+    rules that may discard the optimum, it searches the whole space by branch and bound
+    (see search_for_fastest_paceline_solutions_by_branch_and_bound()) and returns provably
+    the fastest plan (hang_in_solution) and the fastest plan in which everybody pulls
+    (everybody_pull_hard_solution). The thirty- and sixty-second plans, being a single
+    sequence each, are solved as well. There is no balanced-intensity plan: dispersion has no
+    bound to prune with.
+
+    The winning sequences are solved with the engine nominated in the ingredients, so their
+    reports are exactly what generate_package_of_paceline_solutions() would make of them.
+
+    Args:
+        paceline_ingredients (PacelineIngredientsItem):
+            The riders, permissible pull periods, seed speed and maximum exertion intensity factor.
+
+    Returns:
+        PackageOfPacelineComputationReportItem: total_pull_sequences_examined is the number of
+            leaves of the search tree that were scored, and balanced_intensity_of_effort_solution is None.
+
+    Raises:
+        ValueError: If required input parameters are missing or invalid.
+        RuntimeError: If the search finds no valid fastest or everybody-pulls plan.
+    """
+    validate_paceline_ingredients(paceline_ingredients)
+
+    riders = paceline_ingredients.riders_list
+    num_riders = len(riders)
+    highest_speed_kph = paceline_ingredients.pull_speeds_kph[0] + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+
+    start_time = time.perf_counter()
+
+    fastest_sequence, _, everybody_sequence, _, nodes_visited, leaves_scored = search_for_fastest_paceline_solutions_by_branch_and_bound(
+        riders, list(paceline_ingredients.sequence_of_pull_periods_sec), paceline_ingredients.max_exertion_intensity_factor, highest_speed_kph)
+
+    if not fastest_sequence or not everybody_sequence:
+        raise RuntimeError("Branch and bound found no valid fastest or everybody-pulls solution.")
+
+    def solve(sequence: List[float]) -> PacelineComputationReportItem:
+        return generate_a_single_paceline_solution(PacelineIngredientsItem(
+            riders_list                   = riders,
+            sequence_of_pull_periods_sec  = list(sequence),
+            pull_speeds_kph               = [paceline_ingredients.pull_speeds_kph[0]] * num_riders,
+            max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor,
+            solver_engine                 = paceline_ingredients.solver_engine))
+
+    hang_in_solution = solve(fastest_sequence)
+    everybody_pull_hard_solution = solve(everybody_sequence)
+    thirty_sec_solution = solve([30.0] * num_riders)
+    sixty_sec_solution = solve([60.0] * num_riders)
+
+    solutions = [thirty_sec_solution, sixty_sec_solution, everybody_pull_hard_solution, hang_in_solution]
+
+    time_taken_to_compute = time.perf_counter() - start_time
+
+    logger.debug(f"Branch and bound: visited {format_number_with_comma_separators(nodes_visited)} nodes and scored {format_number_with_comma_separators(leaves_scored)} of {format_number_with_comma_separators(len(set(paceline_ingredients.sequence_of_pull_periods_sec)) ** num_riders)} sequences in {round(time_taken_to_compute, 2)} seconds.")
+
+    return PackageOfPacelineComputationReportItem(
+        total_pull_sequences_examined           = leaves_scored,
+        total_compute_iterations_performed      = sum(solution.compute_iterations_performed_count for solution in solutions),
+        total_bracketing_iterations_performed   = sum(solution.bracketing_iterations_performed_count for solution in solutions),
+        total_exertion_memo_hits                = sum(solution.exertion_memo_hits_count for solution in solutions),
+        total_exertion_memo_misses              = sum(solution.exertion_memo_misses_count for solution in solutions),
+        computational_time                      = time_taken_to_compute,
+        thirty_sec_solution                     = thirty_sec_solution,
+        sixty_sec_solution                      = sixty_sec_solution,
+        balanced_intensity_of_effort_solution   = None,
+        everybody_pull_hard_solution            = everybody_pull_hard_solution,
+        hang_in_solution                        = hang_in_solution,
+        all_solutions                           = solutions,
+    )
+
+
+def main() -> None:
+    from jgh_formulae02 import arrange_riders_in_optimal_order, calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph
+    from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+    dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+    riderIDs = RepositoryOfTeams.get_IDs_of_riders_on_a_team("giants")
+    riders: List[ZsunItem] = arrange_riders_in_optimal_order(get_recognised_ZsunItems_only(riderIDs, dict_of_ZsunItems))
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                   = riders,
+        sequence_of_pull_periods_sec  = STANDARD_PULL_PERIODS_SEC_AS_LIST,
+        pull_speeds_kph               = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders)] * len(riders),
+        max_exertion_intensity_factor = 0.95,
+    )
+
+    report = generate_fastest_paceline_solutions_by_branch_and_bound(paceline_ingredients)
+
+    for tag, solution in [("fastest", report.hang_in_solution), ("everybody pulls", report.everybody_pull_hard_solution)]:
+        if solution:
+            logger.info(f"{len(riders)} riders {tag}: {solution.calculated_average_speed_of_paceline_kph:.3f}kph {[contribution.p1_duration for contribution in solution.rider_contributions.values()]}")
+
+
+if __name__ == "__main__":
+    from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+    from team_rosters import RepositoryOfTeams
+    from filenames import RIDERS_FILE_NAME
+    from dirpaths import DATA_DIRPATH
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+
+    main()
@@ -0,0 +1,262 @@
+from typing import Dict, List, Optional
+import dataclasses
+import time
+import numpy as np
+from numpy.typing import NDArray
+from jgh_formatting import format_number_with_comma_separators
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem, PacelineSolutionsTable, PacelineWhatIfBaselineItem
+from jgh_enums import PacelineProcessingStrategyEnum, PacelineSolverEngineEnum
+from jgh_formulae02 import generate_pruned_paceline_rotation_sequences_in_chunks, calculate_dispersion_of_intensity_of_effort, calculate_dispersion_of_intensity_of_effort_numpy
+from jgh_formulae08 import (generate_package_of_paceline_solutions, generate_table_of_paceline_solutions, assemble_package_of_paceline_solutions,
+    populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints, validate_paceline_ingredients)
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, evaluate_rotation_sequences_at_speed, identify_binding_constraints_of_rotation_sequences, mark_valid_rows_of_paceline_solutions_table
+import logging
+logger = logging.getLogger(__name__)
+
+# What-if planning: solve a team once, then ask what happens if one rider is changed, be it a
+# better FTP or another rider in their place, without solving every sequence again.
+#
+# Every constraint of the solver belongs to one rider and depends on nothing of anyone else:
+# a rider's wattages are their own watts riding alone times the drag ratio of their position.
+# So editing rider k moves only k's binding speeds (see calculate_binding_speeds_of_riders_in_rotation_sequences()
+# in jgh_formulae10). The search for the speed of a sequence asks, at each probe, whether
+# anyone's effort is in violation, which is whether the probe has reached the least of the
+# binding speeds. If k neither was nor becomes the one who binds least, that least speed is
+# unchanged and so is the answer to every probe: the search would retrace its steps to the
+# very same speed in the very same number of iterations. Such sequences keep their speed and
+# statistics, and only k's numbers in them are worked out again, at that speed, in one
+# evaluation. The rest are solved from scratch, so that the answers are those of a full run.
+# The bound-informed engine is the exception: it seeds its search with a bracket made of every
+# puller's caps, so with it only sequences in which the edited rider does not pull are kept.
+
+# a binding speed must clear the old least one by this much, relative, to be sure it is not the first to bind
+BINDING_SPEED_MARGIN = 1e-9
+
+
+def make_paceline_what_if_baseline(paceline_ingredients: PacelineIngredientsItem,
+    processing_strategy: Optional[PacelineProcessingStrategyEnum] = None
+) -> PacelineWhatIfBaselineItem:
+    """
+    Solves the package of the ingredients with generate_package_of_paceline_solutions() in jgh_formulae08,
+    and keeps what resolve_paceline_solutions_after_rider_edit() needs to answer what-ifs about it.
+
+    Args:
+        paceline_ingredients (PacelineIngredientsItem): The riders, pull periods, seed speed and exertion cap.
+        processing_strategy (Optional[PacelineProcessingStrategyEnum]): As for generate_package_of_paceline_solutions().
+            Edits are solved with the same strategy.
+
+    Returns:
+        PacelineWhatIfBaselineItem: The package, with the bindings of every sequence of its solutions table.
+    """
+    package = generate_package_of_paceline_solutions(paceline_ingredients, processing_strategy)
+
+    if processing_strategy is None:
+        processing_strategy = package.dispatch_decision.processing_strategy if package.dispatch_decision else PacelineProcessingStrategyEnum.SERIAL
+
+    assert package.solutions_table is not None
+    rotation_sequences = np.array(package.solutions_table.rows["p1_duration"], dtype=np.float64)
+
+    binding_speeds_kph, binding_rider_index, binding_is_pull_watts = identify_binding_constraints_of_rotation_sequences(
+        prepare_rider_arrays_for_batch_evaluation(paceline_ingredients.riders_list), rotation_sequences, paceline_ingredients.max_exertion_intensity_factor)
+
+    return PacelineWhatIfBaselineItem(
+        paceline_ingredients             = paceline_ingredients,
+        processing_strategy              = processing_strategy,
+        package                          = package,
+        rotation_sequences               = rotation_sequences,
+        binding_speeds_kph               = binding_speeds_kph,
+        binding_rider_index              = binding_rider_index,
+        binding_constraint_is_pull_watts = binding_is_pull_watts,
+        total_pull_sequences_resolved    = len(rotation_sequences),
+    )
+
+
+def find_rows_of_rotation_sequences(known_sequences: NDArray[np.float64], wanted_sequences: NDArray[np.float64]) -> NDArray[np.int64]:
+    """The row of known_sequences holding each of wanted_sequences, or -1 for those it does not hold."""
+    row_of: Dict[bytes, int] = {np.ascontiguousarray(sequence).tobytes(): row for row, sequence in enumerate(known_sequences)}
+    return np.array([row_of.get(np.ascontiguousarray(sequence).tobytes(), -1) for sequence in wanted_sequences], dtype=np.int64)
+
+
+def find_rotation_sequences_unaffected_by_rider_edit(previous_binding_speeds_kph: NDArray[np.float64], binding_speeds_kph: NDArray[np.float64],
+    rider_index: int
+) -> NDArray[np.bool_]:
+    """
+    Which sequences are sure to have the same speed after an edit of one rider: those in which nobody's binding speed
+    has moved, and those in which the least binding speed of everybody else is what the least of all was before and the
+    edited rider's binding speed is clear above it.
+
+    Args:
+        previous_binding_speeds_kph (NDArray): (sequences x riders) binding speeds before the edit.
+        binding_speeds_kph (NDArray): (sequences x riders) binding speeds after the edit, of the same sequences.
+        rider_index (int): The position of the edited rider.
+
+    Returns:
+        NDArray: (sequences,) True where the speed cannot have changed.
+    """
+    previous_least_kph = previous_binding_speeds_kph.min(axis=1)
+    everybody_else = np.arange(binding_speeds_kph.shape[1]) != rider_index
+    least_of_everybody_else_kph = np.where(everybody_else[None, :], binding_speeds_kph, np.inf).min(axis=1)
+
+    nothing_moved = np.all(binding_speeds_kph == previous_binding_speeds_kph, axis=1)
+    edited_rider_is_clear = binding_speeds_kph[:, rider_index] > previous_least_kph * (1.0 + BINDING_SPEED_MARGIN)
+
+    return nothing_moved | ((least_of_everybody_else_kph == previous_least_kph) & edited_rider_is_clear)
+
+
+def refresh_rider_metrics_in_rows_of_paceline_solutions_table(table: PacelineSolutionsTable, row_indices: NDArray[np.int64],
+    paceline_ingredients: PacelineIngredientsItem, processing_strategy: PacelineProcessingStrategyEnum
+) -> None:
+    """
+    Works out the riders' numbers in the given rows again at each row's pull_speed_kph, the way the strategy that
+    filled the table worked them out, leaving the speeds and the statistics of the search as they are. Rows whose
+    search did not converge keep their dispersion of 999.
+    """
+    if row_indices.size == 0:
+        return
+
+    rows = table.rows
+    riders = paceline_ingredients.riders_list
+    converged = rows["algorithm_ran_to_completion"][row_indices]
+    durations = rows["p1_duration"][row_indices]
+
+    if processing_strategy == PacelineProcessingStrategyEnum.LOCKSTEP_BATCHED_BISECTION:
+        batch = evaluate_rotation_sequences_at_speed(prepare_rider_arrays_for_batch_evaluation(riders), durations, rows["pull_speed_kph"][row_indices], table.max_exertion_intensity_factor)
+        rows["intensity_factor"][row_indices] = batch.intensity_factor
+        rows["normalized_watts"][row_indices] = batch.normalized_watts
+        rows["average_watts"][row_indices] = batch.average_watts
+        rows["calculated_dispersion_of_intensity_of_effort"][row_indices] = np.where(converged, calculate_dispersion_of_intensity_of_effort_numpy(batch.intensity_factor, durations), 999.0)
+        return
+
+    for row_index, row_converged in zip(row_indices.tolist(), converged.tolist()):
+        row = rows[row_index]
+        _, dict_of_rider_contributions = populate_rider_contributions_in_a_single_paceline_solution_complying_with_exertion_constraints(
+            riders, row["p1_duration"].tolist(), [float(row["pull_speed_kph"])] * len(riders), table.max_exertion_intensity_factor)
+        contributions = list(dict_of_rider_contributions.values())
+        row["intensity_factor"] = [contribution.intensity_factor for contribution in contributions]
+        row["normalized_watts"] = [contribution.normalized_watts for contribution in contributions]
+        row["average_watts"]    = [contribution.average_watts for contribution in contributions]
+        if row_converged:
+            row["calculated_dispersion_of_intensity_of_effort"] = calculate_dispersion_of_intensity_of_effort(dict_of_rider_contributions)
+
+
+def resolve_paceline_solutions_after_rider_edit(baseline: PacelineWhatIfBaselineItem, rider_index: int, edited_rider: ZsunItem
+) -> PacelineWhatIfBaselineItem:
+    """
+    The package the baseline would have had if the rider at rider_index had been edited_rider, solving again only
+    the sequences whose speed the edit could change. The rider keeps their place in the paceline, and the seed
+    speed and the strategy are the baseline's, so the plans are exactly those of a full run with the edited riders.
+
+    The sequences are pruned afresh for the edited riders, pruning going by strength. Sequences the baseline did
+    not have are solved. So are those in which the edited rider was, or now is, the first whose effort binds.
+    The others keep their speed, with only the riders' numbers worked out again (see the note at the top of this module).
+
+    Args:
+        baseline (PacelineWhatIfBaselineItem): From make_paceline_what_if_baseline(), or from an earlier edit.
+        rider_index (int): The position of the rider to edit, from the head of the paceline.
+        edited_rider (ZsunItem): The rider as edited, or the rider to put in their place.
+
+    Returns:
+        PacelineWhatIfBaselineItem: The new package, with its bindings, to be the baseline of further edits.
+            total_pull_sequences_carried_over and total_pull_sequences_resolved say how the work was saved.
+
+    Raises:
+        ValueError: If rider_index is not the position of a rider.
+        RuntimeError: If no valid solutions are found for any of the categories.
+    """
+    riders = list(baseline.paceline_ingredients.riders_list)
+    if not 0 <= rider_index < len(riders):
+        raise ValueError(f"Rider index {rider_index} is out of range for a paceline of {len(riders)} riders.")
+    riders[rider_index] = edited_rider
+
+    paceline_ingredients = dataclasses.replace(baseline.paceline_ingredients, riders_list=riders)
+    validate_paceline_ingredients(paceline_ingredients)
+
+    assert baseline.package is not None and baseline.package.solutions_table is not None
+    previous_rows = baseline.package.solutions_table.rows
+
+    start_time = time.perf_counter()
+
+    rotation_sequences = generate_pruned_paceline_rotation_sequences_in_chunks(riders, paceline_ingredients.sequence_of_pull_periods_sec)
+
+    binding_speeds_kph, binding_rider_index, binding_is_pull_watts = identify_binding_constraints_of_rotation_sequences(
+        prepare_rider_arrays_for_batch_evaluation(riders), rotation_sequences, paceline_ingredients.max_exertion_intensity_factor)
+
+    previous_row = find_rows_of_rotation_sequences(baseline.rotation_sequences, rotation_sequences)
+    carried_over = previous_row >= 0
+    carried_over[carried_over] = find_rotation_sequences_unaffected_by_rider_edit(baseline.binding_speeds_kph[previous_row[carried_over]],
+        binding_speeds_kph[carried_over], rider_index) & ~np.isnan(previous_rows["calculated_average_speed_of_paceline_kph"][previous_row[carried_over]])
+
+    # the bound-informed engine starts its search from a bracket made of every puller's caps, so it may search differently wherever the edited rider pulls
+    if paceline_ingredients.solver_engine == PacelineSolverEngineEnum.BOUND_INFORMED_BINARY_SEARCH:
+        carried_over &= rotation_sequences[:, rider_index] == 0
+
+    rows_carried_over = np.flatnonzero(carried_over)
+    rows_to_resolve = np.flatnonzero(~carried_over)
+
+    table = PacelineSolutionsTable.allocate(len(rotation_sequences), len(riders), paceline_ingredients.max_exertion_intensity_factor)
+
+    table.rows[rows_carried_over] = previous_rows[previous_row[rows_carried_over]]
+    table.rows["rotation_sequence_index"][rows_carried_over] = rows_carried_over
+    refresh_rider_metrics_in_rows_of_paceline_solutions_table(table, rows_carried_over, paceline_ingredients, baseline.processing_strategy)
+
+    if rows_to_resolve.size > 0:
+        resolved = generate_table_of_paceline_solutions(paceline_ingredients, rotation_sequences[rows_to_resolve].tolist(), baseline.processing_strategy)
+        resolved.rows["rotation_sequence_index"] = rows_to_resolve
+        table.rows[rows_to_resolve] = resolved.rows
+
+    mark_valid_rows_of_paceline_solutions_table(table)
+
+    package = assemble_package_of_paceline_solutions(paceline_ingredients, table, baseline.processing_strategy, 0, start_time)
+
+    logger.debug(f"What-if: carried over {format_number_with_comma_separators(len(rows_carried_over))} and solved {format_number_with_comma_separators(len(rows_to_resolve))} of {format_number_with_comma_separators(len(rotation_sequences))} sequences in {round(package.computational_time, 2)} seconds.")
+
+    return PacelineWhatIfBaselineItem(
+        paceline_ingredients              = paceline_ingredients,
+        processing_strategy               = baseline.processing_strategy,
+        package                           = package,
+        rotation_sequences                = rotation_sequences,
+        binding_speeds_kph                = binding_speeds_kph,
+        binding_rider_index               = binding_rider_index,
+        binding_constraint_is_pull_watts  = binding_is_pull_watts,
+        total_pull_sequences_carried_over = len(rows_carried_over),
+        total_pull_sequences_resolved     = len(rows_to_resolve),
+    )
+
+
+def main() -> None:
+    from jgh_formulae02 import arrange_riders_in_optimal_order, calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph
+    from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+    dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+    riderIDs = RepositoryOfTeams.get_IDs_of_riders_on_a_team("giants")
+    riders: List[ZsunItem] = arrange_riders_in_optimal_order(get_recognised_ZsunItems_only(riderIDs, dict_of_ZsunItems))
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                   = riders,
+        sequence_of_pull_periods_sec  = STANDARD_PULL_PERIODS_SEC_AS_LIST,
+        pull_speeds_kph               = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders)] * len(riders),
+        max_exertion_intensity_factor = 0.95,
+    )
+
+    baseline = make_paceline_what_if_baseline(paceline_ingredients)
+
+    # what if each rider in turn were five percent stronger?
+    for rider_index, rider in enumerate(riders):
+        stronger = dataclasses.replace(rider,
+            zsun_one_hour_curve_coefficient = rider.zsun_one_hour_curve_coefficient * 1.05,
+            zsun_TTT_pull_curve_coefficient = rider.zsun_TTT_pull_curve_coefficient * 1.05)
+        what_if = resolve_paceline_solutions_after_rider_edit(baseline, rider_index, stronger)
+        assert what_if.package is not None and what_if.package.hang_in_solution is not None
+        logger.info(f"{rider.name} +5%: fastest {what_if.package.hang_in_solution.calculated_average_speed_of_paceline_kph:.3f}kph, {what_if.total_pull_sequences_resolved} of {len(what_if.rotation_sequences)} sequences solved again in {round(what_if.package.computational_time, 2)} seconds.")
+
+
+if __name__ == "__main__":
+    from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+    from team_rosters import RepositoryOfTeams
+    from filenames import RIDERS_FILE_NAME
+    from dirpaths import DATA_DIRPATH
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+
+    main()
@@ -0,0 +1,185 @@
+from typing import List, Optional, Tuple
+import itertools
+import math
+import time
+import numpy as np
+from jgh_formatting import format_number_with_comma_separators
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem, PacelineComputationReportItem, PacelineRotationOrderSearchItem
+from jgh_formulae08 import generate_a_single_paceline_solution, validate_paceline_ingredients
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, reorder_rider_arrays_for_batch_evaluation
+from jgh_formulae11 import search_for_fastest_paceline_solutions_by_branch_and_bound
+from constants import SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION
+import logging
+logger = logging.getLogger(__name__)
+
+# Joint search over the order of the riders and their pull periods. arrange_riders_in_optimal_order()
+# in jgh_formulae02 fixes the order with a rule of thumb, and every solver then searches the pull
+# periods of that order only. Here each order is searched by branch and bound (see jgh_formulae11),
+# the best speeds found so far in any order being handed to the next as incumbents, so that an
+# order that cannot beat them is cut near the root of its tree. The riders' power profiles and
+# pull caps are prepared once and lined up afresh for each order.
+#
+# A paceline is a circle: rotating the order, together with the pull periods, gives the same
+# circulation started from another rider. So only orders starting with the first rider handed in
+# are searched, (n-1)! of them rather than n!. The model reads a rotation as a timeline starting
+# with the first pull, so normalized watts see the seam between one rotation and the next in a
+# different place if another rider starts, and speeds bound by intensity can differ by a few
+# hundredths of a kph. Keeping the first rider fixed keeps the convention the rest of Brute rides
+# by, in which the heuristic order itself is one of those searched.
+
+
+def generate_rotation_orders_with_first_rider_fixed(num_riders: int, max_orders: Optional[int] = None) -> List[Tuple[int, ...]]:
+    """
+    The distinct orders of num_riders riders around a paceline, as indices into the order handed in,
+    rider 0 always first. The order handed in comes first, and the rest follow in lexicographic order.
+
+    Args:
+        num_riders (int): The number of riders.
+        max_orders (Optional[int]): At most this many orders are returned. All (n-1)! if None.
+
+    Returns:
+        List[Tuple[int, ...]]: The orders.
+    """
+    if num_riders <= 0:
+        return []
+    orders = ((0,) + tail for tail in itertools.permutations(range(1, num_riders)))
+    return list(itertools.islice(orders, max_orders))
+
+
+def search_for_fastest_rotation_order_and_pull_periods(paceline_ingredients: PacelineIngredientsItem,
+    max_rotation_orders: Optional[int] = None
+) -> PacelineRotationOrderSearchItem:
+    """
+    Finds the fastest plan, and the fastest plan in which everybody pulls, over every order of the riders
+    with the first rider fixed (see generate_rotation_orders_with_first_rider_fixed()) and every sequence
+    of pull periods, and says whether the order handed in was already the best.
+
+    Each order is searched with search_for_fastest_paceline_solutions_by_branch_and_bound() in jgh_formulae11,
+    so the plans are optimal, not merely good, among the orders explored. An order must beat the best found
+    before it strictly, so where orders tie the one handed in wins. The winning sequences are solved with the
+    engine nominated in the ingredients, so their reports are exactly what generate_package_of_paceline_solutions()
+    would make of them in that order.
+
+    Args:
+        paceline_ingredients (PacelineIngredientsItem):
+            The riders in the heuristic order, usually that of arrange_riders_in_optimal_order(),
+            the permissible pull periods, the seed speed and the maximum exertion intensity factor.
+        max_rotation_orders (Optional[int]): Explore at most this many orders, the heuristic order first.
+            All (n-1)! if None. The search is exact only if every order is explored.
+
+    Returns:
+        PacelineRotationOrderSearchItem: The orders and plans that won, with the speeds of the heuristic order to compare.
+
+    Raises:
+        ValueError: If required input parameters are missing or invalid.
+        RuntimeError: If no order has a valid fastest or everybody-pulls plan.
+    """
+    validate_paceline_ingredients(paceline_ingredients)
+
+    riders = paceline_ingredients.riders_list
+    num_riders = len(riders)
+    pull_periods_sec = list(paceline_ingredients.sequence_of_pull_periods_sec)
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+    highest_speed_kph = paceline_ingredients.pull_speeds_kph[0] + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+
+    start_time = time.perf_counter()
+
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(riders)
+    orders = generate_rotation_orders_with_first_rider_fixed(num_riders, max_rotation_orders)
+
+    # [fastest, everybody pulls]
+    best_orders: List[Tuple[int, ...]] = [(), ()]
+    best_sequences: List[List[float]] = [[], []]
+    best_kph = [-np.inf, -np.inf]
+    heuristic_kph = [-np.inf, -np.inf]
+    total_nodes_visited = 0
+    total_leaves_scored = 0
+
+    for order_index, order in enumerate(orders):
+        fastest, fastest_kph, everybody, everybody_kph, nodes_visited, leaves_scored = search_for_fastest_paceline_solutions_by_branch_and_bound(
+            [riders[i] for i in order], pull_periods_sec, max_exertion_intensity_factor, highest_speed_kph,
+            rider_arrays=reorder_rider_arrays_for_batch_evaluation(rider_arrays, list(order)),
+            incumbent_kph=(best_kph[0], best_kph[1]))
+        total_nodes_visited += nodes_visited
+        total_leaves_scored += leaves_scored
+
+        for category, (sequence, kph) in enumerate([(fastest, fastest_kph), (everybody, everybody_kph)]):
+            if sequence and kph > best_kph[category]:
+                best_orders[category] = order
+                best_sequences[category] = sequence
+                best_kph[category] = kph
+            if order_index == 0 and sequence:
+                heuristic_kph[category] = kph
+
+    if not best_sequences[0] or not best_sequences[1]:
+        raise RuntimeError("Search over rotation orders found no valid fastest or everybody-pulls solution.")
+
+    def solve(order: Tuple[int, ...], sequence: List[float]) -> Tuple[List[ZsunItem], PacelineComputationReportItem]:
+        riders_in_order = [riders[i] for i in order]
+        return riders_in_order, generate_a_single_paceline_solution(PacelineIngredientsItem(
+            riders_list                   = riders_in_order,
+            sequence_of_pull_periods_sec  = list(sequence),
+            pull_speeds_kph               = [paceline_ingredients.pull_speeds_kph[0]] * num_riders,
+            max_exertion_intensity_factor = max_exertion_intensity_factor,
+            solver_engine                 = paceline_ingredients.solver_engine))
+
+    fastest_riders_list, fastest_solution = solve(best_orders[0], best_sequences[0])
+    everybody_pulls_riders_list, everybody_pulls_solution = solve(best_orders[1], best_sequences[1])
+
+    heuristic_order = orders[0]
+    time_taken_to_compute = time.perf_counter() - start_time
+
+    logger.debug(f"Rotation orders: searched {format_number_with_comma_separators(len(orders))} of {format_number_with_comma_separators(math.factorial(num_riders - 1))} orders, visiting {format_number_with_comma_separators(total_nodes_visited)} nodes and scoring {format_number_with_comma_separators(total_leaves_scored)} sequences in {round(time_taken_to_compute, 2)} seconds.")
+
+    return PacelineRotationOrderSearchItem(
+        heuristic_riders_list           = list(riders),
+        fastest_riders_list             = fastest_riders_list,
+        fastest_solution                = fastest_solution,
+        everybody_pulls_riders_list     = everybody_pulls_riders_list,
+        everybody_pulls_solution        = everybody_pulls_solution,
+        heuristic_fastest_kph           = float(heuristic_kph[0]),
+        heuristic_everybody_pulls_kph   = float(heuristic_kph[1]),
+        fastest_kph                     = float(best_kph[0]),
+        everybody_pulls_kph             = float(best_kph[1]),
+        heuristic_order_is_optimal      = best_orders[0] == heuristic_order and best_orders[1] == heuristic_order,
+        total_rotation_orders           = math.factorial(num_riders - 1),
+        rotation_orders_explored        = len(orders),
+        total_nodes_visited             = total_nodes_visited,
+        total_leaves_scored             = total_leaves_scored,
+        computational_time              = time_taken_to_compute,
+    )
+
+
+def main() -> None:
+    from jgh_formulae02 import arrange_riders_in_optimal_order, calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph
+    from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+    dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+    riderIDs = RepositoryOfTeams.get_IDs_of_riders_on_a_team("giants")
+    riders: List[ZsunItem] = arrange_riders_in_optimal_order(get_recognised_ZsunItems_only(riderIDs, dict_of_ZsunItems))
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                   = riders,
+        sequence_of_pull_periods_sec  = STANDARD_PULL_PERIODS_SEC_AS_LIST,
+        pull_speeds_kph               = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders)] * len(riders),
+        max_exertion_intensity_factor = 0.95,
+    )
+
+    search = search_for_fastest_rotation_order_and_pull_periods(paceline_ingredients)
+
+    logger.info(f"Heuristic order {[rider.name for rider in search.heuristic_riders_list]}: fastest {search.heuristic_fastest_kph:.3f}kph, everybody pulls {search.heuristic_everybody_pulls_kph:.3f}kph.")
+    logger.info(f"Best order for the fastest plan {[rider.name for rider in search.fastest_riders_list]}: {search.fastest_kph:.3f}kph.")
+    logger.info(f"Best order for everybody pulling {[rider.name for rider in search.everybody_pulls_riders_list]}: {search.everybody_pulls_kph:.3f}kph.")
+    logger.info(f"The heuristic order {'was' if search.heuristic_order_is_optimal else 'was not'} optimal, over {search.rotation_orders_explored} of {search.total_rotation_orders} orders searched in {round(search.computational_time, 2)} seconds.")
+
+
+if __name__ == "__main__":
+    from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+    from team_rosters import RepositoryOfTeams
+    from filenames import RIDERS_FILE_NAME
+    from dirpaths import DATA_DIRPATH
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+
+    main()
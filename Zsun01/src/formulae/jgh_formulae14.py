@@ -0,0 +1,249 @@
+from typing import Dict, List, Optional, Tuple
+import itertools
+import math
+import time
+import numpy as np
+from numpy.typing import NDArray
+from jgh_formatting import format_number_with_comma_separators
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem, PacelineBatchRiderArraysItem, PacelineComputationReportItem, PacelineSquadItem, PacelineSquadSelectionItem
+from jgh_formulae01 import estimate_speed_from_wattage_numpy
+from jgh_formulae02 import arrange_riders_in_optimal_order, select_n_strongest_riders, calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph
+from jgh_formulae08 import generate_a_single_paceline_solution, validate_paceline_ingredients
+from jgh_formulae10 import prepare_rider_arrays_for_batch_evaluation, reorder_rider_arrays_for_batch_evaluation, look_up_permissible_pull_watts, build_matrix_of_drag_ratios_in_paceline
+from jgh_formulae11 import search_for_fastest_paceline_solutions_by_branch_and_bound
+from constants import SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH, CHUNK_OF_KPH_PER_ITERATION
+import logging
+logger = logging.getLogger(__name__)
+
+# Squad selection: the best k riders of the n available for race day. select_n_strongest_riders()
+# in jgh_formulae02 takes the k strongest by w/kg, which need not be the fastest squad. Trying every
+# squad means solving n-choose-k pacelines, so squads are first ranked by cheap bounds and solved
+# best bound first, stopping when no squad left could make the list.
+#
+# Squads are ranked by their fastest plan in which everybody pulls, and where that ties by their
+# fastest plan. A rider who sits out never binds, so the fastest plan of a squad hardly depends on
+# anyone but its two or three strongest: every squad that has them goes as fast as every other.
+# Only with everybody pulling does the squad as a whole count.
+#
+# The bounds come from one number per rider, worked out once for the whole pool: the fastest any
+# sequence could go with that rider pulling. It is the lesser of
+#   - the speed at which they reach the highest of their pull caps, and
+#   - the speed at which their intensity factor must reach the limit. Every rolling average of
+#     their effort is at least the least drag ratio in a paceline of k times their watts riding
+#     alone, so their normalized watts are too.
+# A sequence binds at the least of its pullers' binding speeds, so a squad cannot go faster with
+# everybody pulling than the lowest number among its riders, nor faster at all than the second
+# highest (the fastest plan has at least two pullers). The riders' power profiles and pull caps are
+# prepared once for the pool, and the squads solved by branch and bound (see jgh_formulae11) are
+# lined up from them.
+
+DEFAULT_NUMBER_OF_SQUADS_SELECTED = 3
+
+
+def calculate_upper_bound_speeds_of_riders_in_any_squad(rider_arrays: PacelineBatchRiderArraysItem, pull_periods_sec: List[float],
+    max_exertion_intensity_factor: float, squad_size: int
+) -> NDArray[np.float64]:
+    """
+    For every rider of the pool, a speed in kph that no sequence in which they pull can exceed,
+    in any squad of squad_size riders in any order.
+
+    Args:
+        rider_arrays (PacelineBatchRiderArraysItem): The pool of riders, prepared for the batch kernel.
+        pull_periods_sec (List[float]): The permissible pull periods, including zero for sitting out.
+        max_exertion_intensity_factor (float): Maximum allowed exertion intensity factor for any rider.
+        squad_size (int): The number of riders in a squad.
+
+    Returns:
+        NDArray: (riders,) upper bounds in kph. Minus infinity for everyone if no pull period is permissible.
+    """
+    num_riders = len(rider_arrays.weight_kg)
+    nonzero_periods = np.array(sorted({float(period) for period in pull_periods_sec if period != 0}), dtype=np.float64)
+    if len(nonzero_periods) == 0:
+        return np.full(num_riders, -np.inf)
+
+    caps = look_up_permissible_pull_watts(rider_arrays, np.tile(nonzero_periods[:, None], (1, num_riders)))
+    pull_bound_kph = estimate_speed_from_wattage_numpy(caps.max(axis=0), rider_arrays.weight_kg, rider_arrays.height_cm)
+
+    # a rider without one-hour watts has an intensity factor of zero, which never binds
+    has_one_hour_watts = rider_arrays.one_hour_watts > 0
+    least_drag_ratio = float(build_matrix_of_drag_ratios_in_paceline(squad_size).min())
+    intensity_target_watts = np.where(has_one_hour_watts, max_exertion_intensity_factor * rider_arrays.one_hour_watts / least_drag_ratio, caps.max(axis=0))
+    intensity_bound_kph = np.where(has_one_hour_watts, estimate_speed_from_wattage_numpy(intensity_target_watts, rider_arrays.weight_kg, rider_arrays.height_cm), np.inf)
+
+    return np.minimum(pull_bound_kph, intensity_bound_kph)
+
+
+def calculate_upper_bound_speeds_of_squad(upper_bound_kph_of_riders: NDArray[np.float64], squad: Tuple[int, ...]) -> Tuple[float, float]:
+    """
+    Upper bounds on the fastest plan of a squad in which everybody pulls and on its fastest plan,
+    from the bounds of its riders (see calculate_upper_bound_speeds_of_riders_in_any_squad()).
+
+    Args:
+        upper_bound_kph_of_riders (NDArray): (riders,) upper bounds of every rider of the pool.
+        squad (Tuple[int, ...]): The indices of the riders of the squad in the pool.
+
+    Returns:
+        Tuple[float, float]: The bound on the fastest plan in which everybody pulls, and on the fastest plan.
+    """
+    bounds = sorted((float(upper_bound_kph_of_riders[i]) for i in squad), reverse=True)
+    return bounds[-1], (bounds[1] if len(bounds) >= 2 else bounds[0])
+
+
+def select_best_squads_from_pool_of_riders(paceline_ingredients: PacelineIngredientsItem, squad_size: int,
+    num_squads: int = DEFAULT_NUMBER_OF_SQUADS_SELECTED
+) -> PacelineSquadSelectionItem:
+    """
+    Finds the num_squads best squads of squad_size riders from the pool of riders in the ingredients,
+    best first by the speed of their fastest plan in which everybody pulls and then by that of their
+    fastest plan, each squad riding in the order of arrange_riders_in_optimal_order(), as
+    generate_fastest_paceline_plan_for_n_strongest() in jgh_formulae09 rides the strongest.
+
+    Squads are solved by search_for_fastest_paceline_solutions_by_branch_and_bound() in jgh_formulae11,
+    best bound first (see calculate_upper_bound_speeds_of_squad()), until no squad left could beat the
+    last on the list. So the list is exact, not merely good. Where squads tie, the one with the better
+    bound, and then the one earlier in the pool, comes first. The winning sequences of the squads on the
+    list are solved with the engine nominated in the ingredients, so their reports are exactly what
+    generate_package_of_paceline_solutions() would make of them.
+
+    Args:
+        paceline_ingredients (PacelineIngredientsItem): The pool of riders available, the permissible pull
+            periods and the maximum exertion intensity factor. The seed speed of each squad is worked out afresh.
+        squad_size (int): The number of riders in a squad.
+        num_squads (int): The number of squads to return, fewer if there are not that many.
+
+    Returns:
+        PacelineSquadSelectionItem: The best squads, and the squad of the strongest riders to compare.
+
+    Raises:
+        ValueError: If required input parameters are missing or invalid, or the squad is bigger than the pool.
+    """
+    validate_paceline_ingredients(paceline_ingredients)
+
+    pool = paceline_ingredients.riders_list
+    if not 1 <= squad_size <= len(pool):
+        raise ValueError(f"A squad of {squad_size} cannot be picked from a pool of {len(pool)} riders.")
+    if num_squads < 1:
+        raise ValueError("At least one squad must be selected.")
+
+    pull_periods_sec = list(paceline_ingredients.sequence_of_pull_periods_sec)
+    max_exertion_intensity_factor = paceline_ingredients.max_exertion_intensity_factor
+
+    start_time = time.perf_counter()
+
+    # once for the whole pool
+    rider_arrays = prepare_rider_arrays_for_batch_evaluation(pool)
+    upper_bound_kph_of_riders = calculate_upper_bound_speeds_of_riders_in_any_squad(rider_arrays, pull_periods_sec, max_exertion_intensity_factor, squad_size)
+    index_in_pool = {id(rider): i for i, rider in enumerate(pool)}
+
+    candidates = [(calculate_upper_bound_speeds_of_squad(upper_bound_kph_of_riders, squad), squad) for squad in itertools.combinations(range(len(pool)), squad_size)]
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    # per squad solved: (everybody pulls, fastest) speeds and bounds, riders in order, and the winning sequences
+    solved: Dict[Tuple[int, ...], Tuple[Tuple[float, float], Tuple[float, float], List[ZsunItem], List[float], List[float]]] = {}
+    total_nodes_visited = 0
+    total_leaves_scored = 0
+
+    def solve_squad(squad: Tuple[int, ...], bounds: Tuple[float, float]) -> Tuple[float, float]:
+        nonlocal total_nodes_visited, total_leaves_scored
+        riders_in_order = arrange_riders_in_optimal_order([pool[i] for i in squad])
+        order = [index_in_pool[id(rider)] for rider in riders_in_order]
+        highest_speed_kph = calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders_in_order) + CHUNK_OF_KPH_PER_ITERATION * (SUFFICIENT_ITERATIONS_TO_GUARANTEE_FINDING_A_SAFE_UPPER_BOUND_KPH - 1)
+        fastest, fastest_kph, everybody, everybody_kph, nodes_visited, leaves_scored = search_for_fastest_paceline_solutions_by_branch_and_bound(
+            riders_in_order, pull_periods_sec, max_exertion_intensity_factor, highest_speed_kph,
+            rider_arrays=reorder_rider_arrays_for_batch_evaluation(rider_arrays, order))
+        total_nodes_visited += nodes_visited
+        total_leaves_scored += leaves_scored
+        solved[squad] = ((everybody_kph, fastest_kph), bounds, riders_in_order, fastest, everybody)
+        return everybody_kph, fastest_kph
+
+    def cannot_beat(bounds: Tuple[float, float], speeds: Tuple[float, float]) -> bool:
+        return bounds[0] < speeds[0] or (bounds[0] <= speeds[0] and bounds[1] <= speeds[1])
+
+    best: List[Tuple[Tuple[float, float], Tuple[int, ...]]] = []
+    for bounds, squad in candidates:
+        if len(best) == num_squads and cannot_beat(bounds, best[-1][0]):
+            break # the candidates that follow have bounds no better
+        best.append((solve_squad(squad, bounds), squad))
+        best.sort(key=lambda entry: entry[0], reverse=True) # stable, so a squad that ties goes after those solved before it
+        del best[num_squads:]
+
+    strongest_squad = tuple(sorted(index_in_pool[id(rider)] for rider in select_n_strongest_riders(list(pool), squad_size)))
+    if strongest_squad not in solved:
+        solve_squad(strongest_squad, calculate_upper_bound_speeds_of_squad(upper_bound_kph_of_riders, strongest_squad))
+
+    def solve(riders_in_order: List[ZsunItem], sequence: List[float]) -> Optional[PacelineComputationReportItem]:
+        if not sequence:
+            return None
+        return generate_a_single_paceline_solution(PacelineIngredientsItem(
+            riders_list                   = riders_in_order,
+            sequence_of_pull_periods_sec  = list(sequence),
+            pull_speeds_kph               = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders_in_order)] * len(riders_in_order),
+            max_exertion_intensity_factor = max_exertion_intensity_factor,
+            solver_engine                 = paceline_ingredients.solver_engine))
+
+    def make_squad_item(squad: Tuple[int, ...]) -> PacelineSquadItem:
+        speeds, bounds, riders_in_order, fastest, everybody = solved[squad]
+        return PacelineSquadItem(
+            riders_list                     = riders_in_order,
+            fastest_kph                     = float(speeds[1]),
+            everybody_pulls_kph             = float(speeds[0]),
+            fastest_kph_upper_bound         = bounds[1],
+            everybody_pulls_kph_upper_bound = bounds[0],
+            fastest_solution                = solve(riders_in_order, fastest),
+            everybody_pulls_solution        = solve(riders_in_order, everybody),
+        )
+
+    squad_items: Dict[Tuple[int, ...], PacelineSquadItem] = {}
+    for squad in [squad for _, squad in best] + [strongest_squad]:
+        if squad not in squad_items:
+            squad_items[squad] = make_squad_item(squad)
+
+    time_taken_to_compute = time.perf_counter() - start_time
+
+    logger.debug(f"Squad selection: solved {format_number_with_comma_separators(len(solved))} of {format_number_with_comma_separators(len(candidates))} squads of {squad_size} from {len(pool)} riders, visiting {format_number_with_comma_separators(total_nodes_visited)} nodes and scoring {format_number_with_comma_separators(total_leaves_scored)} sequences in {round(time_taken_to_compute, 2)} seconds.")
+
+    return PacelineSquadSelectionItem(
+        squads                  = [squad_items[squad] for _, squad in best],
+        strongest_squad         = squad_items[strongest_squad],
+        strongest_squad_is_best = solved[strongest_squad][0] >= best[0][0],
+        total_squads            = math.comb(len(pool), squad_size),
+        squads_solved           = len(solved),
+        total_nodes_visited     = total_nodes_visited,
+        total_leaves_scored     = total_leaves_scored,
+        computational_time      = time_taken_to_compute,
+    )
+
+
+def main() -> None:
+    from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+
+    dict_of_ZsunItems = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+    riderIDs = RepositoryOfTeams.get_IDs_of_riders_on_a_team("giants") + RepositoryOfTeams.get_IDs_of_riders_on_a_team("sirius")
+    pool: List[ZsunItem] = get_recognised_ZsunItems_only(riderIDs, dict_of_ZsunItems)
+
+    paceline_ingredients = PacelineIngredientsItem(
+        riders_list                   = pool,
+        sequence_of_pull_periods_sec  = STANDARD_PULL_PERIODS_SEC_AS_LIST,
+        pull_speeds_kph               = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(pool)] * len(pool),
+        max_exertion_intensity_factor = 0.95,
+    )
+
+    selection = select_best_squads_from_pool_of_riders(paceline_ingredients, 6)
+
+    for rank, squad in enumerate(selection.squads, start=1):
+        logger.info(f"Squad {rank}: fastest {squad.fastest_kph:.3f}kph, everybody pulls {squad.everybody_pulls_kph:.3f}kph {[rider.name for rider in squad.riders_list]}")
+    if selection.strongest_squad:
+        logger.info(f"The {len(selection.strongest_squad.riders_list)} strongest: fastest {selection.strongest_squad.fastest_kph:.3f}kph, everybody pulls {selection.strongest_squad.everybody_pulls_kph:.3f}kph {[rider.name for rider in selection.strongest_squad.riders_list]}")
+    logger.info(f"The strongest riders {'were' if selection.strongest_squad_is_best else 'were not'} the best squad. Solved {selection.squads_solved} of {selection.total_squads} squads in {round(selection.computational_time, 2)} seconds.")
+
+
+if __name__ == "__main__":
+    from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+    from team_rosters import RepositoryOfTeams
+    from filenames import RIDERS_FILE_NAME
+    from dirpaths import DATA_DIRPATH
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+
+    main()
@@ -0,0 +1,164 @@
+import os
+import json
+import stat
+import pickle
+import hashlib
+from typing import Any, List, Optional, Tuple
+
+CACHE_ENTRY_SUFFIX = ".pickle"
+
+
+def make_stable_digest(value: Any) -> str:
+    """
+    SHA-256 of the canonical JSON of value: keys sorted, no whitespace, floats in their
+    shortest round-trip form. Equal values give equal digests in any process, on any
+    run. The value must be made of dicts, lists, strings, numbers, bools and None;
+    anything else raises TypeError rather than being digested by its repr.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), allow_nan=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_user_cache_dirpath(dir_name: str) -> str:
+    """
+    dir_name in the current user's own cache directory: LOCALAPPDATA on Windows,
+    elsewhere XDG_CACHE_HOME, or ~/.cache if that is not set. Unlike the temporary
+    directory, no other user can write there.
+    """
+    base_dirpath = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    if not base_dirpath:
+        base_dirpath = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dirpath, dir_name)
+
+
+class ContentAddressedDiskCache:
+    """
+    Pickled values in a directory, one file per digest, bounded by a ceiling on the
+    total size of the files. Reading an entry marks it recently used; storing one
+    evicts the least recently used until the directory is under the ceiling again.
+    Entries are written whole and renamed into place, so a reader in another
+    process never sees one half written. A corrupt entry is deleted and treated as
+    a miss. Unpickling runs whatever the file says, so the directory is created
+    with mode 0o700 and the cache refuses to use it, every get a miss and every
+    put failing, unless it is a real directory owned by the current user and
+    writable by no one else.
+    """
+
+    def __init__(self, dir_path: str, ceiling_bytes: int):
+        self.dir_path = dir_path
+        self.ceiling_bytes = max(0, int(ceiling_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_of(self, digest: str) -> str:
+        return os.path.join(self.dir_path, digest + CACHE_ENTRY_SUFFIX)
+
+    def is_private_directory(self) -> bool:
+        """Creates the directory if need be. True if it is safe to read and write entries in it."""
+        try:
+            os.makedirs(self.dir_path, mode=0o700, exist_ok=True)
+            status = os.lstat(self.dir_path)
+        except OSError:
+            return False
+        if not stat.S_ISDIR(status.st_mode):
+            return False # a symbolic link or a file put there in its place
+        if hasattr(os, "getuid"): # no owners or mode bits to check on Windows, where LOCALAPPDATA is private to the user anyway
+            if status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                return False
+        return True
+
+    def get(self, digest: str) -> Optional[Any]:
+        if not self.is_private_directory():
+            self.misses += 1
+            return None
+        file_path = self.path_of(digest)
+        try:
+            with open(file_path, "rb") as cache_file:
+                value = pickle.load(cache_file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+            self._remove(file_path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(file_path) # the modification time is the time of last use
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, digest: str, value: Any) -> bool:
+        """Stores value under digest. False if it could not be stored, or is bigger than the ceiling on its own."""
+        if self.ceiling_bytes == 0 or not self.is_private_directory():
+            return False
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.ceiling_bytes:
+            return False
+        file_path = self.path_of(digest)
+        temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_file_path, "wb") as cache_file:
+                cache_file.write(payload)
+            os.replace(temporary_file_path, file_path)
+        except OSError:
+            self._remove(temporary_file_path)
+            return False
+        self.evict(keep=digest)
+        return True
+
+    def list_entries(self) -> List[Tuple[float, int, str]]:
+        """(time of last use, size in bytes, path) of every entry, least recently used first."""
+        entries: List[Tuple[float, int, str]] = []
+        try:
+            file_names = os.listdir(self.dir_path)
+        except FileNotFoundError:
+            return entries
+        for file_name in file_names:
+            if not file_name.endswith(CACHE_ENTRY_SUFFIX):
+                continue
+            file_path = os.path.join(self.dir_path, file_name)
+            try:
+                status = os.stat(file_path)
+            except OSError:
+                continue # evicted by another process meanwhile
+            entries.append((status.st_mtime, status.st_size, file_path))
+        entries.sort()
+        return entries
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self.list_entries())
+
+    def __len__(self) -> int:
+        return len(self.list_entries())
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Deletes the least recently used entries, other than the one under keep, until the total is under the ceiling."""
+        entries = self.list_entries()
+        total = sum(size for _, size, _ in entries)
+        kept_path = None if keep is None else self.path_of(keep)
+        for _, size, file_path in entries:
+            if total <= self.ceiling_bytes:
+                break
+            if file_path == kept_path:
+                continue
+            self._remove(file_path)
+            total -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        for _, _, file_path in self.list_entries():
+            self._remove(file_path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
@@ -0,0 +1,72 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+def estimate_size_of_memo_entry_bytes(key: Hashable, value: Any) -> int:
+    """
+    Rough footprint of a memo entry: the key and value containers and, one level
+    down, whatever they contain. Good enough to keep a memo under a ceiling, not
+    an exact accounting.
+    """
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    for container in (key, value):
+        if isinstance(container, tuple):
+            size += sum(sys.getsizeof(item) for item in container)
+    return size
+
+
+class BoundedLruMemo:
+    """
+    A least-recently-used memo bounded by an approximate memory ceiling, with
+    hit and miss counters. One instance lives in each process that imports the
+    module that owns it, so the ceiling applies to each worker of a process pool
+    separately. A ceiling of zero disables the memo: nothing is stored and
+    every lookup is a miss.
+    """
+
+    def __init__(self, ceiling_bytes: int):
+        self.ceiling_bytes = max(0, int(ceiling_bytes))
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.ceiling_bytes == 0:
+            return
+        if key in self._entries:
+            self.size_bytes -= self._entries.pop(key)[1]
+        size = estimate_size_of_memo_entry_bytes(key, value)
+        if size > self.ceiling_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.size_bytes += size
+        while self.size_bytes > self.ceiling_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+
+    def get_counters(self) -> Tuple[int, int]:
+        """The hits and misses so far, for taking differences around a unit of work."""
+        return self.hits, self.misses
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,89 @@
+import os
+import multiprocessing
+from multiprocessing import resource_tracker
+import concurrent.futures
+from typing import Any, Callable, Optional, Tuple
+
+# set in each worker of a PersistentProcessPool as it starts
+barrier_of_this_worker: Optional[Any] = None
+
+
+def initialise_worker_of_persistent_process_pool(barrier: Any, initializer: Optional[Callable[..., None]], initargs: Tuple[Any, ...]) -> None:
+    global barrier_of_this_worker
+    barrier_of_this_worker = barrier
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def run_once_in_this_worker(fn: Callable[..., None], args: Tuple[Any, ...], timeout: float) -> None:
+    # holding every worker at the barrier until all have arrived is what stops one worker taking two of the calls
+    fn(*args)
+    assert barrier_of_this_worker is not None
+    barrier_of_this_worker.wait(timeout)
+
+
+class PersistentProcessPool:
+    """
+    A ProcessPoolExecutor that is started on first use and then kept until it is shut
+    down explicitly, so that its workers, and everything they import and cache, serve
+    every batch of work in the process rather than one. The initializer runs once in
+    each worker, with the initargs of the call that started the pool. A pool that has
+    been shut down, or broken by the death of a worker, is started afresh on next use.
+    Workers are started by start_method, as named to multiprocessing.get_context(), the
+    default of the platform if None. A change takes effect when the pool next starts.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, initializer: Optional[Callable[..., None]] = None, start_method: Optional[str] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.initializer = initializer
+        self.start_method = start_method
+        self.starts = 0
+        self.initargs: Tuple[Any, ...] = () # of the call that started the running workers
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None and not getattr(self._executor, "_broken", False)
+
+    def get_executor(self, initargs: Tuple[Any, ...] = ()) -> concurrent.futures.ProcessPoolExecutor:
+        if not self.is_running:
+            self.shutdown()
+            # a forked worker shares the resource tracker of the parent only if it is running already. Otherwise the
+            # worker starts one of its own, which reaps any shared memory the worker attached to when the worker exits
+            resource_tracker.ensure_running()
+            context = multiprocessing.get_context(self.start_method)
+            barrier = context.Barrier(self.max_workers)
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                initializer=initialise_worker_of_persistent_process_pool, initargs=(barrier, self.initializer, initargs))
+            self.initargs = tuple(initargs)
+            self.starts += 1
+        assert self._executor is not None
+        return self._executor
+
+    def broadcast(self, fn: Callable[..., None], args: Tuple[Any, ...] = (), initargs: Tuple[Any, ...] = (), timeout: float = 60.0) -> None:
+        """
+        Run fn(*args) exactly once in every worker, starting the pool if need be, and return
+        when all have done so. The arguments are pickled once per worker. Used to hand the
+        workers data that every task of a batch shares, so the tasks need not carry it.
+        If a worker fails or the workers do not all turn up in time, the pool is shut down
+        and the error raised.
+        """
+        executor = self.get_executor(initargs)
+        futures = [executor.submit(run_once_in_this_worker, fn, args, timeout) for _ in range(self.max_workers)]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "PersistentProcessPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
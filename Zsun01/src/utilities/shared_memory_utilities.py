@@ -0,0 +1,30 @@
+from multiprocessing import shared_memory
+from typing import Any, Tuple
+import numpy as np
+from numpy.typing import NDArray
+
+
+def create_shared_array(shape: Tuple[int, ...], dtype: Any) -> Tuple[shared_memory.SharedMemory, NDArray[Any]]:
+    """
+    A new block of shared memory and an array over it. The creator must close and unlink
+    the block when done, after dropping every array over it.
+    """
+    dtype = np.dtype(dtype)
+    size = max(1, int(np.prod(shape)) * dtype.itemsize) # a block cannot be empty
+    block = shared_memory.SharedMemory(create=True, size=size)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def attach_shared_array(name: str, shape: Tuple[int, ...], dtype: Any) -> Tuple[shared_memory.SharedMemory, NDArray[Any]]:
+    """
+    An array over an existing block of shared memory, found by name. Attaching processes
+    close the block when done, after dropping every array over it, but never unlink it.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def release_shared_memory(block: shared_memory.SharedMemory, unlink: bool = False) -> None:
+    block.close()
+    if unlink:
+        block.unlink()
@@ -0,0 +1,32 @@
+import logging
+import threading
+from typing import Any, Dict, List
+
+
+class TelemetryCollector(logging.Handler):
+    """
+    A logging handler that keeps, in order of arrival, the telemetry carried by the records it
+    handles: the dict in the record attribute named by attribute, as put there by the extra
+    argument of the logging call. Other records are ignored. Records from worker processes
+    arrive on the thread of a QueueListener, so the telemetry of a batch of tasks may still be
+    arriving when the batch is done. wait_for() waits until enough of it has.
+    """
+
+    def __init__(self, attribute: str = "task_telemetry"):
+        super().__init__(logging.DEBUG)
+        self.attribute = attribute
+        self.telemetry: List[Dict[str, Any]] = []
+        self._arrived = threading.Condition()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        telemetry = getattr(record, self.attribute, None)
+        if telemetry is None:
+            return
+        with self._arrived:
+            self.telemetry.append(telemetry)
+            self._arrived.notify_all()
+
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """Waits until the telemetry of count records has arrived, or timeout seconds have passed. Returns whether it has."""
+        with self._arrived:
+            return self._arrived.wait_for(lambda: len(self.telemetry) >= count, timeout)
@@ -7,7 +7,8 @@ The script performs the following steps:
 - Logs the speed bounds for exertion-constrained paceline solutions.
 - Constructs the input parameters for paceline planning, including rider list, pull speeds, pull periods, and exertion limits.
 - Computes a set of paceline plans for the full team using an advanced solution generation algorithm.
-- Computes additional plans for smaller team sizes (last five and last four riders) to analyze diminishing team scenarios.
+- Computes additional plans for smaller team sizes (last five and last four riders) to analyze diminishing team scenarios, reusing the same warm pool of worker processes.
+- Serves any of these plans from the on-disk cache of solved plans when the riders and settings are unchanged since an earlier run.
 - Prepares a display object summarizing all computed paceline solutions, including captions and metadata.
 - Saves individual and summary paceline plans as HTML reports for further review and sharing.
 
@@ -21,7 +22,7 @@ from computation_classes import PacelineIngredientsItem
 from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
 from jgh_formulae02 import calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph, arrange_riders_in_optimal_order
 from jgh_formulae07 import save_summary_of_all_paceline_plans_as_html
-from jgh_formulae08 import generate_package_of_paceline_solutions,log_speed_bounds_of_exertion_constrained_paceline_solutions
+from jgh_formulae08 import generate_package_of_paceline_solutions,log_speed_bounds_of_exertion_constrained_paceline_solutions, shutdown_paceline_solver_worker_pool, paceline_solution_cache
 from jgh_formulae09 import generate_fastest_paceline_plan_for_n_strongest, save_multiple_individual_paceline_plans_as_html
 from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
 from html_css import FOOTNOTES
@@ -48,12 +49,12 @@ def main() -> None:
         sequence_of_pull_periods_sec = STANDARD_PULL_PERIODS_SEC_AS_LIST,
         max_exertion_intensity_factor= RepositoryOfTeams.get_exertion_intensity_factor_for_team(team_nickname),
     )
-    report: Any = generate_package_of_paceline_solutions(ingredients)
+    report: Any = generate_package_of_paceline_solutions(ingredients, solution_cache=paceline_solution_cache)
     report_displayobject: PackageOfPacelineComputationReportDisplayObject = PackageOfPacelineComputationReportDisplayObject.from_PackageOfPacelineComputationReportItem(report)
 
     # COMPUTE 6th and 7th PLANS - DIMINISHING TEAM
-    report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FIVE] = generate_fastest_paceline_plan_for_n_strongest(ingredients, 5)
-    report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FOUR] = generate_fastest_paceline_plan_for_n_strongest(ingredients, 4)
+    report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FIVE] = generate_fastest_paceline_plan_for_n_strongest(ingredients, 5, paceline_solution_cache)
+    report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FOUR] = generate_fastest_paceline_plan_for_n_strongest(ingredients, 4, paceline_solution_cache)
 
     report_displayobject.caption = get_caption_for_summary_of_all_paceline_plans(team_nickname)
 
@@ -67,4 +68,8 @@ if __name__ == "__main__":
 
     SAVE_OUTPUT_DIRPATH = "C:/Users/johng/holding_pen/StuffForZsun/Betel_new/"
 
-    main()
\ No newline at end of file
+    # the three planning calls in main() share one pool of workers
+    try:
+        main()
+    finally:
+        shutdown_paceline_solver_worker_pool()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+This tool generates and exports the paceline plans of several cycling teams in a single run, for instance the whole club's weekly plans.
+
+The script performs the following steps:
+- Configures logging for the application.
+- Loads the rider data of the whole club once, and picks out the riders of each team named on the command line (a default list of teams if none), arranged in an optimal order for paceline efficiency.
+- Constructs the input parameters for paceline planning of each team, and of its five and four strongest riders to analyze diminishing team scenarios.
+- Computes the plans of every one of these pacelines together, their rotation sequences scheduled as one stream of work into one shared pool of worker processes, the paceline with the most sequences first, so that no worker waits for the last of one team before starting on the next.
+- Serves any of these plans from the on-disk cache of solved plans when the riders and settings are unchanged since an earlier run.
+- Prepares a display object summarizing the computed paceline solutions of each team, including captions and metadata.
+- Saves the individual and summary paceline plans of each team as HTML reports, exactly as tool15_brute does for one team.
+
+This tool demonstrates batch scheduling of many team time trial (TTT) optimisations onto one pool of workers, and automated report generation for a whole club using Python.
+"""
+
+from typing import Dict, List
+from computation_classes_display_objects import PacelinePlanTypeEnum, PackageOfPacelineComputationReportDisplayObject
+from zsun_rider_item import ZsunItem
+from computation_classes import PacelineIngredientsItem
+from handy_utilities import read_json_dict_of_ZsunDTO, get_recognised_ZsunItems_only
+from jgh_formulae02 import calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph, arrange_riders_in_optimal_order
+from jgh_formulae07 import save_summary_of_all_paceline_plans_as_html
+from jgh_formulae08 import generate_packages_of_paceline_solutions_in_one_pool, shutdown_paceline_solver_worker_pool, paceline_solution_cache
+from jgh_formulae09 import make_paceline_ingredients_for_n_strongest, get_fastest_paceline_plan_of_package, save_multiple_individual_paceline_plans_as_html
+from constants import STANDARD_PULL_PERIODS_SEC_AS_LIST
+from html_css import FOOTNOTES
+from paceline_plan_display_ingredients import  get_caption_for_summary_of_all_paceline_plans
+from filenames import RIDERS_FILE_NAME, get_save_filename_for_summary_of_all_paceline_plans
+from dirpaths import DATA_DIRPATH
+from team_rosters import RepositoryOfTeams
+import logging
+logger = logging.getLogger(__name__)
+
+def main(team_nicknames: List[str]) -> None:
+    # GET THE SOURCE DATA READY - THE WHOLE CLUB, ONCE
+    dict_of_ZsunItems: Dict[str, ZsunItem] = read_json_dict_of_ZsunDTO(RIDERS_FILE_NAME, DATA_DIRPATH)
+
+    # EVERY PACELINE TO BE PLANNED - FULL TEAM, LAST FIVE AND LAST FOUR OF EACH TEAM
+    list_of_ingredients: List[PacelineIngredientsItem] = []
+    for team_nickname in team_nicknames:
+        riders: List[ZsunItem] = get_recognised_ZsunItems_only(RepositoryOfTeams.get_IDs_of_riders_on_a_team(team_nickname), dict_of_ZsunItems)
+        riders = arrange_riders_in_optimal_order(riders)
+        ingredients: PacelineIngredientsItem = PacelineIngredientsItem(
+            riders_list                  = riders,
+            pull_speeds_kph              = [calculate_safe_lower_bound_speed_to_kick_off_binary_search_algorithm_kph(riders)] * len(riders),
+            sequence_of_pull_periods_sec = STANDARD_PULL_PERIODS_SEC_AS_LIST,
+            max_exertion_intensity_factor= RepositoryOfTeams.get_exertion_intensity_factor_for_team(team_nickname),
+        )
+        list_of_ingredients += [ingredients, make_paceline_ingredients_for_n_strongest(ingredients, 5), make_paceline_ingredients_for_n_strongest(ingredients, 4)]
+
+    # COMPUTE THEM ALL IN ONE POOL
+    reports = generate_packages_of_paceline_solutions_in_one_pool(list_of_ingredients, paceline_solution_cache)
+
+    # SAVE THE PLANS OF EACH TEAM
+    for team_index, team_nickname in enumerate(team_nicknames):
+        report, report_last_five, report_last_four = reports[3 * team_index : 3 * team_index + 3]
+
+        report_displayobject: PackageOfPacelineComputationReportDisplayObject = PackageOfPacelineComputationReportDisplayObject.from_PackageOfPacelineComputationReportItem(report)
+        report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FIVE] = get_fastest_paceline_plan_of_package(report_last_five)
+        report_displayobject.solutions[PacelinePlanTypeEnum.LAST_FOUR] = get_fastest_paceline_plan_of_package(report_last_four)
+
+        report_displayobject.caption = get_caption_for_summary_of_all_paceline_plans(team_nickname)
+
+        save_multiple_individual_paceline_plans_as_html(report_displayobject, team_nickname, SAVE_OUTPUT_DIRPATH)
+        save_summary_of_all_paceline_plans_as_html(report_displayobject, get_save_filename_for_summary_of_all_paceline_plans(team_nickname), SAVE_OUTPUT_DIRPATH, FOOTNOTES)
+
+if __name__ == "__main__":
+    import sys
+    from jgh_logging import jgh_configure_logging
+    jgh_configure_logging("appsettings.json")
+    logging.getLogger("numba").setLevel(logging.ERROR)
+
+    SAVE_OUTPUT_DIRPATH = "C:/Users/johng/holding_pen/StuffForZsun/Club_weekly/"
+
+    # the nicknames of the teams on the command line, if any. See inside team_rosters.py for other teams
+    team_nicknames = sys.argv[1:] or ["betel", "sirius", "bojo", "dome", "giants", "fire", "kissed"]
+
+    # every team shares the one pool of workers
+    try:
+        main(team_nicknames)
+    finally:
+        shutdown_paceline_solver_worker_pool()